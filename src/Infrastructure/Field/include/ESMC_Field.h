@@ -705,6 +705,62 @@ int ESMC_FieldPrint(
 //EOPI
 //-----------------------------------------------------------------------------
 
+//-----------------------------------------------------------------------------
+//BOPI
+// !IROUTINE: ESMC_FieldReadMulti - Read several variables and time slices
+//                                  into a list of Fields
+//
+// !INTERFACE:
+  int ESMC_FieldReadMulti(ESMC_Field *fields, // inout
+      int count,                              // in
+      const char *file,                       // in
+      const char **variableNames,             // in
+      int *timeslices,                        // in
+      ESMC_IOFmt_Flag iofmt                   // in
+);
+
+// !RETURN VALUE:
+//  Return code; equals ESMF_SUCCESS if there are no errors.
+//
+// !DESCRIPTION:
+//
+//  Read a list of variables and time slices from a single file into a list
+//  of {\tt ESMF\_Field} objects. The file is opened and closed once for the
+//  whole list, instead of once per Field as with {\tt ESMC\_FieldRead()}.
+//  For this API to be functional, the environment variable {\tt ESMF\_PIO}
+//  should be set to either "internal" or "external" when the ESMF library
+//  is built. Please see the section on Data I/O,~\ref{io:dataio}.
+//
+//  Limitations:
+//  \begin{itemize}
+//    \item Not supported in {\tt ESMF\_COMM=mpiuni} mode.
+//  \end{itemize}
+//
+//  The arguments are:
+//  \begin{description}
+//  \item [fields]
+//    The {\tt count} {\tt ESMF\_Field} objects in which the read data are
+//    returned.
+//  \item [count]
+//    The number of Fields to read.
+//  \item[file]
+//    The name of the file from which the Field data are read.
+//  \item[variableNames]
+//    The {\tt count} variable names in the file, one for each Field.
+//  \item[{[timeslices]}]
+//    The {\tt count} time slices to read, one for each Field, starting from
+//    the 1st slice. A value below 1 reads a variable without time
+//    dimension. If set to NULL, no time slice is read.
+//  \item[{[iofmt]}]
+//    \begin{sloppypar}
+//    The I/O format.  Please see Section~\ref{opt:iofmtflag} for the list
+//    of options.  If set to NULL, defaults to {\tt ESMF\_IOFMT\_NETCDF}.
+//    \end{sloppypar}
+//  \end{description}
+//
+//EOPI
+//-----------------------------------------------------------------------------
+
 //-----------------------------------------------------------------------------
 //BOP
 // !IROUTINE: ESMC_FieldRegridGetArea - Get the area of the cells used for 
@@ -1176,6 +1232,62 @@ int ESMC_FieldSMMStore(
 //EOP
 //-----------------------------------------------------------------------------
 
+//-----------------------------------------------------------------------------
+//BOP
+// !IROUTINE: ESMC_FieldSMMStoreFactors - Precompute a Field sparse matrix multiplication from local factors
+//
+// !INTERFACE:
+int ESMC_FieldSMMStoreFactors(
+    ESMC_Field srcField,                           // in
+    ESMC_Field dstField,                           // in
+    double *factorList,                            // in
+    int *factorIndexList,                          // in
+    int numFactors,                                // in
+    ESMC_RouteHandle *routehandle,                 // out
+    enum ESMC_Logical *ignoreUnmatchedIndices,     // in
+    int *srcTermProcessing,                        // in
+    int *pipeLineDepth);                           // in
+
+// !RETURN VALUE:
+//   Return code; equals ESMF_SUCCESS if there are no errors.
+//
+// !DESCRIPTION:
+//
+//   Creates a sparse matrix operation (stored in routehandle) from the
+//   factors held in memory on each PET. Each PET may provide an arbitrary
+//   subset of the factors, including none, and the factors are distributed
+//   to the PETs which own the corresponding elements during the store.
+//   This allows a large weight matrix to be read in parts by the PETs rather
+//   than in full by any single PET. The routehandle can then be used in the
+//   call ESMC\_FieldRegrid() to interpolate between the Fields.
+//
+//  The arguments are:
+//  \begin{description}
+//  \item[srcField]
+//    ESMC\_Field with source data.
+//  \item[dstField]
+//    ESMC\_Field with destination data.
+//  \item[factorList]
+//    The local weights, of size {\tt numFactors}.
+//  \item[factorIndexList]
+//    The local pairs of source and destination sequence indices, of size
+//    {\tt 2*numFactors}. The source index of factor {\tt i} is stored in
+//    element {\tt 2*i} and the destination index in element {\tt 2*i+1}.
+//  \item[numFactors]
+//    The number of factors on the local PET, which may be zero.
+//  \item[routehandle]
+//    The handle that implements the regrid, to be used in {\tt ESMC\_FieldRegrid()}.
+//  \item [{[ignoreUnmatchedIndices]}]
+//    See {\tt ESMC\_FieldSMMStore()}.
+//  \item [{[srcTermProcessing]}]
+//    See {\tt ESMC\_FieldSMMStore()}.
+//  \item [{[pipelineDepth]}]
+//    See {\tt ESMC\_FieldSMMStore()}.
+//  \end{description}
+//
+//EOP
+//-----------------------------------------------------------------------------
+
 //-----------------------------------------------------------------------------
 //BOPI
 // !IROUTINE: ESMC_FieldWrite - Write Field
@@ -1238,7 +1350,7 @@ int ESMC_FieldSMMStore(
 //   less than the maximum time already in the file, the write will fail.
 //   \item[{\tt overwrite = .true.}:]\ Any positive timeslice value is valid.
 //   \end{description}
-//   By default, i.e. by omitting the {\tt timeslice} argument, no
+//   By default, i.e. by passing a {\tt timeslice} value less than 1, no
 //   provisions for time slicing are made in the output file,
 //   however, if the file already contains a time axis for the variable,
 //   a timeslice one greater than the maximum will be written.
@@ -272,6 +272,13 @@ template <class TYPE>
                               ESMC_TypeKind_Flag *coordTypeKind, 
                               ESMC_IndexFlag *indexflag,
                               int *rc);
+  static Grid* createrectilinear(ESMC_InterArrayInt *maxIndex,
+                                 ESMC_InterArrayInt *polekindflag,
+                                 int *periodicDim, int *poleDim,
+                                 ESMC_CoordSys_Flag *coordSys,
+                                 ESMC_TypeKind_Flag *coordTypeKind,
+                                 ESMC_IndexFlag *indexflag,
+                                 int *rc);
   static Grid* createcubedsphere(int *tilesize,
                                  ESMC_InterArrayInt *regDecompPTile,
                                  ESMC_InterArrayInt *decompFlagPTile,
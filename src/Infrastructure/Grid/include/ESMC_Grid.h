@@ -145,6 +145,64 @@ ESMC_Grid ESMC_GridCreate1PeriDim(
 //EOP
 //-----------------------------------------------------------------------------
 
+//------------------------------------------------------------------------------
+//TODO: InterArray should be passed by value when ticket 3613642 is resolved
+//BOP
+// !IROUTINE: ESMC_GridCreateRectilinear - Create a Grid with 1D coordinates
+//
+// !INTERFACE:
+ESMC_Grid ESMC_GridCreateRectilinear(
+  ESMC_InterArrayInt *maxIndex,           // in
+  ESMC_InterArrayInt *polekindflag,       // in
+  int *periodicDim,                       // in
+  int *poleDim,                           // in
+  enum ESMC_CoordSys_Flag *coordSys,      // in
+  enum ESMC_TypeKind_Flag *coordTypeKind, // in
+  enum ESMC_IndexFlag *indexflag,         // in
+  int *rc                                 // out
+);
+// !RETURN VALUE:
+//  type(ESMC_Grid)
+//
+// !DESCRIPTION:
+//
+//  This call creates a rectilinear ESMC\_Grid, whose coordinate arrays are
+//  1D: coordinate dimension i only depends on index dimension i. The
+//  coordinates of a Grid with an extent of n1 x n2 are then held in arrays of
+//  n1 and n2 elements instead of two arrays of n1 x n2 elements.
+//
+//  The arguments are:
+//  \begin{description}
+//  \item[maxIndex]
+//      The upper extent of the grid array.
+//  \item[polekindflag]
+//      Two item array which specifies the type of connection which occurs at the
+//      pole. polekindflag(1) the connection that occurs at the minimum end of the
+//      index dimension. polekindflag(2) the connection that occurs at the maximum
+//      end of the index dimension. If not specified, the default is
+//      ESMF\_POLETYPE\_MONOPOLE for both. Only used if periodicDim is specified.
+//  \item[periodicDim]
+//      The periodic dimension.  If not specified, the Grid has no periodic
+//      dimension.
+//  \item[poleDim]
+//      The dimension at which the poles are located at the ends.  If not
+//      specified, defaults to 2. Only used if periodicDim is specified.
+//  \item[coordSys]
+//      The coordinated system of the grid coordinate data. If not specified then
+//      defaults to ESMF\_COORDSYS\_SPH\_DEG.
+//  \item[coordTypeKind]
+//      The type/kind of the grid coordinate data.  If not specified then the
+//      type/kind will be 8 byte reals.
+//  \item[indexflag]
+//      Indicates the indexing scheme to be used in the new Grid. If not present,
+//      defaults to ESMC\_INDEX\_DELOCAL.
+//  \item[rc]
+//      Return code; equals {\tt ESMF\_SUCCESS} if there are no errors.
+//  \end{description}
+//
+//EOP
+//-----------------------------------------------------------------------------
+
 //------------------------------------------------------------------------------
 //TODO: InterArray should be passed by value when ticket 3613642 is resolved
 //BOP
@@ -498,6 +556,35 @@ int ESMC_GridGetCoordBounds(
 //EOP
 //-----------------------------------------------------------------------------
 
+//------------------------------------------------------------------------------
+//BOP
+// !IROUTINE: ESMC_GridGetLocalDECount - Get the number of local DEs of a Grid
+//
+// !INTERFACE:
+int ESMC_GridGetLocalDECount(
+  ESMC_Grid grid,                         // in
+  int *localDECount                       // out
+);
+
+// !RETURN VALUE:
+//  Return code; equals ESMF_SUCCESS if there are no errors.
+//
+// !DESCRIPTION:
+//  Get the number of decompositional elements of the Grid which are
+//  located on the current PET. This may be zero, or larger than one if
+//  more DEs than PETs were requested, e.g. for the tiles of a cubed sphere.
+//
+//  The arguments are:
+//  \begin{description}
+//  \item[grid]
+//    Grid object from which to obtain the number of local DEs.
+//  \item[localDECount]
+//    Upon return this holds the number of local DEs.
+//  \end{description}
+//
+//EOP
+//-----------------------------------------------------------------------------
+
 //------------------------------------------------------------------------------
 //BOPI
 // !IROUTINE: ESMC_GridWrite - Write a Grid to a VTK file
@@ -48,6 +48,7 @@ int main(void){
   int p;
   bool pass;
   int elbnd[dimcount],eubnd[dimcount];
+  int localDECount;
 
 
   //----------------------------------------------------------------------------
@@ -245,6 +246,26 @@ int main(void){
   if (rc == ESMF_SUCCESS) {
     rc = ESMC_GridDestroy(&grid_1p_pdim2);
   }
+  //----------------------------------------------------------------------------
+
+  //----------------------------------------------------------------------------
+  //  GridCreateRectilinear (periodicDim = 1, no poleDim specified)
+  //----------------------------------------------------------------------------
+
+  //----------------------------------------------------------------------------
+  //NEX_UTest
+  // Create a Grid with 1D coordinates
+  strcpy(name, "GridCreateRectilinear");
+  strcpy(failMsg, "Did not return ESMF_SUCCESS");
+  ESMC_Grid grid_rect;
+  periodicDim = 1;
+  grid_rect = ESMC_GridCreateRectilinear(&i_maxIndex, NULL, &periodicDim, NULL,
+                                         &coordsys, &typekind, NULL, &rc);
+  ESMC_Test((rc==ESMF_SUCCESS), name, failMsg, &result, __FILE__, __LINE__, 0);
+  //----------------------------------------------------------------------------
+  if (rc == ESMF_SUCCESS) {
+    rc = ESMC_GridDestroy(&grid_rect);
+  }
   free(maxIndex);
   //----------------------------------------------------------------------------
 
@@ -719,6 +740,17 @@ int main(void){
   ESMC_Test((rc==ESMF_SUCCESS), name, failMsg, &result, __FILE__, __LINE__, 0);
   //----------------------------------------------------------------------------
 
+  //----------------------------------------------------------------------------
+  //EX_UTest
+  // the default decomposition has a single DE on each PET
+  strcpy(name, "GridGetLocalDECount");
+  strcpy(failMsg, "Did not return ESMF_SUCCESS or incorrect local DE count");
+  localDECount = 0;
+  rc = ESMC_GridGetLocalDECount(grid_np, &localDECount);
+  ESMC_Test((rc==ESMF_SUCCESS && localDECount==1), name, failMsg, &result,
+            __FILE__, __LINE__, 0);
+  //----------------------------------------------------------------------------
+
   //----------------------------------------------------------------------------
   //  GridAddItem to grid_np
   //----------------------------------------------------------------------------
@@ -0,0 +1,126 @@
+// $Id$
+//
+// Earth System Modeling Framework
+// Copyright (c) 2002-2023, University Corporation for Atmospheric Research, 
+// Massachusetts Institute of Technology, Geophysical Fluid Dynamics 
+// Laboratory, University of Michigan, National Centers for Environmental 
+// Prediction, Los Alamos National Laboratory, Argonne National Laboratory, 
+// NASA Goddard Space Flight Center.
+// Licensed under the University of Illinois-NCSA License.
+//-----------------------------------------------------------------------------
+
+//-----------------------------------------------------------------------------
+// This file is part of the pure C public ESMC API
+//-----------------------------------------------------------------------------
+
+//-------------------------------------------------------------------------
+// (all lines below between the !BOP and !EOP markers will be included in
+//  the automated document processing.)
+//-------------------------------------------------------------------------
+// these lines prevent this file from being read more than once if it
+// ends up being included multiple times
+
+#ifndef ESMC_TRACE_H
+#define ESMC_TRACE_H
+
+//-----------------------------------------------------------------------------
+// ESMC_Trace - Public C interface to the ESMF Trace
+//
+// The code in this file declares the public C methods for user-defined trace
+// regions.  The companion file {\tt ESMC\_Trace.C} contains the definitions
+// (full code bodies) for these methods.
+//-----------------------------------------------------------------------------
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+//-----------------------------------------------------------------------------
+//BOP
+// !IROUTINE: ESMC_TraceIsEnabled - Check whether tracing or profiling is on
+//
+// !INTERFACE:
+int ESMC_TraceIsEnabled(
+  int *isEnabled              // out
+);
+// !RETURN VALUE:
+//  Return code; equals ESMF_SUCCESS if there are no errors.
+//
+// !DESCRIPTION:
+//
+//  Check whether the trace was opened on the local PET, i.e. whether tracing
+//  or profiling was enabled through the {\tt ESMF\_RUNTIME\_TRACE} or
+//  {\tt ESMF\_RUNTIME\_PROFILE} environment variables at initialization.
+//  Trace region events are ignored otherwise.
+//
+//  The arguments are:
+//  \begin{description}
+//  \item[isEnabled]
+//    Set to 1 if the trace is open on the local PET, or 0 otherwise.
+//  \end{description}
+//
+//EOP
+//-----------------------------------------------------------------------------
+
+//-----------------------------------------------------------------------------
+//BOP
+// !IROUTINE: ESMC_TraceRegionEnter - Trace user-defined region entry event
+//
+// !INTERFACE:
+int ESMC_TraceRegionEnter(
+  const char *name            // in
+);
+// !RETURN VALUE:
+//  Return code; equals ESMF_SUCCESS if there are no errors.
+//
+// !DESCRIPTION:
+//
+//  Record an event in the trace for this PET indicating entry
+//  into a user-defined region with the given name.  This call
+//  must be paired with a call to {\tt ESMC\_TraceRegionExit()}
+//  with a matching {\tt name} parameter.  User-defined regions
+//  may be nested.  If tracing or profiling is disabled on the
+//  calling PET, this call does nothing.
+//
+//  The arguments are:
+//  \begin{description}
+//  \item[name]
+//    A user-defined name for the region of code being entered.
+//  \end{description}
+//
+//EOP
+//-----------------------------------------------------------------------------
+
+//-----------------------------------------------------------------------------
+//BOP
+// !IROUTINE: ESMC_TraceRegionExit - Trace user-defined region exit event
+//
+// !INTERFACE:
+int ESMC_TraceRegionExit(
+  const char *name            // in
+);
+// !RETURN VALUE:
+//  Return code; equals ESMF_SUCCESS if there are no errors.
+//
+// !DESCRIPTION:
+//
+//  Record an event in the trace for this PET indicating exit
+//  from a user-defined region with the given name.  This call
+//  must appear after a call to {\tt ESMC\_TraceRegionEnter()}
+//  with a matching {\tt name} parameter.  If tracing or profiling
+//  is disabled on the calling PET, this call does nothing.
+//
+//  The arguments are:
+//  \begin{description}
+//  \item[name]
+//    A user-defined name for the region of code being exited.
+//  \end{description}
+//
+//EOP
+//-----------------------------------------------------------------------------
+
+#ifdef __cplusplus
+} // extern "C"
+#endif
+
+#endif  // ESMC_TRACE_H
@@ -50,6 +50,187 @@ typedef struct{
 
 // Class API
 
+//-----------------------------------------------------------------------------
+//BOP
+// !IROUTINE: ESMC_VMAllGather - Gather data from all PETs onto all PETs
+//
+// !INTERFACE:
+int ESMC_VMAllGather(ESMC_VM vm,
+                     void *sendData,
+                     void *recvData,
+                     int count,
+                     enum ESMC_TypeKind_Flag *typekind);
+// !RETURN VALUE:
+//  Return code; equals ESMF_SUCCESS if there are no errors.
+//
+// !DESCRIPTION:
+//  Collective {\tt ESMC\_VM} communication call that gathers contiguous data
+//  arrays of the same size from all PETs of the {\tt ESMC\_VM} object into
+//  a contiguous data array on every PET, in the order of the PETs.
+//
+//  This method is overloaded for:
+//  {\tt ESMC\_TYPEKIND\_I4}, {\tt ESMC\_TYPEKIND\_I8},
+//  {\tt ESMC\_TYPEKIND\_R4}, {\tt ESMC\_TYPEKIND\_R8}.
+//
+//  The arguments are:
+//  \begin{description}
+//  \item[vm]
+//    {\tt ESMC\_VM} object.
+//  \item[sendData]
+//    Contiguous data array holding the data to be sent.
+//  \item[recvData]
+//    Contiguous data array of {\tt count} elements per PET for the data to
+//    be received.
+//  \item[count]
+//    Number of elements in sendData. Must be the same on all PETs.
+//  \item[typekind]
+//    The typekind of the data. See section \ref{const:ctypekind} for a list
+//    of valid typekind options.
+//  \end{description}
+//
+//EOP
+//-----------------------------------------------------------------------------
+
+//-----------------------------------------------------------------------------
+//BOP
+// !IROUTINE: ESMC_VMAllGatherV - Gather data of varying size onto all PETs
+//
+// !INTERFACE:
+int ESMC_VMAllGatherV(ESMC_VM vm,
+                      void *sendData,
+                      int sendCount,
+                      void *recvData,
+                      int *recvCounts,
+                      int *recvOffsets,
+                      enum ESMC_TypeKind_Flag *typekind);
+// !RETURN VALUE:
+//  Return code; equals ESMF_SUCCESS if there are no errors.
+//
+// !DESCRIPTION:
+//  Collective {\tt ESMC\_VM} communication call that gathers contiguous data
+//  arrays of varying size from all PETs of the {\tt ESMC\_VM} object into a
+//  contiguous data array on every PET.
+//
+//  This method is overloaded for:
+//  {\tt ESMC\_TYPEKIND\_I4}, {\tt ESMC\_TYPEKIND\_I8},
+//  {\tt ESMC\_TYPEKIND\_R4}, {\tt ESMC\_TYPEKIND\_R8}.
+//
+//  The arguments are:
+//  \begin{description}
+//  \item[vm]
+//    {\tt ESMC\_VM} object.
+//  \item[sendData]
+//    Contiguous data array holding the data to be sent.
+//  \item[sendCount]
+//    Number of elements in sendData.
+//  \item[recvData]
+//    Contiguous data array for the data to be received.
+//  \item[recvCounts]
+//    Number of elements received from each PET.
+//  \item[recvOffsets]
+//    Offset, in elements, of the data received from each PET in recvData.
+//  \item[typekind]
+//    The typekind of the data. See section \ref{const:ctypekind} for a list
+//    of valid typekind options.
+//  \end{description}
+//
+//EOP
+//-----------------------------------------------------------------------------
+
+//-----------------------------------------------------------------------------
+//BOP
+// !IROUTINE: ESMC_VMAllReduce - Reduce data across the VM onto all PETs
+//
+// !INTERFACE:
+int ESMC_VMAllReduce(ESMC_VM vm,
+                     void *sendData,
+                     void *recvData,
+                     int count,
+                     enum ESMC_TypeKind_Flag *typekind,
+                     enum ESMC_Reduce_Flag *reduceflag);
+// !RETURN VALUE:
+//  Return code; equals ESMF_SUCCESS if there are no errors.
+//
+// !DESCRIPTION:
+//  Collective {\tt ESMC\_VM} communication call that reduces a contiguous data
+//  array across the {\tt ESMC\_VM} object into a contiguous data array of
+//  the same <type><kind>. The result array is returned on all PETs.
+//  Different reduction operations can be specified.
+//
+//  This method is overloaded for:
+//  {\tt ESMC\_TYPEKIND\_I4}, {\tt ESMC\_TYPEKIND\_I8},
+//  {\tt ESMC\_TYPEKIND\_R4}, {\tt ESMC\_TYPEKIND\_R8}.
+//
+//  The arguments are:
+//  \begin{description}
+//  \item[vm]
+//    {\tt ESMC\_VM} object.
+//  \item[sendData]
+//    Contiguous data array holding data to be sent.
+//  \item[recvData]
+//    Contiguous data array for the reduced data.
+//  \item[count]
+//    Number of elements in sendData and recvData. Must be the same on all PETs.
+//  \item[typekind]
+//    The typekind of the data to be reduced. See section
+//    \ref{const:ctypekind} for a list of valid typekind options.
+//  \item[reduceflag]
+//    Reduction operation. See section \ref{const:creduce} for a list of
+//    valid reduce operations.
+//  \end{description}
+//
+//EOP
+//-----------------------------------------------------------------------------
+
+//-----------------------------------------------------------------------------
+//BOP
+// !IROUTINE: ESMC_VMAllToAllV - Exchange data of varying size between all PETs
+//
+// !INTERFACE:
+int ESMC_VMAllToAllV(ESMC_VM vm,
+                     void *sendData,
+                     int *sendCounts,
+                     int *sendOffsets,
+                     void *recvData,
+                     int *recvCounts,
+                     int *recvOffsets,
+                     enum ESMC_TypeKind_Flag *typekind);
+// !RETURN VALUE:
+//  Return code; equals ESMF_SUCCESS if there are no errors.
+//
+// !DESCRIPTION:
+//  Collective {\tt ESMC\_VM} communication call that sends a part of a
+//  contiguous data array to each PET of the {\tt ESMC\_VM} object and
+//  receives a part from each PET.
+//
+//  This method is overloaded for:
+//  {\tt ESMC\_TYPEKIND\_I4}, {\tt ESMC\_TYPEKIND\_I8},
+//  {\tt ESMC\_TYPEKIND\_R4}, {\tt ESMC\_TYPEKIND\_R8}.
+//
+//  The arguments are:
+//  \begin{description}
+//  \item[vm]
+//    {\tt ESMC\_VM} object.
+//  \item[sendData]
+//    Contiguous data array holding the data to be sent.
+//  \item[sendCounts]
+//    Number of elements sent to each PET.
+//  \item[sendOffsets]
+//    Offset, in elements, of the data sent to each PET in sendData.
+//  \item[recvData]
+//    Contiguous data array for the data to be received.
+//  \item[recvCounts]
+//    Number of elements received from each PET.
+//  \item[recvOffsets]
+//    Offset, in elements, of the data received from each PET in recvData.
+//  \item[typekind]
+//    The typekind of the data. See section \ref{const:ctypekind} for a list
+//    of valid typekind options.
+//  \end{description}
+//
+//EOP
+//-----------------------------------------------------------------------------
+
 //-----------------------------------------------------------------------------
 //BOP
 // !IROUTINE: ESMC_VMBarrier - block calling PETs until all PETS called
@@ -120,6 +301,101 @@ int ESMC_VMBroadcast(ESMC_VM vm,
 //EOP
 //-----------------------------------------------------------------------------
 
+//-----------------------------------------------------------------------------
+//BOP
+// !IROUTINE: ESMC_VMGather - Gather data from all PETs onto one PET
+//
+// !INTERFACE:
+int ESMC_VMGather(ESMC_VM vm,
+                  void *sendData,
+                  void *recvData,
+                  int count,
+                  enum ESMC_TypeKind_Flag *typekind,
+                  int rootPet);
+// !RETURN VALUE:
+//  Return code; equals ESMF_SUCCESS if there are no errors.
+//
+// !DESCRIPTION:
+//  Collective {\tt ESMC\_VM} communication call that gathers contiguous data
+//  arrays of the same size from all PETs of the {\tt ESMC\_VM} object into
+//  a contiguous data array on {\tt rootPet}, in the order of the PETs.
+//
+//  This method is overloaded for:
+//  {\tt ESMC\_TYPEKIND\_I4}, {\tt ESMC\_TYPEKIND\_I8},
+//  {\tt ESMC\_TYPEKIND\_R4}, {\tt ESMC\_TYPEKIND\_R8}.
+//
+//  The arguments are:
+//  \begin{description}
+//  \item[vm]
+//    {\tt ESMC\_VM} object.
+//  \item[sendData]
+//    Contiguous data array holding the data to be sent.
+//  \item[recvData]
+//    Contiguous data array of {\tt count} elements per PET for the data to
+//    be received. Only used on {\tt rootPet}.
+//  \item[count]
+//    Number of elements in sendData. Must be the same on all PETs.
+//  \item[typekind]
+//    The typekind of the data. See section \ref{const:ctypekind} for a list
+//    of valid typekind options.
+//  \item[rootPet]
+//    PET on which the gathered data is returned.
+//  \end{description}
+//
+//EOP
+//-----------------------------------------------------------------------------
+
+//-----------------------------------------------------------------------------
+//BOP
+// !IROUTINE: ESMC_VMGatherV - Gather data of varying size onto one PET
+//
+// !INTERFACE:
+int ESMC_VMGatherV(ESMC_VM vm,
+                   void *sendData,
+                   int sendCount,
+                   void *recvData,
+                   int *recvCounts,
+                   int *recvOffsets,
+                   enum ESMC_TypeKind_Flag *typekind,
+                   int rootPet);
+// !RETURN VALUE:
+//  Return code; equals ESMF_SUCCESS if there are no errors.
+//
+// !DESCRIPTION:
+//  Collective {\tt ESMC\_VM} communication call that gathers contiguous data
+//  arrays of varying size from all PETs of the {\tt ESMC\_VM} object into a
+//  contiguous data array on {\tt rootPet}.
+//
+//  This method is overloaded for:
+//  {\tt ESMC\_TYPEKIND\_I4}, {\tt ESMC\_TYPEKIND\_I8},
+//  {\tt ESMC\_TYPEKIND\_R4}, {\tt ESMC\_TYPEKIND\_R8}.
+//
+//  The arguments are:
+//  \begin{description}
+//  \item[vm]
+//    {\tt ESMC\_VM} object.
+//  \item[sendData]
+//    Contiguous data array holding the data to be sent.
+//  \item[sendCount]
+//    Number of elements in sendData.
+//  \item[recvData]
+//    Contiguous data array for the data to be received. Only used on
+//    {\tt rootPet}.
+//  \item[recvCounts]
+//    Number of elements received from each PET. Only used on {\tt rootPet}.
+//  \item[recvOffsets]
+//    Offset, in elements, of the data received from each PET in recvData.
+//    Only used on {\tt rootPet}.
+//  \item[typekind]
+//    The typekind of the data. See section \ref{const:ctypekind} for a list
+//    of valid typekind options.
+//  \item[rootPet]
+//    PET on which the gathered data is returned.
+//  \end{description}
+//
+//EOP
+//-----------------------------------------------------------------------------
+
 //-----------------------------------------------------------------------------
 //BOP
 // !IROUTINE: ESMC_VMGet - Get VM internals
@@ -360,6 +636,101 @@ int ESMC_VMReduce(ESMC_VM vm,
 //EOP
 //-----------------------------------------------------------------------------
 
+//-----------------------------------------------------------------------------
+//BOP
+// !IROUTINE: ESMC_VMScatter - Scatter data from one PET onto all PETs
+//
+// !INTERFACE:
+int ESMC_VMScatter(ESMC_VM vm,
+                   void *sendData,
+                   void *recvData,
+                   int count,
+                   enum ESMC_TypeKind_Flag *typekind,
+                   int rootPet);
+// !RETURN VALUE:
+//  Return code; equals ESMF_SUCCESS if there are no errors.
+//
+// !DESCRIPTION:
+//  Collective {\tt ESMC\_VM} communication call that scatters a contiguous
+//  data array on {\tt rootPet} into parts of the same size, sent to the PETs
+//  of the {\tt ESMC\_VM} object in their order.
+//
+//  This method is overloaded for:
+//  {\tt ESMC\_TYPEKIND\_I4}, {\tt ESMC\_TYPEKIND\_I8},
+//  {\tt ESMC\_TYPEKIND\_R4}, {\tt ESMC\_TYPEKIND\_R8}.
+//
+//  The arguments are:
+//  \begin{description}
+//  \item[vm]
+//    {\tt ESMC\_VM} object.
+//  \item[sendData]
+//    Contiguous data array of {\tt count} elements per PET holding the data
+//    to be sent. Only used on {\tt rootPet}.
+//  \item[recvData]
+//    Contiguous data array for the data to be received.
+//  \item[count]
+//    Number of elements in recvData. Must be the same on all PETs.
+//  \item[typekind]
+//    The typekind of the data. See section \ref{const:ctypekind} for a list
+//    of valid typekind options.
+//  \item[rootPet]
+//    PET that holds the data to be scattered.
+//  \end{description}
+//
+//EOP
+//-----------------------------------------------------------------------------
+
+//-----------------------------------------------------------------------------
+//BOP
+// !IROUTINE: ESMC_VMScatterV - Scatter data of varying size from one PET
+//
+// !INTERFACE:
+int ESMC_VMScatterV(ESMC_VM vm,
+                    void *sendData,
+                    int *sendCounts,
+                    int *sendOffsets,
+                    void *recvData,
+                    int recvCount,
+                    enum ESMC_TypeKind_Flag *typekind,
+                    int rootPet);
+// !RETURN VALUE:
+//  Return code; equals ESMF_SUCCESS if there are no errors.
+//
+// !DESCRIPTION:
+//  Collective {\tt ESMC\_VM} communication call that scatters parts of
+//  varying size of a contiguous data array on {\tt rootPet} to the PETs of
+//  the {\tt ESMC\_VM} object.
+//
+//  This method is overloaded for:
+//  {\tt ESMC\_TYPEKIND\_I4}, {\tt ESMC\_TYPEKIND\_I8},
+//  {\tt ESMC\_TYPEKIND\_R4}, {\tt ESMC\_TYPEKIND\_R8}.
+//
+//  The arguments are:
+//  \begin{description}
+//  \item[vm]
+//    {\tt ESMC\_VM} object.
+//  \item[sendData]
+//    Contiguous data array holding the data to be sent. Only used on
+//    {\tt rootPet}.
+//  \item[sendCounts]
+//    Number of elements sent to each PET. Only used on {\tt rootPet}.
+//  \item[sendOffsets]
+//    Offset, in elements, of the data sent to each PET in sendData. Only
+//    used on {\tt rootPet}.
+//  \item[recvData]
+//    Contiguous data array for the data to be received.
+//  \item[recvCount]
+//    Number of elements in recvData.
+//  \item[typekind]
+//    The typekind of the data. See section \ref{const:ctypekind} for a list
+//    of valid typekind options.
+//  \item[rootPet]
+//    PET that holds the data to be scattered.
+//  \end{description}
+//
+//EOP
+//-----------------------------------------------------------------------------
+
 #ifdef __cplusplus
 } // extern "C"
 #endif
@@ -109,6 +109,102 @@ int main(void){
   ESMC_Test((rc==ESMF_SUCCESS), name, failMsg, &result, __FILE__, __LINE__, 0);
   //----------------------------------------------------------------------------
 
+  //----------------------------------------------------------------------------
+  //NEX_UTest
+  //VM AllReduce
+  {
+  strcpy(name, "VMAllReduceI4");
+  strcpy(failMsg, "Did not return ESMF_SUCCESS");
+  int len = 4;
+  int in[4];
+  int out[4];
+  in[0] = 1; in[1] = 1; in[2] = 1; in[3] = localPet;
+  out[0] = 0; out[1] = 0; out[2] = 0; out[3] = 0;
+  enum ESMC_TypeKind_Flag tk = ESMC_TYPEKIND_I4;
+  enum ESMC_Reduce_Flag rd = ESMC_REDUCE_MAX;
+  rc = ESMC_VMAllReduce(vm, in, out, len, &tk, &rd);
+  bool correct = true;
+  for (int i = 0; i < len-1; ++i) {
+    if (out[i] != 1) correct = false;
+  }
+  if (out[3] != petCount-1) correct = false;
+  ESMC_Test((rc==ESMF_SUCCESS && correct), name, failMsg, &result, __FILE__, __LINE__, 0);
+  }
+  //----------------------------------------------------------------------------
+
+  //----------------------------------------------------------------------------
+  //NEX_UTest
+  //VM AllGather
+  {
+  strcpy(name, "VMAllGatherR8");
+  strcpy(failMsg, "Did not return ESMF_SUCCESS");
+  int len = 2;
+  double in[2];
+  double *out = (double *)malloc(len*petCount*sizeof(double));
+  in[0] = localPet; in[1] = 2*localPet;
+  enum ESMC_TypeKind_Flag tk = ESMC_TYPEKIND_R8;
+  rc = ESMC_VMAllGather(vm, in, out, len, &tk);
+  bool correct = true;
+  for (int i = 0; i < petCount; ++i) {
+    if (out[2*i] != (double) i || out[2*i+1] != (double) 2*i) correct = false;
+  }
+  free(out);
+  ESMC_Test((rc==ESMF_SUCCESS && correct), name, failMsg, &result, __FILE__, __LINE__, 0);
+  }
+  //----------------------------------------------------------------------------
+
+  //----------------------------------------------------------------------------
+  //NEX_UTest
+  //VM AllToAllV
+  {
+  strcpy(name, "VMAllToAllVI8");
+  strcpy(failMsg, "Did not return ESMF_SUCCESS");
+  // each PET sends its localPet to every PET
+  long long *in = (long long *)malloc(petCount*sizeof(long long));
+  long long *out = (long long *)malloc(petCount*sizeof(long long));
+  int *counts = (int *)malloc(petCount*sizeof(int));
+  int *offsets = (int *)malloc(petCount*sizeof(int));
+  for (int i = 0; i < petCount; ++i) {
+    in[i] = localPet;
+    out[i] = -1;
+    counts[i] = 1;
+    offsets[i] = i;
+  }
+  enum ESMC_TypeKind_Flag tk = ESMC_TYPEKIND_I8;
+  rc = ESMC_VMAllToAllV(vm, in, counts, offsets, out, counts, offsets, &tk);
+  bool correct = true;
+  for (int i = 0; i < petCount; ++i) {
+    if (out[i] != i) correct = false;
+  }
+  free(in);
+  free(out);
+  free(counts);
+  free(offsets);
+  ESMC_Test((rc==ESMF_SUCCESS && correct), name, failMsg, &result, __FILE__, __LINE__, 0);
+  }
+  //----------------------------------------------------------------------------
+
+  //----------------------------------------------------------------------------
+  //NEX_UTest
+  //VM Scatter
+  {
+  strcpy(name, "VMScatterR4");
+  strcpy(failMsg, "Did not return ESMF_SUCCESS");
+  int root = 0;
+  int len = 2;
+  float *in = (float *)malloc(len*petCount*sizeof(float));
+  float out[2];
+  for (int i = 0; i < len*petCount; ++i) in[i] = i;
+  enum ESMC_TypeKind_Flag tk = ESMC_TYPEKIND_R4;
+  rc = ESMC_VMScatter(vm, in, out, len, &tk, root);
+  bool correct = true;
+  if (out[0] != (float) 2*localPet || out[1] != (float) 2*localPet+1)
+    correct = false;
+  free(in);
+  ESMC_Test((rc==ESMF_SUCCESS && correct), name, failMsg, &result, __FILE__, __LINE__, 0);
+  }
+  //----------------------------------------------------------------------------
+
   //----------------------------------------------------------------------------
   //NEX_UTest
   //VM Reduce
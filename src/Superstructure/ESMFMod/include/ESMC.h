@@ -34,6 +34,7 @@
 // Infrastructure headers
 #include "ESMC_Util.h"
 #include "ESMC_VM.h"
+#include "ESMC_Trace.h"
 #include "ESMC_RHandle.h"
 #include "ESMC_DistGrid.h"
 #include "ESMC_ArraySpec.h"
@@ -0,0 +1,64 @@
+# This benchmark creates and drops transient Grids, Fields and Regrids in a
+# loop without calling destroy(), and reports the resident memory as the loop
+# progresses. The ESMF allocations are released when the objects are garbage
+# collected, so the resident memory stays flat after the first cycles:
+#
+#     mpirun -n 4 python finalizer_stress_benchmark.py 10000
+
+
+import resource
+import sys
+import time
+
+import esmpy
+
+import esmpy.util.helpers as helpers
+import esmpy.util.finalizers as finalizers
+import esmpy.api.constants as constants
+from esmpy.util.grid_utilities import grid_create_from_bounds
+
+
+def rss():
+    # current resident set size in MB, ru_maxrss only reports the peak
+    with open("/proc/self/statm") as statm:
+        pages = int(statm.read().split()[1])
+    return pages * resource.getpagesize() / 1024.**2
+
+
+cycles = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+report = max(cycles // 10, 1)
+
+mg = esmpy.Manager()
+
+samples = []
+start = time.perf_counter()
+for cycle in range(1, cycles + 1):
+    srcgrid = grid_create_from_bounds([0, 4], [0, 4], 24, 20)
+    dstgrid = grid_create_from_bounds([0, 4], [0, 4], 15, 18)
+    srcfield = esmpy.Field(srcgrid, name="srcfield")
+    dstfield = esmpy.Field(dstgrid, name="dstfield")
+    srcfield.data[...] = 1.
+    regrid = esmpy.Regrid(srcfield, dstfield,
+                          regrid_method=esmpy.RegridMethod.BILINEAR,
+                          unmapped_action=esmpy.UnmappedAction.IGNORE)
+    dstfield = regrid(srcfield, dstfield)
+    # drop every reference, the next cycle rebinds the names
+
+    if cycle % report == 0:
+        # the largest resident memory and live object count of any PET
+        samples.append((cycle,
+                        helpers.reduce_val(rss(), op=constants.Reduce.MAX),
+                        helpers.reduce_val(float(finalizers.live()),
+                                           op=constants.Reduce.MAX)))
+elapsed = helpers.reduce_val(time.perf_counter() - start,
+                             op=constants.Reduce.MAX)
+
+if esmpy.local_pet() == 0:
+    print ("ESMPy Finalizer Stress Benchmark ({0} cycles, {1} PETs)".format(
+        cycles, esmpy.pet_count()))
+    for cycle, resident, live in samples:
+        print ("  cycle {0:>7d}: RSS = {1:8.1f} MB, live ESMF objects = {2:d}".format(
+            cycle, resident, int(live)))
+    print ("  RSS growth after the first report = {0:.1f} MB".format(
+        samples[-1][1] - samples[0][1]))
+    print ("  time = {0:.3f} s".format(elapsed))
@@ -98,6 +98,19 @@ def compute_error(dstfield, xctfield):
     print "  interpolation mean relative error = {0}".format(meanrelerr)
 
 
+def send(comm, data):
+    # send the shape, then the raw buffer without pickling
+    data = numpy.ascontiguousarray(data)
+    comm.send(data.shape, dest=0)
+    comm.Send(data, dest=0)
+
+def receive(comm):
+    shape = comm.recv(source=0)
+    data = numpy.empty(shape)
+    comm.Recv(data, source=0)
+    return data
+
+
 ########################################### MAIN #############################
 
 start_worker = 'worker'
@@ -113,14 +126,9 @@ if len(sys.argv) == 1:
         args=[sys.argv[0], start_worker],
         maxprocs=pet_count)
 
-    # gather output fields from workers
-    dstfield = None
-    dstfield = comm.gather(dstfield, root=MPI.ROOT)
-    dstfield = numpy.concatenate([dstfield[i] for i in range(pet_count)])
-
-    xctfield = None
-    xctfield = comm.gather(xctfield, root=MPI.ROOT)
-    xctfield = numpy.concatenate([xctfield[i] for i in range(pet_count)])
+    # receive the global output fields gathered on the first worker
+    dstfield = receive(comm)
+    xctfield = receive(comm)
 
     # plot results
     compute_error(dstfield, xctfield)
@@ -142,9 +150,12 @@ elif sys.argv[1] == start_worker:
         # call ESMPy regridding
         dstfield, xctfield = regrid()
 
-        # send output to parent
-        comm.gather(sendobj=dstfield.data, root=0)
-        comm.gather(sendobj=xctfield.data, root=0)
+        # gather the output on the first worker, and send it to the parent
+        dstfield = dstfield.gather(root=0)
+        xctfield = xctfield.gather(root=0)
+        if rank == 0:
+            send(comm, dstfield)
+            send(comm, xctfield)
     except:
         comm.Disconnect()
 
@@ -0,0 +1,73 @@
+# This benchmark compares the load time and the peak memory of creating a
+# RegridFromFile from a weight file with the default path, which reads the
+# whole weight file, and with lazy=True, which reads one part per PET.
+#
+# Peak memory can only grow within a process, so each path is run in a
+# separate job, for example:
+#
+#     mpirun -n 4 python regrid_from_file_benchmark.py default
+#     mpirun -n 4 python regrid_from_file_benchmark.py lazy
+#
+# The weight file is created by the first run and kept for the following ones.
+
+
+import os
+import resource
+import sys
+import time
+
+import esmpy
+
+import esmpy.util.helpers as helpers
+import esmpy.api.constants as constants
+from esmpy.util.grid_utilities import grid_create_from_bounds_periodic
+
+
+mode = sys.argv[1] if len(sys.argv) > 1 else "default"
+if mode not in ("default", "lazy"):
+    raise ValueError("mode must be 'default' or 'lazy'")
+size = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+mg = esmpy.Manager()
+
+# Create the source and destination grids
+srcgrid = grid_create_from_bounds_periodic(size, size // 2, corners=True)
+dstgrid = grid_create_from_bounds_periodic(size + 7, size // 2 + 3, corners=True)
+srcfield = esmpy.Field(srcgrid, name="srcfield")
+dstfield = esmpy.Field(dstgrid, name="dstfield")
+
+# write conservative regridding weights to file once
+filename = "esmpy_benchmark_weight_file_{0}.nc".format(size)
+exists = 0.
+if esmpy.local_pet() == 0 and os.path.isfile(filename):
+    exists = 1.
+exists = helpers.broadcast_val(exists)
+if not exists:
+    _ = esmpy.Regrid(srcfield, dstfield, filename=filename,
+                     regrid_method=esmpy.RegridMethod.CONSERVE,
+                     unmapped_action=esmpy.UnmappedAction.IGNORE)
+mg.barrier()
+
+# ru_maxrss is in kilobytes on Linux
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+mg.barrier()
+start = time.perf_counter()
+regrid = esmpy.RegridFromFile(srcfield, dstfield, filename,
+                              lazy=(mode == "lazy"))
+mg.barrier()
+elapsed = time.perf_counter() - start
+after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+# report the slowest PET and the largest peak memory increase of any PET
+elapsed = helpers.reduce_val(elapsed, op=constants.Reduce.MAX)
+growth = helpers.reduce_val(float(after - before), op=constants.Reduce.MAX)
+peak = helpers.reduce_val(float(after), op=constants.Reduce.MAX)
+
+if esmpy.local_pet() == 0:
+    print ("ESMPy RegridFromFile Benchmark ({0}, {1} PETs)".format(
+        mode, esmpy.pet_count()))
+    print ("  weight file size = {0:.1f} MB".format(
+        os.path.getsize(filename) / 1024.**2))
+    print ("  load time = {0:.3f} s".format(elapsed))
+    print ("  peak RSS = {0:.1f} MB (+{1:.1f} MB during load)".format(
+        peak / 1024., growth / 1024.))
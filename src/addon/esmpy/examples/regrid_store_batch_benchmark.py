@@ -0,0 +1,80 @@
+# This benchmark compares the time spent creating the regridding operators
+# from one source grid to several destination grids with N independent
+# Regrid stores and with a single RegridStoreBatch, both using a WeightCache.
+# The batch fingerprints the source grid once for all of the cache lookups,
+# so the difference is largest when the operators are read from the cache.
+#
+#     mpirun -n 4 python regrid_store_batch_benchmark.py [size] [ndst]
+#
+# Each path is run twice, first with an empty cache and then with the
+# operators stored by the first run.
+
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import esmpy
+
+import esmpy.util.helpers as helpers
+import esmpy.api.constants as constants
+from esmpy.util.grid_utilities import grid_create_from_bounds_periodic
+
+
+size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+ndst = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+mg = esmpy.Manager()
+
+# Create the source grid and the destination grids
+srcgrid = grid_create_from_bounds_periodic(size, size // 2, corners=True)
+srcfield = esmpy.Field(srcgrid, name="srcfield")
+dstfields = []
+for ii in range(ndst):
+    dstgrid = grid_create_from_bounds_periodic(size // 4 + 7 * ii,
+                                               size // 8 + 3 * ii, corners=True)
+    dstfields.append(esmpy.Field(dstgrid, name="dstfield{0}".format(ii)))
+
+options = dict(regrid_method=esmpy.RegridMethod.BILINEAR,
+               unmapped_action=esmpy.UnmappedAction.IGNORE)
+
+def independent(cache):
+    return [esmpy.Regrid(srcfield, dstfield, cache=cache, **options)
+            for dstfield in dstfields]
+
+def batch(cache):
+    return esmpy.RegridStoreBatch(srcfield, dstfields, cache=cache, **options)
+
+results = []
+for name, create in [("independent", independent), ("batch", batch)]:
+    # all PETs must use the same cache directory
+    directory = os.path.join(tempfile.gettempdir(),
+                             "esmpy_benchmark_batch_cache_{0}".format(name))
+    if esmpy.local_pet() == 0:
+        shutil.rmtree(directory, ignore_errors=True)
+    cache = esmpy.WeightCache(directory)
+
+    for run in ("cold", "warm"):
+        mg.barrier()
+        start = time.perf_counter()
+        regrids = create(cache)
+        mg.barrier()
+        elapsed = time.perf_counter() - start
+        for regrid in regrids:
+            regrid.destroy()
+
+        # report the slowest PET
+        elapsed = helpers.reduce_val(elapsed, op=constants.Reduce.MAX)
+        results.append((name, run, elapsed))
+
+    mg.barrier()
+    if esmpy.local_pet() == 0:
+        shutil.rmtree(directory, ignore_errors=True)
+
+if esmpy.local_pet() == 0:
+    print ("ESMPy RegridStoreBatch Benchmark ({0} destinations, {1} PETs)".format(
+        ndst, esmpy.pet_count()))
+    for name, run, elapsed in results:
+        print ("  {0} stores, {1} cache = {2:.3f} s".format(name, run, elapsed))
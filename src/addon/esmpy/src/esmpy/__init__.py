@@ -115,5 +115,11 @@ from esmpy.api.mesh import *
 from esmpy.api.locstream import *
 from esmpy.api.field import *
 from esmpy.api.regrid import *
+from esmpy.api.weightcache import *
+from esmpy.api.profile import *
+from esmpy.api.stream import *
+from esmpy.api.arena import *
+from esmpy.api import trace
+from esmpy.api import diagnostics
 from esmpy.api.constants import *
 from esmpy.util.helpers import *
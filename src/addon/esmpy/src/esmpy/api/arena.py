@@ -0,0 +1,105 @@
+# $Id$
+
+"""
+The arena API
+"""
+
+#### IMPORT LIBRARIES #########################################################
+
+from esmpy.api.esmpymanager import *
+import esmpy.util.finalizers as finalizers
+
+#### arena class ##############################################################
+
+class arena(object):
+    """
+    A context manager which destroys the :class:`~esmpy.api.grid.Grid`,
+    :class:`~esmpy.api.mesh.Mesh`, :class:`~esmpy.api.locstream.LocStream`,
+    :class:`~esmpy.api.field.Field`, :class:`~esmpy.api.regrid.Regrid` and
+    :class:`~esmpy.api.regrid.RegridFromFile` objects created within its
+    block when the block exits, even if it raises::
+
+        for filename in filenames:
+            with esmpy.arena():
+                grid = esmpy.Grid(filename=filename, filetype=esmpy.FileFormat.SCRIP)
+                srcfield = esmpy.Field(grid)
+                regrid = esmpy.Regrid(srcfield, dstfield)
+                dstfield = regrid(srcfield, dstfield)
+                results.append(dstfield.data.copy())
+
+    The objects are destroyed in the reverse order of their creation, so a
+    :class:`~esmpy.api.regrid.Regrid` is destroyed before its
+    :class:`Fields <esmpy.api.field.Field>`, and a
+    :class:`~esmpy.api.field.Field` before its :class:`~esmpy.api.grid.Grid`
+    or :class:`~esmpy.api.mesh.Mesh`. Objects created before the block, like
+    ``dstfield`` above, are not affected, and objects which must outlive the
+    block are excluded with :meth:`~esmpy.api.arena.arena.keep`. The NumPy
+    arrays aliasing the memory of the destroyed objects, like
+    :attr:`~esmpy.api.field.Field.data`, must not be used after the block.
+
+    Arenas may be nested, objects belong to the innermost one.
+    """
+
+    def __init__(self):
+        self._refs = None
+
+    def __enter__(self):
+        self._refs = []
+        finalizers._arenas.append(self._refs)
+        return self
+
+    def __exit__(self, exc_type, *args):
+        finalizers._arenas.remove(self._refs)
+        refs, self._refs = self._refs, []
+
+        error = None
+        for ref in reversed(refs):
+            obj = ref()
+            if obj is not None:
+                try:
+                    obj.destroy()
+                except ValueError as e:
+                    # destroy the remaining objects before reporting it
+                    if error is None:
+                        error = e
+        if error is not None and exc_type is None:
+            raise error
+        return False
+
+    def __len__(self):
+        return len([ref for ref in self._refs or () if ref() is not None])
+
+    def __repr__(self):
+        string = ("arena:\n"
+                  "    objects = %r\n"
+                  %
+                  (len(self),))
+
+        return string
+
+    def keep(self, *objs):
+        """
+        Exclude objects created within the block from being destroyed when it
+        exits, along with the objects they depend on, e.g. the
+        :class:`~esmpy.api.grid.Grid` of a kept :class:`~esmpy.api.field.Field`.
+
+        :param objs: the ESMPy objects to keep.
+        :return: the first object, so that it can be kept where it is created:
+            ``field = scope.keep(esmpy.Field(grid))`` in ``with esmpy.arena() as scope:``
+        """
+        # copies share the token of the original object
+        kept = set()
+        for obj in objs:
+            kept.add(obj._token)
+            # the discretization of a Field, the Fields of a Regrid
+            for name in ('_grid', '_srcfield', '_dstfield'):
+                dependency = getattr(obj, name, None)
+                if dependency is not None:
+                    kept.add(dependency._token)
+                    grid = getattr(dependency, '_grid', None)
+                    if grid is not None:
+                        kept.add(grid._token)
+        self._refs[:] = [ref for ref in self._refs
+                         if getattr(ref(), '_token', None) not in kept]
+
+        return objs[0] if objs else None
@@ -0,0 +1,299 @@
+# $Id$
+
+"""
+The diagnostics API, vectorized accuracy and conservation statistics of
+regridded Fields
+"""
+
+#### IMPORT LIBRARIES #########################################################
+
+import weakref
+
+from esmpy.api.field import *
+from esmpy.api import trace
+
+#### UTILITIES ################################################################
+
+# Grid or Mesh -> {stagger location: [cell areas of each local DE]}, the
+# areas are copied out of their Field so that the cache does not keep the
+# Grid or Mesh alive
+_areas = weakref.WeakKeyDictionary()
+
+def _local_areas_(field):
+    """
+    Return the cell areas of the discretization of ``field`` on each local
+    DE, computed by ESMF on the first call for a
+    :class:`~esmpy.api.grid.Grid` or :class:`~esmpy.api.mesh.Mesh` and
+    stagger location and cached afterwards. This is a collective call the
+    first time.
+    """
+    grid = field.grid
+    if isinstance(grid, LocStream):
+        raise ValueError("the cells of a LocStream have no area")
+    if isinstance(grid, Mesh) and field.staggerloc != MeshLoc.ELEMENT:
+        raise ValueError("the areas of a Mesh are only defined on its elements")
+
+    cached = _areas.setdefault(grid, {})
+    if field.staggerloc not in cached:
+        if isinstance(grid, Mesh):
+            areafield = Field(grid, name='areafield', meshloc=MeshLoc.ELEMENT)
+        else:
+            areafield = Field(grid, name='areafield', staggerloc=field.staggerloc)
+        try:
+            areafield.get_area()
+            cached[field.staggerloc] = [np.array(data) for data in areafield.local_data]
+        finally:
+            areafield.destroy()
+
+    return cached[field.staggerloc]
+
+def _broadcast_like_(values, data):
+    """
+    Add trailing axes to ``values`` over the gridded dimensions so that it
+    broadcasts against ``data`` with ungridded dimensions.
+    """
+    values = np.asarray(values)
+    return values.reshape(values.shape + (1,) * (data.ndim - values.ndim))
+
+def _local_masks_(field, mask_values):
+    """
+    Return for each local DE of ``field`` whether its points are masked with
+    one of ``mask_values`` in the mask of its :class:`~esmpy.api.grid.Grid`,
+    or ``None`` for a DE without mask.
+    """
+    grid = field.grid
+    if isinstance(mask_values, type(None)) or not isinstance(grid, Grid) or \
+            isinstance(grid.local_mask[field.staggerloc], type(None)):
+        return [None] * field.local_decount
+
+    return [np.isin(mask, mask_values) for mask in grid.local_mask[field.staggerloc]]
+
+def _local_data_(field):
+    if isinstance(field, type(None)):
+        return None
+    return field.local_data
+
+def _local_error_(field, exact, frac=None, mask_values=None, uninitval=None,
+                  frac_threshold=0.999):
+    """
+    Return the sum, count, maximum and minimum of the pointwise relative
+    errors of ``field`` against ``exact`` on the current PET. The points
+    masked with ``mask_values``, equal to ``uninitval`` or with a fraction
+    below ``frac_threshold`` are left out.
+    """
+    if field.data.shape != exact.data.shape:
+        raise ValueError("the Fields must have the same shape")
+
+    total = 0.
+    count = 0
+    maximum = -np.inf
+    minimum = np.inf
+    fracs = _local_data_(frac)
+    masks = _local_masks_(exact, mask_values)
+    for localde in range(field.local_decount):
+        values = np.asarray(field.local_data[localde], dtype=np.float64)
+        expected = np.asarray(exact.local_data[localde], dtype=np.float64)
+
+        valid = np.ones(values.shape, dtype=bool)
+        if not isinstance(uninitval, type(None)):
+            valid &= values != uninitval
+        if isinstance(fracs, type(None)):
+            fraction = np.ones(values.shape)
+        else:
+            fraction = np.broadcast_to(_broadcast_like_(fracs[localde], values),
+                                       values.shape)
+            valid &= fraction >= frac_threshold
+        if not isinstance(masks[localde], type(None)):
+            valid &= ~_broadcast_like_(masks[localde], values)
+
+        expected = expected[valid]
+        error = np.abs(values[valid] / fraction[valid] - expected)
+        nonzero = expected != 0
+        error[nonzero] /= np.abs(expected[nonzero])
+
+        if error.size > 0:
+            total += np.sum(error)
+            count += error.size
+            maximum = max(maximum, np.max(error))
+            minimum = min(minimum, np.min(error))
+
+    return total, count, maximum, minimum
+
+def _local_mass_(field, frac=None, uninitval=None):
+    """
+    Return the integral of ``field`` over the cells of the current PET,
+    optionally weighted by the fractions of ``frac``, leaving out the points
+    equal to ``uninitval``.
+    """
+    areas = _local_areas_(field)
+    fracs = _local_data_(frac)
+
+    mass = 0.
+    for localde in range(field.local_decount):
+        values = np.asarray(field.local_data[localde], dtype=np.float64)
+        weights = _broadcast_like_(areas[localde], values)
+        if not isinstance(fracs, type(None)):
+            weights = weights * _broadcast_like_(fracs[localde], values)
+        contrib = values * weights
+        if not isinstance(uninitval, type(None)):
+            contrib = np.where(values != uninitval, contrib, 0.)
+        mass += np.sum(contrib)
+
+    return mass
+
+def _reduce_stats_(sums, maxima):
+    """
+    Return the global sums of ``sums`` and maxima of ``maxima`` on every PET,
+    with one allreduce of the sums and one of the maxima, each as long as its
+    list of statistics. An empty list is not reduced. This is a collective
+    call.
+    """
+    mg = Manager()
+    sums = np.array(sums, dtype=np.float64)
+    maxima = np.array(maxima, dtype=np.float64)
+    if sums.size > 0:
+        sums = mg.allreduce(sums, op=Reduce.SUM)
+    if maxima.size > 0:
+        maxima = mg.allreduce(maxima, op=Reduce.MAX)
+
+    return sums, maxima
+
+#### API ######################################################################
+
+def cell_area(field):
+    """
+    Return the areas of the cells of the :class:`~esmpy.api.grid.Grid` or
+    :class:`~esmpy.api.mesh.Mesh` of a :class:`~esmpy.api.field.Field`, in
+    the layout of the gridded dimensions of
+    :attr:`~esmpy.api.field.Field.data`. The areas are computed by ESMF once
+    for each :class:`~esmpy.api.grid.Grid` or :class:`~esmpy.api.mesh.Mesh`
+    and stagger location, and reused for every
+    :class:`~esmpy.api.field.Field` built on it.
+
+    This is a collective call the first time it is made for a discretization.
+
+    *REQUIRED:*
+
+    :param Field field: a :class:`~esmpy.api.field.Field` on a
+        :class:`~esmpy.api.grid.Grid` or on the elements of a
+        :class:`~esmpy.api.mesh.Mesh`.
+
+    :return: ndarray
+    """
+    areas = _local_areas_(field)
+    if len(areas) == 0:
+        return np.zeros(field.data.shape[:field.rank - field.xd])
+
+    return areas[0]
+
+@trace.region("ESMPy diagnostics mass")
+def mass(field, frac=None, uninitval=None):
+    """
+    Return the global integral of a :class:`~esmpy.api.field.Field` over the
+    areas of its cells, summed over any ungridded dimensions.
+
+    This is a collective call.
+
+    *REQUIRED:*
+
+    :param Field field: a :class:`~esmpy.api.field.Field` on a
+        :class:`~esmpy.api.grid.Grid` or on the elements of a
+        :class:`~esmpy.api.mesh.Mesh`.
+
+    *OPTIONAL:*
+
+    :param Field frac: a :class:`~esmpy.api.field.Field` of the fraction of
+        each cell to count, e.g. the ``src_frac_field`` of a conservative
+        :class:`~esmpy.api.regrid.Regrid`. If ``None``, whole cells are
+        counted.
+    :param float uninitval: a value marking the points to leave out. If
+        ``None``, every point is counted.
+
+    :return: float
+    """
+    sums, _ = _reduce_stats_([_local_mass_(field, frac, uninitval)], [])
+
+    return float(sums[0])
+
+@trace.region("ESMPy diagnostics compare")
+def compare(field, exact, frac=None, mask_values=None, uninitval=None,
+            frac_threshold=0.999, srcfield=None, src_frac=None):
+    """
+    Compute the accuracy of a regridded :class:`~esmpy.api.field.Field`
+    against the exact solution and, if the source
+    :class:`~esmpy.api.field.Field` is given, the conservation of its mass.
+    The pointwise relative error is ``|field / frac - exact| / |exact|``, or
+    the absolute error where ``exact`` is 0. The statistics are computed with
+    NumPy over whole arrays and reduced across the PETs with one allreduce of
+    the sums and one of the maxima, so the result is the same on every PET.
+
+    ============================ ============================================
+    Key                          Value
+    ============================ ============================================
+    ``mean_relative_error``      The mean of the pointwise relative errors
+    ``max_relative_error``       The maximum of the pointwise relative errors
+    ``min_relative_error``       The minimum of the pointwise relative errors
+    ``count``                    The number of points compared
+    ``src_mass``                 The mass of ``srcfield``
+    ``dst_mass``                 The mass of ``field``
+    ``conservation_error``       ``|dst_mass - src_mass| / |src_mass|``
+    ============================ ============================================
+
+    The mass statistics are only present if ``srcfield`` is given. The error
+    statistics are ``nan`` if no point is compared.
+
+    This is a collective call.
+
+    *REQUIRED:*
+
+    :param Field field: the regridded :class:`~esmpy.api.field.Field`.
+    :param Field exact: a :class:`~esmpy.api.field.Field` on the same
+        discretization holding the exact solution.
+
+    *OPTIONAL:*
+
+    :param Field frac: a :class:`~esmpy.api.field.Field` of the fractions of
+        the destination points which received regridded values, e.g. the
+        ``dst_frac_field`` of a conservative
+        :class:`~esmpy.api.regrid.Regrid`. If ``None``, all fractions are 1.
+    :param list mask_values: the values of the mask of the
+        :class:`~esmpy.api.grid.Grid` of ``exact`` marking the points to
+        leave out. If ``None``, the mask is not used.
+    :param float uninitval: a value of ``field`` marking the points to leave
+        out, e.g. the unmapped points. If ``None``, every point is compared.
+    :param float frac_threshold: the points whose fraction is below this are
+        left out. Defaults to ``0.999``.
+    :param Field srcfield: the source :class:`~esmpy.api.field.Field` of the
+        regridding, whose mass is compared to the mass of ``field``.
+    :param Field src_frac: a :class:`~esmpy.api.field.Field` of the fractions
+        of the source cells used by the regridding, e.g. the
+        ``src_frac_field`` of a conservative
+        :class:`~esmpy.api.regrid.Regrid`.
+
+    :return: dict
+    """
+    total, count, maximum, minimum = _local_error_(
+        field, exact, frac=frac, mask_values=mask_values, uninitval=uninitval,
+        frac_threshold=frac_threshold)
+    sums = [total, count]
+    if not isinstance(srcfield, type(None)):
+        sums += [_local_mass_(srcfield, src_frac),
+                 _local_mass_(field, uninitval=uninitval)]
+
+    # the minimum is reduced as the maximum of its negation
+    sums, maxima = _reduce_stats_(sums, [maximum, -minimum])
+
+    count = int(sums[1])
+    ret = {'count': count,
+           'mean_relative_error': sums[0] / count if count > 0 else np.nan,
+           'max_relative_error': maxima[0] if count > 0 else np.nan,
+           'min_relative_error': -maxima[1] if count > 0 else np.nan}
+    if not isinstance(srcfield, type(None)):
+        src_mass, dst_mass = sums[2], sums[3]
+        ret['src_mass'] = src_mass
+        ret['dst_mass'] = dst_mass
+        ret['conservation_error'] = abs(dst_mass - src_mass)
+        if src_mass != 0:
+            ret['conservation_error'] /= abs(src_mass)
+
+    return ret
@@ -11,11 +11,38 @@ from esmpy.interface.cbindings import *
 from esmpy.api.constants import *
 from esmpy.util.exceptions import *
 from esmpy.util.decorators import initialize
+import esmpy.util.profiling as profiling
+import esmpy.util.finalizers as finalizers
+import esmpy.api.constants as constants
 
 import re
+import time
+
+import numpy as np
 
 #### UTILITIES ################################################################
 
+# the largest number of dimensions of the arrays sent by the VM collectives
+_MAXDIMS = 64
+
+def _vm_array_(data):
+    """
+    Return ``data`` as a contiguous array of a dtype supported by the VM
+    collectives, without a copy if it already is one.
+    """
+    data = np.ascontiguousarray(data)
+    if data.dtype.type not in (np.int32, np.int64, np.float32, np.float64):
+        raise TypeError("data must have dtype int32, int64, float32 or float64")
+    return data
+
+def _offsets_(counts):
+    """
+    Return the offsets of consecutive blocks of ``counts`` elements.
+    """
+    offsets = np.zeros(len(counts), dtype=np.int32)
+    np.cumsum(counts[:-1], out=offsets[1:])
+    return offsets
+
 def _preprocess(v, separator, ignorecase):
     if ignorecase: v = v.lower()
     return [int(x) if x.isdigit() else [int(y) if y.isdigit() else y for y in
@@ -87,11 +114,17 @@ class Manager(object):
 
     :param bool debug: outputs logging information to ESMF logfiles. If
         ``None``, defaults to False.
+    :param bool profile: record the call counts, wall time and array bytes of
+        every binding to the ESMF C API for the rest of the run, see
+        :meth:`~esmpy.api.esmpymanager.Manager.profile_summary`. Unlike
+        ``debug``, this also takes effect if the
+        :class:`~esmpy.api.esmpymanager.Manager` was already created. Defaults
+        to False.
     '''
     # The singleton instance for this class
     __singleton = None
     
-    def __new__(cls, debug=False):
+    def __new__(cls, debug=False, profile=False):
         '''
         Returns the singleton instance of this class, creating it if it does 
         not already exist.
@@ -106,10 +139,14 @@ class Manager(object):
         return cls.__singleton
 
 
-    def __init__(self, debug=False):
+    def __init__(self, debug=False, profile=False):
         # Return no-op
         if self.__esmp_finalized:
             return
+        # Enable profiling once, even on later calls
+        if profile and not getattr(self, '_profile', False):
+            profiling.enable()
+            self._profile = True
         # Call ESMP_Initialize if not already done previously
         if not self.__esmp_initialized:
             # set up logging
@@ -182,6 +219,10 @@ class Manager(object):
         if self.__esmp_finalized:
             return
 
+        # Release the ESMF allocations of the ESMPy objects still alive, which
+        # can no longer be done after ESMP_Finalize
+        finalizers.release_all()
+
         # Call ESMP_Finalize and set flags indicating this has been done
         ESMP_Finalize()
         self.__esmp_initialized = False
@@ -199,13 +240,248 @@ class Manager(object):
 
         return string
 
+    def allgather(self, data):
+        """
+        Gather an array of the same shape from every PET onto every PET.
+        This is a collective call.
+
+        *REQUIRED:*
+
+        :param ndarray data: the values of the current PET, of dtype
+            ``int32``, ``int64``, ``float32`` or ``float64``.
+
+        :return: An array of the same dtype with a leading dimension of size
+            :attr:`pet_count`, holding the ``data`` of each PET in order.
+        """
+        data = _vm_array_(data)
+        recv = np.empty((self.pet_count,) + data.shape, dtype=data.dtype)
+        ESMP_VMAllGather(self.vm, data, recv, data.size)
+        return recv
+
+    def allgatherv(self, data):
+        """
+        Gather arrays of varying size from every PET onto every PET. The
+        sizes are exchanged first, so every PET may pass a different number
+        of values. This is a collective call.
+
+        *REQUIRED:*
+
+        :param ndarray data: the values of the current PET, of dtype
+            ``int32``, ``int64``, ``float32`` or ``float64``. It is flattened.
+
+        :return: A tuple of the 1D array of the same dtype concatenating the
+            ``data`` of each PET in order, and the ``int32`` array of the
+            number of values from each PET.
+        """
+        data = _vm_array_(data)
+        counts = self.allgather(np.array([data.size], dtype=np.int32))
+        counts = counts.reshape(-1)
+        recv = np.empty(np.sum(counts), dtype=data.dtype)
+        ESMP_VMAllGatherV(self.vm, data, data.size, recv, counts,
+                          _offsets_(counts))
+        return recv, counts
+
+    def allreduce(self, data, op=Reduce.SUM):
+        """
+        Reduce an array of the same shape elementwise across all PETs, with
+        the result on every PET. This is a collective call.
+
+        *REQUIRED:*
+
+        :param ndarray data: the values of the current PET, of dtype
+            ``int32``, ``int64``, ``float32`` or ``float64``.
+
+        *OPTIONAL:*
+
+        :param Reduce op: the reduction operation, see
+            :class:`~esmpy.api.constants.Reduce`. Defaults to ``Reduce.SUM``.
+
+        :return: An array of the same shape and dtype holding the reduction.
+        """
+        data = _vm_array_(data)
+        recv = np.empty_like(data)
+        ESMP_VMAllReduce(self.vm, data, recv, data.size, op)
+        return recv
+
+    def alltoallv(self, data, counts):
+        """
+        Send consecutive parts of varying size of an array to each PET and
+        receive the parts sent to the current PET by each PET. The number of
+        values to receive is exchanged first. This is a collective call.
+
+        *REQUIRED:*
+
+        :param ndarray data: the values to send, of dtype ``int32``,
+            ``int64``, ``float32`` or ``float64``. It is flattened.
+        :param list counts: the number of consecutive values of ``data`` to
+            send to each PET, of length :attr:`pet_count`.
+
+        :return: A tuple of the 1D array of the same dtype concatenating the
+            values received from each PET in order, and the ``int32`` array
+            of the number of values received from each PET.
+        """
+        data = _vm_array_(data)
+        counts = np.array(counts, dtype=np.int32).reshape(-1)
+        if counts.size != self.pet_count:
+            raise ValueError("counts must have one value for each PET")
+        if np.sum(counts) != data.size:
+            raise ValueError("counts must add up to the size of data")
+
+        ones = np.ones(self.pet_count, dtype=np.int32)
+        offsets = _offsets_(ones)
+        recv_counts = np.empty(self.pet_count, dtype=np.int32)
+        ESMP_VMAllToAllV(self.vm, counts, ones, offsets, recv_counts, ones,
+                         offsets)
+
+        recv = np.empty(np.sum(recv_counts), dtype=data.dtype)
+        ESMP_VMAllToAllV(self.vm, data, counts, _offsets_(counts), recv,
+                         recv_counts, _offsets_(recv_counts))
+        return recv, recv_counts
+
     def barrier(self):
         '''
         Collective VM communication call that blocks calling PET until 
         all PETs of the VM have issued the call.
+
+        :return: The wall time in seconds the calling PET waited, a measure
+            of its load imbalance since the last synchronization.
         '''
+        start = time.perf_counter()
         ESMP_VMBarrier(self.vm)
+        return time.perf_counter() - start
         
+    def gather(self, data, root=0):
+        """
+        Gather an array of the same shape from every PET onto the root PET.
+        This is a collective call.
+
+        *REQUIRED:*
+
+        :param ndarray data: the values of the current PET, of dtype
+            ``int32``, ``int64``, ``float32`` or ``float64``.
+
+        *OPTIONAL:*
+
+        :param int root: the PET receiving the data. Defaults to 0.
+
+        :return: On ``root``, an array of the same dtype with a leading
+            dimension of size :attr:`pet_count`, holding the ``data`` of each
+            PET in order. ``None`` on the other PETs.
+        """
+        data = _vm_array_(data)
+        if self.local_pet == root:
+            recv = np.empty((self.pet_count,) + data.shape, dtype=data.dtype)
+        else:
+            recv = np.empty(0, dtype=data.dtype)
+        ESMP_VMGather(self.vm, data, recv, data.size, root)
+
+        if self.local_pet != root:
+            return None
+        return recv
+
+    def gatherv(self, data, root=0):
+        """
+        Gather arrays of varying size from every PET onto the root PET. The
+        sizes are gathered first, so every PET may pass a different number
+        of values. This is a collective call.
+
+        *REQUIRED:*
+
+        :param ndarray data: the values of the current PET, of dtype
+            ``int32``, ``int64``, ``float32`` or ``float64``. It is flattened.
+
+        *OPTIONAL:*
+
+        :param int root: the PET receiving the data. Defaults to 0.
+
+        :return: On ``root``, a tuple of the 1D array of the same dtype
+            concatenating the ``data`` of each PET in order, and the
+            ``int32`` array of the number of values from each PET. ``None``
+            on the other PETs.
+        """
+        data = _vm_array_(data)
+        counts = self.gather(np.array([data.size], dtype=np.int32), root=root)
+        if self.local_pet == root:
+            counts = counts.reshape(-1)
+        else:
+            counts = np.zeros(self.pet_count, dtype=np.int32)
+        recv = np.empty(np.sum(counts), dtype=data.dtype)
+        ESMP_VMGatherV(self.vm, data, data.size, recv, counts,
+                       _offsets_(counts), root)
+
+        if self.local_pet != root:
+            return None
+        return recv, counts
+
+    def profile_summary(self):
+        """
+        Reduce the profiling records of all PETs, collected since profiling
+        was enabled with ``Manager(profile=True)``. See
+        :class:`~esmpy.api.profile.profile` for profiling a block of code.
+        This is a collective call.
+
+        :return: A dictionary mapping the name of each binding to the ESMF C
+            API called on any PET to a dictionary with its total call
+            ``count``, total ``time`` in seconds, the largest time of a single
+            PET ``time_max`` and total ``bytes`` of array arguments.
+        """
+        from esmpy.api.profile import _summarize_
+
+        return _summarize_(profiling.snapshot())
+
+    def scatter(self, data=None, root=0):
+        """
+        Scatter the parts of the same shape of an array on the root PET to
+        every PET. The dtype and shape are sent from the root PET, so the
+        other PETs need not pass ``data``. This is a collective call.
+
+        *OPTIONAL:*
+
+        :param ndarray data: on ``root``, the values to scatter, of dtype
+            ``int32``, ``int64``, ``float32`` or ``float64`` and with a
+            leading dimension of size :attr:`pet_count`. Ignored on the other
+            PETs.
+        :param int root: the PET sending the data. Defaults to 0.
+
+        :return: An array of the same dtype holding the part of the current
+            PET, of the shape of the trailing dimensions of ``data``.
+        """
+        def check(data):
+            if data.ndim == 0 or data.shape[0] != self.pet_count:
+                raise ValueError("data must have a leading dimension of size "
+                                 "pet_count")
+
+        dtype, shape = self._scatter_meta_(data, root, check)
+        if self.local_pet == root:
+            data = _vm_array_(data)
+        else:
+            data = np.empty(0, dtype=dtype)
+        recv = np.empty(shape[1:], dtype=dtype)
+        ESMP_VMScatter(self.vm, data, recv, recv.size, root)
+        return recv
+
+    def scatterv(self, data=None, counts=None, root=0):
+        """
+        Scatter consecutive parts of varying size of an array on the root
+        PET to every PET. The dtype and the sizes are sent from the root PET,
+        so the other PETs need not pass ``data`` or ``counts``. This is a
+        collective call.
+
+        *OPTIONAL:*
+
+        :param ndarray data: on ``root``, the values to scatter, of dtype
+            ``int32``, ``int64``, ``float32`` or ``float64``. It is
+            flattened. Ignored on the other PETs.
+        :param list counts: on ``root``, the number of consecutive values of
+            ``data`` to send to each PET, of length :attr:`pet_count`.
+            Ignored on the other PETs.
+        :param int root: the PET sending the data. Defaults to 0.
+
+        :return: The 1D array of the same dtype holding the part of the
+            current PET.
+        """
+        return self._scatterv_(data, counts, root)
+
     def set_moab(self, moab_on=True):
         """
         Set the Mesh backend to use MOAB or the Native ESMF mesh.
@@ -234,6 +510,71 @@ class Manager(object):
         '''
         ESMP_VMLogMemInfo(str)
 
+    def _scatter_meta_(self, data, root, check=None):
+        """
+        Return the dtype and shape of ``data`` on ``root`` on every PET, with
+        a single reduction. ``data`` is validated on ``root``, along with the
+        optional ``check`` called with it as an array, before the reduction,
+        so an invalid input raises on every PET instead of leaving the other
+        PETs blocked in the scatter. This is a collective call.
+        """
+        # error, typekind, ndim and shape, zero on the other PETs
+        meta = np.zeros(3 + _MAXDIMS, dtype=np.int64)
+        error = None
+        if self.local_pet == root:
+            try:
+                data = _vm_array_(data)
+                if data.ndim > _MAXDIMS:
+                    raise ValueError("data must have at most {0} "
+                                     "dimensions".format(_MAXDIMS))
+                if not isinstance(check, type(None)):
+                    check(data)
+                meta[1] = constants._Python2ESMFType[data.dtype.type]
+                meta[2] = data.ndim
+                meta[3:3 + data.ndim] = data.shape
+            except (TypeError, ValueError) as e:
+                error = e
+                meta[0] = 1 if isinstance(e, TypeError) else 2
+        meta = self.allreduce(meta, op=Reduce.MAX)
+
+        if meta[0] != 0:
+            if not isinstance(error, type(None)):
+                raise error
+            raise (TypeError if meta[0] == 1 else ValueError)(
+                "invalid data to scatter on PET {0}".format(root))
+
+        return constants._ESMF2PythonType[meta[1]], tuple(meta[3:3 + meta[2]])
+
+    def _scatterv_(self, data, counts, root, check=None):
+        """
+        :meth:`scatterv` with an optional ``check`` called with ``data`` as
+        an array on ``root`` before any collective, see
+        :meth:`_scatter_meta_`. This is a collective call.
+        """
+        def check_counts(data):
+            if not isinstance(check, type(None)):
+                check(data)
+            local_counts = np.array(counts, dtype=np.int32).reshape(-1)
+            if local_counts.size != self.pet_count:
+                raise ValueError("counts must have one value for each PET")
+            if np.sum(local_counts) != data.size:
+                raise ValueError("counts must add up to the size of data")
+
+        dtype, _ = self._scatter_meta_(data, root, check_counts)
+        if self.local_pet == root:
+            data = _vm_array_(data)
+            counts = np.array(counts, dtype=np.int32).reshape(-1)
+        else:
+            data = np.empty(0, dtype=dtype)
+            counts = np.zeros(self.pet_count, dtype=np.int32)
+
+        count = np.empty(1, dtype=np.int32)
+        ESMP_VMScatter(self.vm, counts, count, 1, root)
+        recv = np.empty(count[0], dtype=dtype)
+        ESMP_VMScatterV(self.vm, data, counts, _offsets_(counts), recv,
+                        recv.size, root)
+        return recv
+
     def _reduce_(self, sendBuf, recvBuf, count, reduceflag=Reduce.SUM, rootPet=0):
         '''
         Reduce data from sendBuf into recvBuf across the VM.\n
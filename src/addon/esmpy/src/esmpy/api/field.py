@@ -10,6 +10,8 @@ from esmpy.api.grid import *
 from esmpy.api.mesh import *
 from esmpy.api.locstream import *
 from esmpy.util.esmpyarray import *
+import esmpy.util.finalizers as finalizers
+from esmpy.api import trace
 
 #### Field class ##############################################################
 [node, element] = [0, 1]
@@ -72,6 +74,10 @@ class Field(object):
                 staggerloc=None,
                 meshloc=None,
                 ndbounds=None):
+        # the lifetime of the ESMF allocation, shared with shallow copies and
+        # the arrays aliasing ESMF memory
+        self._token = finalizers.Token()
+
         # optional arguments
         if isinstance(staggerloc, type(None)):
             staggerloc = StaggerLoc.CENTER
@@ -137,13 +143,39 @@ class Field(object):
         else:
             raise FieldDOError
 
-        # get data and bounds to create a new instance of this object
-        lbounds, ubounds = ESMP_FieldGetBounds(struct, rank)
-
-        # initialize field data
-        # TODO: MaskedArray gives better interpolation values than Array (171128 removed .copy from .data below
-        # self._data = MaskedArray(ESMP_FieldGetPtr(struct), None, typekind, ubounds-lbounds).data
-        self._data = ndarray_from_esmf(ESMP_FieldGetPtr(struct), typekind, ubounds-lbounds)
+        # Meshes and LocStreams have a single DE on each PET
+        if isinstance(grid, Grid):
+            local_decount = grid.local_decount
+        else:
+            local_decount = 1
+
+        # get data and bounds of every local DE to create a new instance of this object
+        self._local_data = []
+        self._local_lower_bounds = []
+        self._local_upper_bounds = []
+        for localde in range(local_decount):
+            lbounds, ubounds = ESMP_FieldGetBounds(struct, rank, localDe=localde)
+
+            # initialize field data
+            # TODO: MaskedArray gives better interpolation values than Array (171128 removed .copy from .data below
+            # self._data = MaskedArray(ESMP_FieldGetPtr(struct), None, typekind, ubounds-lbounds).data
+            self._local_data.append(ndarray_from_esmf(ESMP_FieldGetPtr(struct, localDe=localde),
+                                                      typekind, ubounds-lbounds,
+                                                      owner=self._token))
+            self._local_lower_bounds.append(lbounds)
+            self._local_upper_bounds.append(ubounds)
+
+        # the first local DE is the one of the single DE properties, a PET
+        # without DE holds empty data
+        if local_decount > 0:
+            self._data = self._local_data[0]
+            lbounds = self._local_lower_bounds[0]
+            ubounds = self._local_upper_bounds[0]
+        else:
+            self._data = np.zeros([0] * rank, dtype=constants._ESMF2PythonType[typekind])
+            lbounds = np.zeros(rank, dtype=np.int32)
+            ubounds = np.zeros(rank, dtype=np.int32)
+        self._local_decount = local_decount
         self._name = name
         self._type = typekind
         self._rank = rank
@@ -159,14 +191,13 @@ class Field(object):
         # for arbitrary metadata
         self._meta = {}
 
-        # register function with atexit
-        import atexit
-        atexit.register(self.__del__)
+        # release the ESMF allocation when the Field is garbage collected
+        self._finalizer = finalizers.register(self._token, ESMP_FieldDestroy,
+                                              finalizers.handle(self.struct,
+                                                                grid._token),
+                                              owner=self)
         self._finalized = False
 
-    def __del__(self):
-        self.destroy()
-
     def __getitem__(self, slc):
         if pet_count() > 1:
             raise SerialMethod
@@ -189,6 +220,10 @@ class Field(object):
         ret._upper_bounds = np.array(ret.data.shape, dtype=np.int32)
         # lower bounds do not need to be sliced yet because slicing is not yet enabled in parallel
 
+        # the single local DE of the slice
+        ret._local_data = [ret.data]
+        ret._local_upper_bounds = [ret.upper_bounds]
+
         return ret
 
     def __repr__(self):
@@ -255,6 +290,47 @@ class Field(object):
         """
         return self._lower_bounds
 
+    @property
+    def local_data(self):
+        """
+        :rtype: list
+        :return: The data of every DE of the :class:`~esmpy.api.field.Field`
+            on this PET, as numpy arrays directly aliased to the underlying
+            memory allocated by ESMF. The first of them is
+            :attr:`~esmpy.api.field.Field.data`, so a PET holding several DEs
+            of a :class:`~esmpy.api.grid.Grid`, e.g. several tiles of a cubed
+            sphere, only has access to the others through this list.
+        """
+        return self._local_data
+
+    @property
+    def local_decount(self):
+        """
+        :rtype: int
+        :return: The number of DEs of the :class:`~esmpy.api.field.Field` on
+            this PET, see :attr:`~esmpy.api.grid.Grid.local_decount`. On a
+            PET without DE, :attr:`~esmpy.api.field.Field.data` is empty.
+        """
+        return self._local_decount
+
+    @property
+    def local_lower_bounds(self):
+        """
+        :rtype: list
+        :return: The lower bounds of every DE of the
+            :class:`~esmpy.api.field.Field` on this PET.
+        """
+        return self._local_lower_bounds
+
+    @property
+    def local_upper_bounds(self):
+        """
+        :rtype: list
+        :return: The upper bounds of every DE of the
+            :class:`~esmpy.api.field.Field` on this PET.
+        """
+        return self._local_upper_bounds
+
     @property
     def meta(self):
         """
@@ -351,9 +427,58 @@ class Field(object):
         """
         if hasattr(self, '_finalized'):
             if self._finalized == False:
-                ESMP_FieldDestroy(self)
+                self._finalizer()
                 self._finalized = True
 
+    @trace.region("ESMPy Field gather")
+    def gather(self, root=0):
+        """
+        Gather the data of a :class:`~esmpy.api.field.Field` from every PET
+        into a global NumPy array on one PET. On a
+        :class:`~esmpy.api.grid.Grid`, the data of each DE is placed at its
+        :attr:`~esmpy.api.field.Field.local_lower_bounds` and
+        :attr:`~esmpy.api.field.Field.local_upper_bounds` in the global index
+        space. On a :class:`~esmpy.api.mesh.Mesh` or
+        :class:`~esmpy.api.locstream.LocStream`, the data of the PETs are
+        concatenated in PET order. Ungridded dimensions are kept as the
+        trailing dimensions of the global array. The raw data buffers are
+        sent with a single collective.
+
+        A ``ValueError`` is raised for a multi-tile
+        :class:`~esmpy.api.grid.Grid`, such as a cubed sphere.
+
+        This is a collective call.
+
+        *OPTIONAL:*
+
+        :param int root: the PET receiving the global array. Defaults to 0.
+
+        :return: The global ndarray on ``root``, ``None`` on the other PETs.
+        """
+        mg = Manager()
+        # a view of the Fortran ordered data unless there are several DEs
+        local = [data.ravel(order='F') for data in self.local_data]
+        if len(local) == 1:
+            local = local[0]
+        else:
+            local = np.concatenate(local + [np.empty(0, dtype=self.data.dtype)])
+
+        blocks = self._global_blocks_(root)
+        ret = mg.gatherv(local, root=root)
+        if mg.local_pet != root:
+            return None
+
+        values, _ = ret
+        ret = np.zeros(blocks[1], dtype=values.dtype, order='F')
+        offset = 0
+        for lb, ub in blocks[0]:
+            size = int(np.prod(ub - lb))
+            ret[tuple(slice(l, u) for l, u in zip(lb, ub))] = \
+                values[offset:offset + size].reshape(ub - lb, order='F')
+            offset += size
+
+        return ret
+
     def get_area(self):
         """
         Initialize an existing :class:`~esmpy.api.field.Field` with the areas of
@@ -364,6 +489,7 @@ class Field(object):
         # call into the ctypes layer
         ESMP_FieldRegridGetArea(self)
 
+    @trace.region("ESMPy Field read")
     def read(self, filename, variable, timeslice=None):
         """
         Read data into an existing :class:`~esmpy.api.field.Field` from a
@@ -382,7 +508,11 @@ class Field(object):
 
         *OPTIONAL:*
 
-        :param int timeslice: The number of timeslices to read.
+        :param int timeslice: The time slice to read, starting at 1. If
+            ``None``, the first time slice is read, or the whole variable if
+            it has no time dimension. To read several variables or time
+            slices from the same file, see
+            :func:`~esmpy.api.field.read_fields`.
         """
 
         assert (type(filename) is str)
@@ -391,7 +521,7 @@ class Field(object):
         # format defaults to NetCDF for now
         format = 1
 
-        if not isinstance(timeslice, int):
+        if not isinstance(timeslice, (int, type(None))):
             raise TypeError("timeslice must be a single integer value")
 
         local_timeslice = None
@@ -404,3 +534,326 @@ class Field(object):
                        variablename=variable,
                        timeslice=local_timeslice,
                        iofmt=format)
+
+    @trace.region("ESMPy Field scatter")
+    def scatter(self, global_array=None, root=0):
+        """
+        Scatter a global NumPy array on one PET into the data of a
+        :class:`~esmpy.api.field.Field` on every PET, the inverse of
+        :meth:`~esmpy.api.field.Field.gather`. Each PET receives the block of
+        its DEs only, with a single collective.
+
+        A ``ValueError`` is raised for a multi-tile
+        :class:`~esmpy.api.grid.Grid`, such as a cubed sphere.
+
+        This is a collective call.
+
+        *OPTIONAL:*
+
+        :param ndarray global_array: on ``root``, the global array, of the
+            shape returned by :meth:`~esmpy.api.field.Field.gather`. It is
+            cast to the type of the :class:`~esmpy.api.field.Field` if
+            needed. Ignored on the other PETs.
+        :param int root: the PET holding the global array. Defaults to 0.
+        """
+        mg = Manager()
+        blocks = self._global_blocks_(root)
+
+        # the global array is validated on root, and an error is raised on
+        # every PET by the scatter before any data are sent
+        send = None
+        counts = None
+        error = None
+        if mg.local_pet == root:
+            try:
+                global_array = np.asarray(global_array, dtype=self.data.dtype)
+                if global_array.shape != blocks[1]:
+                    raise ValueError("global_array must have the shape "
+                                     "{0}".format(blocks[1]))
+            except (TypeError, ValueError) as e:
+                error = e
+                send = np.empty(0, dtype=self.data.dtype)
+            else:
+                send = [np.empty(0, dtype=self.data.dtype)]
+                for lb, ub in blocks[0]:
+                    send.append(global_array[tuple(slice(l, u) for l, u in
+                                                   zip(lb, ub))].ravel(order='F'))
+                send = np.concatenate(send)
+                counts = blocks[2]
+
+        def check(data):
+            if not isinstance(error, type(None)):
+                raise error
+
+        values = mg._scatterv_(send, counts, root, check=check)
+
+        offset = 0
+        for data in self.local_data:
+            data[...] = values[offset:offset + data.size].reshape(data.shape,
+                                                                  order='F')
+            offset += data.size
+
+    def subset(self, grid):
+        """
+        Create a new :class:`~esmpy.api.field.Field` holding the part of this
+        :class:`~esmpy.api.field.Field` on a subset of its
+        :class:`~esmpy.api.grid.Grid` or
+        :class:`~esmpy.api.locstream.LocStream`. The subset is a distinct
+        ESMF allocation, so it can be used in a
+        :class:`~esmpy.api.regrid.Regrid` without the rest of the
+        :class:`~esmpy.api.field.Field`::
+
+            region = srcfield.grid.subset_bbox([(-10, 30), (35, 70)])
+            regional = srcfield.subset(region)
+
+        The data are copied across PETs on a
+        :class:`~esmpy.api.grid.Grid`. The name, type, stagger location and
+        ungridded dimensions are those of this
+        :class:`~esmpy.api.field.Field`.
+
+        This is a collective call.
+
+        *REQUIRED:*
+
+        :param grid: the subset, returned by
+            :meth:`~esmpy.api.grid.Grid.subset`,
+            :meth:`~esmpy.api.grid.Grid.subset_bbox`,
+            :meth:`~esmpy.api.locstream.LocStream.subset` or
+            :meth:`~esmpy.api.locstream.LocStream.subset_bbox` of the
+            discretization of this :class:`~esmpy.api.field.Field`.
+        :type grid: :class:`~esmpy.api.grid.Grid` or
+            :class:`~esmpy.api.locstream.LocStream`
+
+        :return: :class:`~esmpy.api.field.Field`
+        """
+        from esmpy.api.subset import _subset_field_
+
+        return _subset_field_(self, grid)
+
+    @trace.region("ESMPy Field write")
+    def write(self, filename, variable, timeslice=None, overwrite=False):
+        """
+        Write the data of a :class:`~esmpy.api.field.Field` to a NetCDF file.
+        Every PET writes its own part of the data in parallel through PIO,
+        so the data are never gathered on a single PET. Ungridded dimensions
+        are written as additional dimensions of the variable.
+
+        This is a collective call.
+
+        :note: This interface is not supported when ESMF is built with
+            ``ESMF_COMM=mpiuni``.
+
+        :note: This interface only supports a single DE on each PET.
+
+        *REQUIRED:*
+
+        :param str filename: The name of the NetCDF file.
+        :param str variable: The name of the data variable to write to file.
+
+        *OPTIONAL:*
+
+        :param int timeslice: The time slice to write, starting at 1. If
+            ``None``, the variable has no time dimension, or the next time
+            slice is written if it already has one.
+        :param bool overwrite: Allow overwriting the data of an existing
+            variable. Otherwise only new variables or time slices may be
+            written. Defaults to False.
+        """
+        if not isinstance(filename, str):
+            raise TypeError("filename must be a string")
+        if not isinstance(variable, str):
+            raise TypeError("variable must be a string")
+        if not isinstance(timeslice, (int, type(None))) or \
+                (isinstance(timeslice, int) and timeslice < 1):
+            raise ValueError("timeslice must be a positive integer")
+
+        # format defaults to NetCDF for now
+        format = 1
+
+        ESMP_FieldWrite(self, filename, variable, overwrite=overwrite,
+                        timeslice=timeslice, iofmt=format)
+
+    def _global_blocks_(self, root):
+        """
+        Gather the bounds of every DE onto ``root``. Return there the bounds
+        of the blocks of all PETs in PET and DE order, placed in the global
+        index space, the global shape and the number of values on each PET,
+        and ``None`` on the other PETs. This is a collective call.
+        """
+        # the bounds of the DEs of a multi-tile Grid are local to their tile,
+        # so the blocks would overlap in a single global array
+        if isinstance(self.grid, Grid) and self.grid.decount > 1:
+            raise ValueError("gathering or scattering the Fields of a "
+                             "multi-tile Grid is not supported")
+
+        mg = Manager()
+        bounds = [np.concatenate([lb, ub]) for lb, ub in
+                  zip(self.local_lower_bounds, self.local_upper_bounds)]
+        bounds = np.array(bounds, dtype=np.int32).reshape(-1)
+        ret = mg.gatherv(bounds, root=root)
+        if mg.local_pet != root:
+            return None
+
+        bounds, counts = ret
+        bounds = bounds.reshape(-1, 2, self.rank)
+        blocks = []
+        sizes = np.zeros(mg.pet_count, dtype=np.int32)
+        start = 0
+        offset = 0
+        for pet, count in enumerate(counts // (2 * self.rank)):
+            for lb, ub in bounds[start:start + count]:
+                if not isinstance(self.grid, Grid):
+                    # the bounds of a Mesh or LocStream are local to the PET,
+                    # its points follow those of the previous PETs
+                    lb = lb.copy()
+                    ub = ub.copy()
+                    ub[0] += offset - lb[0]
+                    lb[0] = offset
+                    offset = ub[0]
+                blocks.append((lb, ub))
+                sizes[pet] += np.prod(ub - lb)
+            start += count
+
+        shape = np.zeros(self.rank, dtype=np.int32)
+        for _, ub in blocks:
+            shape = np.maximum(shape, ub)
+
+        return blocks, tuple(int(n) for n in shape), sizes
+
+#### Field I/O ################################################################
+
+def _read_like_(field):
+    """
+    Create a :class:`~esmpy.api.field.Field` on the discretization of
+    ``field``, of the same type and without its last ungridded dimension,
+    to read one of its slices into.
+    """
+    ndbounds = None
+    if field.xd > 1:
+        ndbounds = field.ndbounds[:-1]
+
+    if isinstance(field.grid, Mesh):
+        return Field(field.grid, typekind=field.type, meshloc=field.staggerloc,
+                     ndbounds=ndbounds)
+    return Field(field.grid, typekind=field.type, staggerloc=field.staggerloc,
+                 ndbounds=ndbounds)
+
+@trace.region("ESMPy Field read_fields")
+def read_fields(filename, fields, variables, timeslices=None,
+                max_temporaries=None):
+    """
+    Read several variables and time slices of a CF-compliant NetCDF file
+    into :class:`Fields <esmpy.api.field.Field>` with as few collective
+    opens of the file as possible, a single one for a list of
+    :class:`Fields <esmpy.api.field.Field>`, instead of one open and
+    decomposition setup for each call to
+    :meth:`~esmpy.api.field.Field.read`. Each of the variables is
+    read at each of the time slices, in variable-major order::
+
+        # fields[v][t] receives variables[v] at timeslices[t]
+        read_fields("ingest.nc", fields, ["tas", "pr"], timeslices=[1, 2, 3])
+
+        # or all of them along the last ungridded dimension of one Field
+        field = Field(grid, ndbounds=[6])
+        read_fields("ingest.nc", field, ["tas", "pr"], timeslices=[1, 2, 3])
+
+    ESMF cannot read into a part of a :class:`~esmpy.api.field.Field`, so
+    with a single :class:`~esmpy.api.field.Field` each slice is read into a
+    temporary :class:`~esmpy.api.field.Field` the size of one slice and
+    copied into place. By default all of the slices are read with a single
+    open of the file, which takes as much extra memory as the whole
+    :class:`~esmpy.api.field.Field`. ``max_temporaries`` bounds that memory
+    to as many slices, at the cost of one open of the file for each group of
+    ``max_temporaries`` slices, the temporaries being reused by each open. A
+    list of :class:`Fields <esmpy.api.field.Field>` is read into directly,
+    with a single open and no extra memory.
+
+    This is a collective call.
+
+    :note: This interface is not supported when ESMF is built with
+        ``ESMF_COMM=mpiuni``.
+
+    *REQUIRED:*
+
+    :param str filename: The name of the NetCDF file.
+    :param fields: the :class:`Fields <esmpy.api.field.Field>` to read
+        into. Either a list of one list of
+        :class:`Fields <esmpy.api.field.Field>` per variable, with one
+        :class:`~esmpy.api.field.Field` per time slice, the same in a flat
+        list, or a single :class:`~esmpy.api.field.Field` whose last
+        ungridded dimension has one entry per variable and time slice, in
+        the same order.
+    :type fields: list or :class:`~esmpy.api.field.Field`
+    :param variables: The name of the data variable, or list of names of
+        the data variables, to read from file.
+    :type variables: str or list
+
+    *OPTIONAL:*
+
+    :param list timeslices: The time slices to read, starting at 1. If
+        ``None``, the first time slice is read, or the whole variables if
+        they have no time dimension.
+    :param int max_temporaries: the largest number of temporary
+        :class:`Fields <esmpy.api.field.Field>` read into at once with a
+        single :class:`~esmpy.api.field.Field`, the file being opened once
+        for each group of them. If ``None``, all of the slices are read with
+        a single open. Ignored with a list of
+        :class:`Fields <esmpy.api.field.Field>`.
+    """
+    if not isinstance(filename, str):
+        raise TypeError("filename must be a string")
+    if isinstance(variables, str):
+        variables = [variables]
+    if len(variables) == 0 or \
+            not all(isinstance(variable, str) for variable in variables):
+        raise TypeError("variables must be a string or a list of strings")
+    if isinstance(timeslices, type(None)):
+        timeslices = [1]
+    elif isinstance(timeslices, int):
+        timeslices = [timeslices]
+    if len(timeslices) == 0 or \
+            not all(isinstance(timeslice, (int, np.integer)) and timeslice > 0
+                    for timeslice in timeslices):
+        raise ValueError("timeslices must be a list of positive integers")
+
+    count = len(variables) * len(timeslices)
+    names = [variable for variable in variables for _ in timeslices]
+    slices = [timeslice for _ in variables for timeslice in timeslices]
+
+    # format defaults to NetCDF for now
+    format = 1
+
+    if isinstance(fields, Field):
+        if fields.xd == 0 or fields.ndbounds[-1] != count:
+            raise ValueError("the last ungridded dimension of the Field must "
+                             "have {0} entries".format(count))
+        if isinstance(max_temporaries, type(None)):
+            max_temporaries = count
+        if max_temporaries < 1:
+            raise ValueError("max_temporaries must be a positive integer")
+
+        # the same temporaries are reused for every group of slices
+        targets = []
+        try:
+            for _ in range(min(max_temporaries, count)):
+                targets.append(_read_like_(fields))
+            for start in range(0, count, len(targets)):
+                stop = min(start + len(targets), count)
+                ESMP_FieldReadMulti(targets[:stop - start], filename,
+                                    names[start:stop], slices[start:stop],
+                                    iofmt=format)
+                for k, target in zip(range(start, stop), targets):
+                    for data, values in zip(fields.local_data,
+                                            target.local_data):
+                        data[..., k] = values
+        finally:
+            for target in targets:
+                target.destroy()
+    else:
+        fields = [field for item in fields for field in
+                  (item if isinstance(item, (list, tuple)) else [item])]
+        if len(fields) != count:
+            raise ValueError("{0} Fields are needed, one for each variable "
+                             "and time slice".format(count))
+
+        ESMP_FieldReadMulti(fields, filename, names, slices, iofmt=format)
@@ -12,9 +12,26 @@ from copy import copy
 from esmpy.api.esmpymanager import *
 from esmpy.util.esmpyarray import ndarray_from_esmf
 import esmpy.api.constants as constants
-from esmpy.util.slicing import get_formatted_slice, get_none_or_slice, get_none_or_bound, get_none_or_ssslice
+import esmpy.util.finalizers as finalizers
+from esmpy.api import trace
+from esmpy.util.slicing import get_formatted_slice, get_none_or_slice, get_none_or_bound, get_none_or_ssslice, \
+    get_ssslice, get_none_or_axes_bound, get_none_or_list
 
 
+#### UTILITIES ################################################################
+
+def _axis_edges_(bounds, size, name):
+    """
+    Return the ``size + 1`` cell edges of an axis given either as edges or as
+    CF bounds of shape ``(size, 2)``.
+    """
+    bounds = np.asarray(bounds)
+    if bounds.shape == (size + 1,):
+        return bounds
+    if bounds.shape == (size, 2):
+        return np.append(bounds[:, 0], bounds[-1, 1])
+    raise ValueError("{0} must have shape ({1},) or ({2}, 2)".format(name, size + 1, size))
+
 #### Grid class #########################################################
 
 class Grid(object):
@@ -61,6 +78,10 @@ class Grid(object):
     :param TypeKind coord_typekind: Type of the :class:`~esmpy.api.grid.Grid`
         coordinates.
         If ``None``, defaults to :attr:`~esmpy.api.constants.TypeKind.R8`.
+    :param bool rectilinear: Set to ``True`` to hold the coordinates of each
+        dimension in a 1D array along that dimension instead of an array of the
+        size of the :class:`~esmpy.api.grid.Grid`, see
+        :meth:`~esmpy.api.grid.Grid.from_axes`. Defaults to ``False``.
 
     **Created either from file or in-memory:**
 
@@ -136,6 +157,7 @@ class Grid(object):
     # :param list deLabelList:
 
     @initialize
+    @trace.region("ESMPy Grid create")
     def __init__(self, max_index=None,
                  num_peri_dims=0,
                  periodic_dim=None,
@@ -158,8 +180,13 @@ class Grid(object):
                  regDecompPTile=None,
                  #decompFlagPTile=None,
                  #deLabelList=None,
-                 name=None):
+                 name=None,
+                 rectilinear=False):
  
+        # the lifetime of the ESMF allocation, shared with shallow copies and
+        # the arrays aliasing ESMF memory
+        self._token = finalizers.Token()
+
         # initialize the from_file flag to False
         from_file = False
         cubed_sphere = False
@@ -229,6 +256,8 @@ class Grid(object):
                 warnings.warn("coord_typekind is only used for grids created in memory, this argument will be ignored.")
             if not isinstance(staggerloc, type(None)):
                 warnings.warn("staggerloc is only used for grids created in memory, this argument will be ignored.")
+            if rectilinear:
+                warnings.warn("rectilinear is only used for grids created in memory, this argument will be ignored.")
             # raise warnings on all cubed sphere args
             if tilesize:
                 warnings.warn("tilesize is only used for cubed sphere grids, this argument will be ignored.")
@@ -261,6 +290,8 @@ class Grid(object):
                 warnings.warn("coord_typekind is not used to create a cubed sphere grid, this argument will be ignored.")
             if not isinstance(staggerloc, type(None)):
                 warnings.warn("staggerloc is not used to create a cubed sphere grid, this argument will be ignored.")
+            if rectilinear:
+                warnings.warn("rectilinear is not used to create a cubed sphere grid, this argument will be ignored.")
             # raise warnings on all from file args
             if not isinstance(filename, type(None)):
                 warnings.warn("filename is not used to create a cubed sphere grid, this argument will be ignored.")
@@ -294,7 +325,8 @@ class Grid(object):
         self._periodic_dim = periodic_dim
         self._pole_dim = pole_dim
         self._coord_sys = coord_sys
-        self._ndims = None # Applies to Gridspec only
+        self._ndims = None # Applies to Gridspec and rectilinear grids only
+        self._rectilinear = False
         self._has_corners = False
 
         if isinstance(num_peri_dims, type(None)):
@@ -406,7 +438,26 @@ class Grid(object):
         else:
             # ctypes stuff
             self._struct = ESMP_GridStruct()
-            if self.num_peri_dims == 0:
+            if rectilinear:
+                if self.num_peri_dims == 0:
+                    self._struct = ESMP_GridCreateRectilinear(self.max_index,
+                                                              coordSys=coord_sys,
+                                                              coordTypeKind=coord_typekind)
+                elif (self.num_peri_dims == 1):
+                    # the periodic dimension selects the 1PeriDim creation
+                    if periodic_dim == None:
+                        periodic_dim = 0
+                        self._periodic_dim = 0
+                        self._pole_dim = 1
+                    self._struct = ESMP_GridCreateRectilinear(self.max_index,
+                                                              polekindflag=pole_kind,
+                                                              periodicDim=periodic_dim,
+                                                              poleDim=pole_dim,
+                                                              coordSys=coord_sys,
+                                                              coordTypeKind=coord_typekind)
+                else:
+                    raise TypeError("Number of periodic dimensions should be 0 or 1")
+            elif self.num_peri_dims == 0:
                 self._struct = ESMP_GridCreateNoPeriDim(self.max_index,
                                                        coordSys=coord_sys,
                                                        coordTypeKind=coord_typekind)
@@ -423,9 +474,13 @@ class Grid(object):
             else:
                 raise TypeError("Number of periodic dimensions should be 0 or 1")
 
-            # grid rank
+            # grid rank, the coordinates of a rectilinear grid are 1D
             self._rank = self.max_index.size
-            self._ndims = self._rank
+            if rectilinear:
+                self._ndims = 1
+                self._rectilinear = True
+            else:
+                self._ndims = self._rank
 
         # grid type
         if isinstance(coord_typekind, type(None)):
@@ -451,28 +506,22 @@ class Grid(object):
         # area[staggerloc]
         self._area = [None for a in range(2**self.rank)]
 
-        # if self.decount == 1:
-        # elif self.decount > 1:
-        #     # lower_bounds[de][staggerLoc]
-        #     self._lower_bounds = [[None for a in range(2**self.rank)] \
-        #                            for b in range(self.decount)]
-        #     # upper_bounds[de][staggerLoc]
-        #     self._upper_bounds = [[None for a in range(2**self.rank)] \
-        #                            for b in range(self.decount)]
-        #     # size[de][staggerloc]
-        #     self._size = [[None for a in range(2**self.rank)] \
-        #                   for b in range(self.decount)]
-        #     # coords[de][staggerLoc][coord_dim]
-        #     self._coords = [[[None for a in range(self.rank)] \
-        #                      for b in range(2**self.rank)] \
-        #                     for c in range(self.decount)]
-        #     # mask[de][staggerloc]
-        #     self._mask = [[None for a in range(2**self.rank)] \
-        #                   for b in range(self.decount)]
-        #     # area[de][staggerloc]
-        #     self._area = [[None for a in range(2**self.rank)] \
-        #                   for b in range(self.decount)]
-        # else: raise IndexError
+        # the number of DEs on this PET, which is 0 on the PETs without a
+        # part of the grid and may be larger than 1, e.g. for cubed spheres
+        self._local_decount = ESMP_GridGetLocalDECount(self)
+        # local_lower_bounds[staggerLoc][localde]
+        self._local_lower_bounds = [[None for a in range(self.local_decount)] \
+                                    for b in range(2**self.rank)]
+        # local_upper_bounds[staggerLoc][localde]
+        self._local_upper_bounds = [[None for a in range(self.local_decount)] \
+                                    for b in range(2**self.rank)]
+        # local_coords[staggerLoc][coord_dim][localde], None until added
+        self._local_coords = [[None for a in range(self.rank)] \
+                              for b in range(2**self.rank)]
+        # local_mask[staggerloc][localde], None until added
+        self._local_mask = [None for a in range(2**self.rank)]
+        # local_area[staggerloc][localde], None until added
+        self._local_area = [None for a in range(2**self.rank)]
 
         # Add coordinates if a staggerloc is specified
         if not isinstance(staggerloc, type(None)):
@@ -490,12 +539,101 @@ class Grid(object):
         # for arbitrary metadata
         self._meta = {}
 
-        # regist with atexit
-        import atexit; atexit.register(self.__del__)
+        # release the ESMF allocation when the Grid is garbage collected
+        self._finalizer = finalizers.register(self._token, ESMP_GridDestroy,
+                                              finalizers.handle(self.struct),
+                                              owner=self)
         self._finalized = False
 
-    def __del__(self):
-        self.destroy()
+    @classmethod
+    def from_axes(cls, lon, lat, lon_bounds=None, lat_bounds=None,
+                  periodic=False, pole_kind=None, coord_sys=None,
+                  coord_typekind=None):
+        """
+        Create a 2D :attr:`~esmpy.api.grid.Grid.rectilinear`
+        :class:`~esmpy.api.grid.Grid` from the 1D coordinates of its axes.
+        The coordinates are held in 1D arrays at the center stagger location,
+        and at the corner stagger location if the bounds are given, so a
+        :class:`~esmpy.api.grid.Grid` of ``nlon x nlat`` cells holds
+        ``nlon + nlat`` values per stagger location instead of
+        ``2 x nlon x nlat``::
+
+            lon_bounds = np.linspace(0, 360, 7201)
+            lat_bounds = np.linspace(-90, 90, 3601)
+            lon = (lon_bounds[:-1] + lon_bounds[1:]) / 2
+            lat = (lat_bounds[:-1] + lat_bounds[1:]) / 2
+            grid = esmpy.Grid.from_axes(lon, lat, lon_bounds=lon_bounds,
+                                        lat_bounds=lat_bounds, periodic=True)
+
+        Each PET sets the part of the axes it owns.
+
+        *REQUIRED:*
+
+        :param lon: The coordinates of the cell centers along the first
+            dimension, e.g. the longitudes.
+        :param lat: The coordinates of the cell centers along the second
+            dimension, e.g. the latitudes.
+
+        *OPTIONAL:*
+
+        :param lon_bounds: The cell bounds along the first dimension, either as
+            the ``nlon + 1`` cell edges or as CF bounds of shape ``(nlon, 2)``.
+        :param lat_bounds: The cell bounds along the second dimension, either
+            as the ``nlat + 1`` cell edges or as CF bounds of shape
+            ``(nlat, 2)``.
+        :param bool periodic: Set to ``True`` if the first dimension is
+            periodic, e.g. for global longitudes. Defaults to ``False``.
+        :param PoleKind pole_kind: Two item list which specifies the type of
+            connection which occurs at the ends of the second dimension of a
+            periodic :class:`~esmpy.api.grid.Grid`.
+            If ``None``, defaults to
+            :attr:`~esmpy.api.constants.PoleKind.MONOPOLE`.
+        :param CoordSys coord_sys: Coordinate system for the
+            :class:`~esmpy.api.grid.Grid`.
+            If ``None``, defaults to
+            :attr:`~esmpy.api.constants.CoordSys.SPH_DEG`.
+        :param TypeKind coord_typekind: Type of the
+            :class:`~esmpy.api.grid.Grid` coordinates.
+            If ``None``, defaults to :attr:`~esmpy.api.constants.TypeKind.R8`.
+
+        :return: A :class:`~esmpy.api.grid.Grid`
+        """
+        axes = [np.asarray(lon), np.asarray(lat)]
+        for axis, name in zip(axes, ("lon", "lat")):
+            if axis.ndim != 1:
+                raise ValueError("{0} must be a 1D array".format(name))
+        if (lon_bounds is None) != (lat_bounds is None):
+            raise ValueError("lon_bounds and lat_bounds must be given together")
+
+        staggerloc = [StaggerLoc.CENTER]
+        edges = None
+        if lon_bounds is not None:
+            staggerloc.append(StaggerLoc.CORNER)
+            edges = [_axis_edges_(lon_bounds, axes[0].size, "lon_bounds"),
+                     _axis_edges_(lat_bounds, axes[1].size, "lat_bounds")]
+
+        grid = cls(np.array([axes[0].size, axes[1].size], dtype=np.int32),
+                   num_peri_dims=1 if periodic else 0,
+                   pole_kind=pole_kind,
+                   coord_sys=coord_sys,
+                   coord_typekind=coord_typekind,
+                   staggerloc=staggerloc,
+                   rectilinear=True)
+
+        # the corners of a periodic dimension omit the last edge, which is
+        # the first one
+        for stagger, values in ((StaggerLoc.CENTER, axes),
+                                (StaggerLoc.CORNER, edges)):
+            if values is None:
+                continue
+            for localde in range(grid.local_decount):
+                lb = grid.local_lower_bounds[stagger][localde]
+                ub = grid.local_upper_bounds[stagger][localde]
+                for coord_dim in range(grid.rank):
+                    grid.local_coords[stagger][coord_dim][localde][...] = \
+                        values[coord_dim][lb[coord_dim]:ub[coord_dim]]
+
+        return grid
 
     def __getitem__(self, slc):
         # no slicing in parallel
@@ -510,17 +648,34 @@ class Grid(object):
         ret = self.copy()
 
         # coords, mask and area
-        ret._coords = [[get_none_or_ssslice(get_none_or_slice(get_none_or_slice(self.coords, stagger), coorddim), slc,
-                                            stagger, self.rank)
-                        for coorddim in range(self.rank)] for stagger in range(2 ** self.rank)]
+        if self.rectilinear:
+            # the 1D coordinates of a dimension are sliced along that dimension
+            ret._coords = [[get_none_or_slice(self.coords[stagger][coorddim],
+                                              get_ssslice(slc, stagger, self.rank)[coorddim])
+                            for coorddim in range(self.rank)] for stagger in range(2 ** self.rank)]
+        else:
+            ret._coords = [[get_none_or_ssslice(get_none_or_slice(get_none_or_slice(self.coords, stagger), coorddim), slc,
+                                                stagger, self.rank)
+                            for coorddim in range(self.rank)] for stagger in range(2 ** self.rank)]
         ret._mask = [get_none_or_slice(get_none_or_slice(self.mask, stagger), slc) for stagger in range(2 ** self.rank)]
         ret._area = [get_none_or_slice(get_none_or_slice(self.area, stagger), slc) for stagger in range(2 ** self.rank)]
 
         # upper bounds are "sliced" by taking the shape of the coords
-        ret._upper_bounds = [get_none_or_bound(get_none_or_slice(ret.coords, stagger), 0) for stagger in
-                             range(2 ** self.rank)]
+        if self.rectilinear:
+            ret._upper_bounds = [get_none_or_axes_bound(ret.coords, stagger) for stagger in
+                                 range(2 ** self.rank)]
+        else:
+            ret._upper_bounds = [get_none_or_bound(get_none_or_slice(ret.coords, stagger), 0) for stagger in
+                                 range(2 ** self.rank)]
         # lower bounds do not need to be sliced yet because slicing is not yet enabled in parallel
 
+        # the single local DE of the slice
+        ret._local_coords = [[get_none_or_list(ret.coords[stagger][coorddim])
+                              for coorddim in range(self.rank)] for stagger in range(2 ** self.rank)]
+        ret._local_mask = [get_none_or_list(ret.mask[stagger]) for stagger in range(2 ** self.rank)]
+        ret._local_area = [get_none_or_list(ret.area[stagger]) for stagger in range(2 ** self.rank)]
+        ret._local_upper_bounds = [[ub] for ub in ret.upper_bounds]
+
         return ret
 
     def __repr__(self):
@@ -586,7 +741,9 @@ class Grid(object):
             ``upper_bounds - lower_bounds``, where the first index represents
             the stagger locations of the :class:`~esmpy.api.grid.Grid` and the
             second index represent the coordinate dimensions of the
-            :class:`~esmpy.api.grid.Grid`.
+            :class:`~esmpy.api.grid.Grid`. The coordinates of a
+            :attr:`~esmpy.api.grid.Grid.rectilinear`
+            :class:`~esmpy.api.grid.Grid` are 1D arrays along their dimension.
         :return: The coordinates of the :class:`~esmpy.api.grid.Grid`.
         """
 
@@ -621,6 +778,87 @@ class Grid(object):
 
         return self._has_corners
 
+    @property
+    def local_area(self):
+        """
+        :rtype: A list with an entry for every stagger location of the
+            :class:`~esmpy.api.grid.Grid`, each a list of numpy arrays with an
+            entry for every local DE, or ``None`` if no area was added.
+        :return: The :class:`~esmpy.api.grid.Grid` cell areas of every DE on
+            this PET, see :attr:`~esmpy.api.grid.Grid.local_coords`.
+        """
+
+        return self._local_area
+
+    @property
+    def local_coords(self):
+        """
+        :rtype: A 2D list with an entry for every stagger location and
+            coordinate dimension of the :class:`~esmpy.api.grid.Grid`, each a
+            list of numpy arrays with an entry for every local DE, or ``None``
+            if no coordinates were added.
+        :return: The coordinates of every DE of the
+            :class:`~esmpy.api.grid.Grid` on this PET, directly aliased to the
+            underlying memory allocated by ESMF. The arrays of DE ``localde``
+            have the size given by ``local_upper_bounds[stagger][localde] -
+            local_lower_bounds[stagger][localde]``. The arrays of the first
+            local DE are those of :attr:`~esmpy.api.grid.Grid.coords`, so a
+            PET holding several DEs, e.g. several tiles of a cubed sphere,
+            only has access to the others through this list.
+        """
+
+        return self._local_coords
+
+    @property
+    def local_decount(self):
+        """
+        :rtype: int
+        :return: The number of DEs of the :class:`~esmpy.api.grid.Grid` on
+            this PET. This is ``0`` on the PETs which hold no part of the
+            :class:`~esmpy.api.grid.Grid`, for which
+            :attr:`~esmpy.api.grid.Grid.coords`,
+            :attr:`~esmpy.api.grid.Grid.mask` and
+            :attr:`~esmpy.api.grid.Grid.area` stay ``None``.
+        """
+
+        return self._local_decount
+
+    @property
+    def local_lower_bounds(self):
+        """
+        :rtype: A list with an entry for every stagger location of the
+            :class:`~esmpy.api.grid.Grid`, each a list of numpy arrays with an
+            entry for every local DE.
+        :return: The lower bounds of every DE of the
+            :class:`~esmpy.api.grid.Grid` on this PET.
+        """
+
+        return self._local_lower_bounds
+
+    @property
+    def local_mask(self):
+        """
+        :rtype: A list with an entry for every stagger location of the
+            :class:`~esmpy.api.grid.Grid`, each a list of numpy arrays with an
+            entry for every local DE, or ``None`` if no mask was added.
+        :return: The mask of every DE of the :class:`~esmpy.api.grid.Grid` on
+            this PET, see :attr:`~esmpy.api.grid.Grid.local_coords`.
+        """
+
+        return self._local_mask
+
+    @property
+    def local_upper_bounds(self):
+        """
+        :rtype: A list with an entry for every stagger location of the
+            :class:`~esmpy.api.grid.Grid`, each a list of numpy arrays with an
+            entry for every local DE.
+        :return: The upper bounds of every DE of the
+            :class:`~esmpy.api.grid.Grid` on this PET.
+        """
+
+        return self._local_upper_bounds
+
     @property
     def lower_bounds(self):
         """
@@ -745,6 +983,17 @@ class Grid(object):
 
         return self._rank
 
+    @property
+    def rectilinear(self):
+        """
+        :rtype: bool
+        :return: Whether the coordinates of each dimension of the
+            :class:`~esmpy.api.grid.Grid` are held in a 1D array along that
+            dimension.
+        """
+
+        return self._rectilinear
+
     @property
     def size(self):
         """
@@ -826,7 +1075,7 @@ class Grid(object):
                 staggerloc = [staggerloc]
 
         for stagger in staggerloc:
-            if not isinstance(self.coords[stagger][0], type(None)):
+            if not isinstance(self.local_coords[stagger][0], type(None)):
                 warnings.warn("This coordinate has already been added.")
             else:
                 # request that ESMF allocate space for the coordinates
@@ -877,11 +1126,11 @@ class Grid(object):
         for stagger in staggerloc:
             # check to see if they are done
             if item == GridItem.MASK:
-                if not isinstance(self.mask[stagger], type(None)):
+                if not isinstance(self.local_mask[stagger], type(None)):
                     raise GridItemAlreadyLinked
                 done = False
             elif item == GridItem.AREA:
-                if not isinstance(self.area[stagger], type(None)):
+                if not isinstance(self.local_area[stagger], type(None)):
                     raise GridItemAlreadyLinked
                 done = False
             else:
@@ -922,10 +1171,10 @@ class Grid(object):
         """
         if hasattr(self, '_finalized'):
             if not self._finalized:
-                ESMP_GridDestroy(self)
+                self._finalizer()
                 self._finalized = True
 
-    def get_coords(self, coord_dim, staggerloc=None):
+    def get_coords(self, coord_dim, staggerloc=None, localde=0):
         """
         Return a numpy array of coordinates at a specified stagger 
         location. The returned array is NOT a copy, it is
@@ -945,6 +1194,8 @@ class Grid(object):
             :attr:`~esmpy.api.constants.StaggerLoc.CENTER`
             in 2D and :attr:`~esmpy.api.constants.StaggerLoc.CENTER_VCENTER` in
             3D.
+        :param int localde: The local DE of the coordinate values, in
+            ``range(local_decount)``. Defaults to ``0``.
 
         :return: A numpy array of coordinate values at the specified staggerloc.
         """
@@ -958,12 +1209,12 @@ class Grid(object):
         elif isinstance(type(staggerloc), tuple):
             raise GridSingleStaggerloc
 
-        assert (self.coords[staggerloc][coord_dim] is not None)
-        ret = self.coords[staggerloc][coord_dim]
+        assert (self.local_coords[staggerloc][coord_dim] is not None)
+        ret = self.local_coords[staggerloc][coord_dim][localde]
 
         return ret
 
-    def get_item(self, item, staggerloc=None):
+    def get_item(self, item, staggerloc=None, localde=0):
         """
         Return a numpy array of item values at a specified stagger
         location.  The returned array is NOT a copy, it is
@@ -980,6 +1231,8 @@ class Grid(object):
             values. If ``None``, defaults to
             :attr:`~esmpy.api.constants.StaggerLoc.CENTER` in 2D and
             :attr:`~esmpy.api.constants.StaggerLoc.CENTER_VCENTER` in 3D.
+        :param int localde: The local DE of the item values, in
+            ``range(local_decount)``. Defaults to ``0``.
 
         :return: A numpy array of mask or area values at the specified staggerloc.
         """
@@ -995,16 +1248,79 @@ class Grid(object):
 
         # selec the grid item
         if item == GridItem.MASK:
-            assert (self.mask[staggerloc] is not None)
-            ret = self.mask[staggerloc]
+            assert (self.local_mask[staggerloc] is not None)
+            ret = self.local_mask[staggerloc][localde]
         elif item == GridItem.AREA:
-            assert (self.area[staggerloc] is not None)
-            ret = self.area[staggerloc]
+            assert (self.local_area[staggerloc] is not None)
+            ret = self.local_area[staggerloc][localde]
         else:
             raise GridItemNotSupported
 
         return ret
 
+    def subset(self, lower, upper):
+        """
+        Create a new :class:`~esmpy.api.grid.Grid` from the cells of the
+        global index box ``[lower, upper)`` of this
+        :class:`~esmpy.api.grid.Grid`, which may span any number of PETs.
+        Unlike slicing, the subset is a distinct ESMF allocation which is
+        decomposed over all PETs, so a :class:`~esmpy.api.regrid.Regrid` on it
+        only searches the region::
+
+            region = grid.subset([200, 300], [260, 380])
+            srcfield = esmpy.Field(region)
+            # or, to keep data already held on the global Grid
+            srcfield = globalfield.subset(region)
+
+        The coordinates, mask and area of all stagger locations are copied
+        across PETs. On the periodic dimension, the box may wrap around the
+        edge of the :class:`~esmpy.api.grid.Grid`, with ``upper`` up to
+        ``lower`` plus the number of cells of the dimension. The subset keeps
+        the periodicity of a dimension it spans entirely, and is not periodic
+        otherwise. Multi-tile grids, e.g. cubed spheres, are not supported.
+
+        This is a collective call.
+
+        *REQUIRED:*
+
+        :param list lower: the 0-based global index of the first cell of the
+            subset in each dimension.
+        :param list upper: the 0-based global index one past the last cell
+            of the subset in each dimension.
+
+        :return: :class:`~esmpy.api.grid.Grid`
+        """
+        from esmpy.api.subset import _subset_grid_
+
+        return _subset_grid_(self, lower, upper)
+
+    def subset_bbox(self, bounds):
+        """
+        Create a new :class:`~esmpy.api.grid.Grid` from the smallest global
+        index box holding all cell centers within ``bounds``, see
+        :meth:`~esmpy.api.grid.Grid.subset`. Longitudes wrap around, so
+        ``(350, 10)`` selects the cells across the prime meridian. On a
+        periodic :class:`~esmpy.api.grid.Grid` the index box of these cells
+        wraps around its periodic edge as well, while on a non-periodic one it
+        spans the whole dimension if they are on both sides of the edge. A
+        :class:`~esmpy.api.grid.Grid` created with
+        :attr:`~esmpy.api.constants.CoordSys.CART` coordinates does not wrap
+        around.
+
+        This is a collective call.
+
+        *REQUIRED:*
+
+        :param list bounds: a ``(min, max)`` pair of inclusive bounds for
+            each coordinate dimension, e.g.
+            ``[(lon_min, lon_max), (lat_min, lat_max)]``.
+
+        :return: :class:`~esmpy.api.grid.Grid`
+        """
+        from esmpy.api.subset import _subset_grid_bbox_
+
+        return _subset_grid_bbox_(self, bounds)
+
     def set_coords(self, staggerloc, item_data):
         raise MethodNotImplemented
         # check sizes
@@ -1023,99 +1339,119 @@ class Grid(object):
     ################ Helper functions ##########################################
 
     def _verify_grid_bounds_(self, stagger, localde):
-        if isinstance(self.lower_bounds[stagger], type(None)):
+        if isinstance(self.local_lower_bounds[stagger][localde], type(None)):
             try:
                 lb, ub = ESMP_GridGetCoordBounds(self, staggerloc=stagger, localde=localde)
             except:
                 raise GridBoundsNotCreated
 
-            self._lower_bounds[stagger] = np.copy(lb)
-            self._upper_bounds[stagger] = np.copy(ub)
+            self._local_lower_bounds[stagger][localde] = np.copy(lb)
+            self._local_upper_bounds[stagger][localde] = np.copy(ub)
 
-            # find the local size of this stagger
-            self._size[stagger] = np.array(self.upper_bounds[stagger] -
-                                       self.lower_bounds[stagger])
+            # the first local DE is the one of the single DE properties
+            if localde == 0:
+                self._lower_bounds[stagger] = self.local_lower_bounds[stagger][0]
+                self._upper_bounds[stagger] = self.local_upper_bounds[stagger][0]
+
+                # find the local size of this stagger
+                self._size[stagger] = np.array(self.upper_bounds[stagger] -
+                                               self.lower_bounds[stagger])
         else:
             lb, ub = ESMP_GridGetCoordBounds(self, staggerloc=stagger, localde=localde)
-            assert(self.lower_bounds[stagger].all() == lb.all())
-            assert(self.upper_bounds[stagger].all() == ub.all())
-            assert(self.size[stagger].all() == np.array(ub-lb).all())
-
-    def _allocate_coords_(self, stagger, localde=0, from_file=False):
-        # this could be one of several entry points to the grid,
-        # verify that bounds and other necessary data are available
-        self._verify_grid_bounds_(stagger, localde)
-
-        # allocate space for the coordinates on the Python side
-        self._coords[stagger][0] = np.zeros(shape = (self.size[stagger]),
-                                            dtype = constants._ESMF2PythonType[self.type])
-        self._coords[stagger][1] = np.zeros(shape = (self.size[stagger]),
-                                            dtype = constants._ESMF2PythonType[self.type])
-        if self.rank == 3:
-            self._coords[stagger][2] = np.zeros(shape = (self.size[stagger]),
-                                                dtype = constants._ESMF2PythonType[self.type])
-
-        # link the ESMF allocations to the Python grid properties
-        # first if number of coordinate dimensions is equivalent to the grid rank
-        if (self.ndims == self.rank) or (self.ndims == 0):
+            assert(self.local_lower_bounds[stagger][localde].all() == lb.all())
+            assert(self.local_upper_bounds[stagger][localde].all() == ub.all())
+
+    def _allocate_coords_(self, stagger, from_file=False):
+        self._local_coords[stagger] = [[None for a in range(self.local_decount)]
+                                       for b in range(self.rank)]
+
+        for localde in range(self.local_decount):
+            # this could be one of several entry points to the grid,
+            # verify that bounds and other necessary data are available
+            self._verify_grid_bounds_(stagger, localde)
+
+            # link the ESMF allocations to the Python grid properties
+            # the 1D coordinates of rectilinear grids are linked as they are
+            if self.rectilinear:
+                for xyz in range(self.rank):
+                    self._link_coord_buffer_axis_(xyz, stagger, localde)
+            # first if number of coordinate dimensions is equivalent to the grid rank
+            elif (self.ndims == self.rank) or (self.ndims == 0):
+                for xyz in range(self.rank):
+                    self._link_coord_buffer_(xyz, stagger, localde)
+            # and this way if we have 1d coordinates
+            elif self.ndims < self.rank:
+                if not (self.ndims == 1):
+                    raise ValueError("Grid does not know how to handle coordinate arrays that are either 1 dimensional"
+                                     "  or have dimensionality equivalent to the number coordinate dimensions of the Grid")
+                self._link_coord_buffer_1Dcoords(stagger, localde)
+
+            # initialize to zeros, because ESMF doesn't handle that
+            if not from_file:
+                for xyz in range(self.rank):
+                    self.local_coords[stagger][xyz][localde][...] = 0
+
+        # the first local DE is the one of the single DE properties
+        if self.local_decount > 0:
             for xyz in range(self.rank):
-                self._link_coord_buffer_(xyz, stagger, localde)
-        # and this way if we have 1d coordinates
-        elif self.ndims < self.rank:
-            if not (self.ndims == 1):
-                raise ValueError("Grid does not know how to handle coordinate arrays that are either 1 dimensional"
-                                 "  or have dimensionality equivalent to the number coordinate dimensions of the Grid")
-            self._link_coord_buffer_1Dcoords(stagger, localde)
-
-        # initialize to zeros, because ESMF doesn't handle that
-        if not from_file:
-            self._coords[stagger][0][...] = 0
-            self._coords[stagger][1][...] = 0
-            if self.rank == 3:
-               self._coords[stagger][2][...] = 0
-
-    def _allocate_items_(self, item, stagger, localde=0, from_file=False):
-        # this could be one of several entry points to the grid,
-        # verify that bounds and other necessary data are available
-        self._verify_grid_bounds_(stagger, localde)
-
-        # if the item is a mask it is of type I4
+                self._coords[stagger][xyz] = self.local_coords[stagger][xyz][0]
+
+        if stagger in (StaggerLoc.CORNER, StaggerLoc.CORNER_VFACE):
+            self._has_corners = True
+
+    def _allocate_items_(self, item, stagger, from_file=False):
         if item == GridItem.MASK:
-            self._mask[stagger] = np.zeros(
-                shape=(self.size[stagger]),
-                dtype=constants._ESMF2PythonType[TypeKind.I4])
-        # if the item is area then it is of type R8
+            items = self._local_mask
+            # the mask is of type I4 and unmasked by default
+            initial = 1
         elif item == GridItem.AREA:
-            self._area[stagger] = np.zeros(
-                shape=(self.size[stagger]),
-                dtype=constants._ESMF2PythonType[TypeKind.R8])
+            items = self._local_area
+            # the area is of type R8
+            initial = 0
         else:
             raise GridItemNotSupported
 
-        # link the ESMF allocations to the grid properties
-        self._link_item_buffer_(item, stagger, localde)
+        items[stagger] = [None for a in range(self.local_decount)]
+
+        for localde in range(self.local_decount):
+            # this could be one of several entry points to the grid,
+            # verify that bounds and other necessary data are available
+            self._verify_grid_bounds_(stagger, localde)
+
+            # link the ESMF allocations to the grid properties
+            self._link_item_buffer_(item, stagger, localde)
 
-        # initialize to zeros, because ESMF doesn't handle that
-        if not from_file:
+            # initialize, because ESMF doesn't handle that
+            if not from_file:
+                items[stagger][localde][...] = initial
+
+        # the first local DE is the one of the single DE properties
+        if self.local_decount > 0:
             if item == GridItem.MASK:
-                self._mask[stagger][...] = 1
-            elif item == GridItem.AREA:
-                self._area[stagger][...] = 0
+                self._mask[stagger] = items[stagger][0]
             else:
-                raise GridItemNotSupported
+                self._area[stagger] = items[stagger][0]
 
     def _link_coord_buffer_(self, coord_dim, stagger, localde):
         # get the data pointer and bounds of the ESMF allocation
         data = ESMP_GridGetCoordPtr(self, coord_dim, staggerloc=stagger, localde=localde)
         lb, ub = ESMP_GridGetCoordBounds(self, staggerloc=stagger, localde=localde)
 
-        gridCoordP = ndarray_from_esmf(data, self.type, ub-lb)
+        gridCoordP = ndarray_from_esmf(data, self.type, ub-lb, owner=self._token)
 
         # alias the coordinates to a grid property
-        self._coords[stagger][coord_dim] = gridCoordP
+        self._local_coords[stagger][coord_dim][localde] = gridCoordP
 
-        if stagger in (StaggerLoc.CORNER, StaggerLoc.CORNER_VFACE):
-            self._has_corners = True
+    def _link_coord_buffer_axis_(self, coord_dim, stagger, localde):
+        # get the data pointer and bounds of the ESMF allocation
+        data = ESMP_GridGetCoordPtr(self, coord_dim, staggerloc=stagger, localde=localde)
+        lb, ub = ESMP_GridGetCoordBounds(self, staggerloc=stagger, localde=localde)
+
+        # coordinate dimension coord_dim only spans index dimension coord_dim
+        gridCoordP = ndarray_from_esmf(data, self.type, ((ub - lb)[coord_dim],), owner=self._token)
+
+        # alias the coordinates to a grid property
+        self._local_coords[stagger][coord_dim][localde] = gridCoordP
 
     def _link_coord_buffer_1Dcoords(self, stagger, localde):
         # get the data pointer and bounds of the ESMF allocation
@@ -1132,35 +1468,22 @@ class Grid(object):
             raise ValueError("Grid rank must be 2 or 3")
 
         # alias the coordinates to a grid property
-        self._coords[stagger][0] = gc00
-        self._coords[stagger][1] = gc11
+        self._local_coords[stagger][0][localde] = gc00
+        self._local_coords[stagger][1][localde] = gc11
         if self.rank == 3:
-            self._coords[stagger][2] = gc22
-
-        if stagger in (StaggerLoc.CORNER, StaggerLoc.CORNER_VFACE):
-            self._has_corners = True
+            self._local_coords[stagger][2][localde] = gc22
 
     def _link_item_buffer_(self, item, stagger, localde):
 
-        # # check to see if they are done
-        # if item == GridItem.MASK:
-        #     if not isinstance(self.mask[stagger], type(None)):
-        #         raise GridItemAlreadyLinked
-        # elif item == GridItem.AREA:
-        #     if not isinstance(self.area[stagger], type(None)):
-        #         raise GridItemAlreadyLinked
-        # else:
-        #     raise GridItemNotSupported
-
         # get the data pointer and bounds of the ESMF allocation
         data = ESMP_GridGetItem(self, item, staggerloc=stagger, localde=localde)
         lb, ub = ESMP_GridGetCoordBounds(self, staggerloc=stagger, localde=localde)
 
         # create Array of the appropriate type the appropriate type
         if item == GridItem.MASK:
-            self._mask[stagger] = ndarray_from_esmf(data, TypeKind.I4, ub-lb)
+            self._local_mask[stagger][localde] = ndarray_from_esmf(data, TypeKind.I4, ub-lb, owner=self._token)
         elif item == GridItem.AREA:
-            self._area[stagger] = ndarray_from_esmf(data, TypeKind.R8, ub-lb)
+            self._local_area[stagger][localde] = ndarray_from_esmf(data, TypeKind.R8, ub-lb, owner=self._token)
         else:
             raise GridItemNotSupported
 
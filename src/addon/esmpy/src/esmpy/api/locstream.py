@@ -9,6 +9,7 @@ The LocStream API
 from esmpy.api.esmpymanager import *
 from esmpy.util.esmpyarray import ndarray_from_esmf
 import esmpy.api.constants as constants
+import esmpy.util.finalizers as finalizers
 from esmpy.util.slicing import get_formatted_slice
 
 
@@ -82,6 +83,10 @@ class LocStream(dict):
     @initialize
     def __init__(self, location_count, coord_sys=None, name=None, esmf=True):
 
+        # the lifetime of the ESMF allocation, shared with shallow copies and
+        # the arrays aliasing ESMF memory
+        self._token = finalizers.Token()
+
         # for ocgis compatibility
         self._meta = {}
 
@@ -89,6 +94,7 @@ class LocStream(dict):
         self._rank = 1
         self._name = name
         self._size = location_count
+        self._coord_sys = coord_sys
 
         # call the ESMP layer
         if esmf:
@@ -100,19 +106,18 @@ class LocStream(dict):
             self._lower_bounds = lbounds
             self._upper_bounds = ubounds
 
-        # regist with atexit
-        import atexit;
-        atexit.register(self.__del__)
-        self._finalized = False
+            # release the ESMF allocation when the LocStream is garbage
+            # collected
+            self._finalizer = finalizers.register(
+                self._token, ESMP_LocStreamDestroy,
+                finalizers.handle(self.struct), owner=self)
+        self._finalized = not esmf
 
         # set the single stagger flag
         self._singlestagger = True
 
         super(LocStream, self).__init__()
 
-    def __del__(self):
-        self.destroy()
-
     def __getitem__(self, slc):
         # initialize slc_ls
         slc_ls = slc
@@ -275,7 +280,8 @@ class LocStream(dict):
         :return: A :class:`~esmpy.api.locstream.LocStream` shallow copy.
         """
         # shallow copy
-        ret = LocStream(self._size, name=self._name, esmf=False)
+        ret = LocStream(self._size, coord_sys=self._coord_sys, name=self._name,
+                        esmf=False)
 
         ret._struct = self._struct
         ret._lower_bounds = self._lower_bounds
@@ -286,6 +292,7 @@ class LocStream(dict):
 
         # don't call ESMF destructor twice on the same shallow Python object
         ret._finalized = True
+        ret._token = self._token
 
         return ret
 
@@ -297,9 +304,52 @@ class LocStream(dict):
 
         if hasattr(self, '_finalized'):
             if not self._finalized:
-                ESMP_LocStreamDestroy(self)
+                self._finalizer()
                 self._finalized = True
 
+    def subset(self, mask):
+        """
+        Create a new :class:`~esmpy.api.locstream.LocStream` holding the
+        points of this :class:`~esmpy.api.locstream.LocStream` selected by
+        ``mask`` on each PET, with all of its keys. The points stay on the
+        PET holding them, which may end up with none.
+
+        This is a collective call.
+
+        *REQUIRED:*
+
+        :param mask: the points to keep on the current PET.
+        :type mask: numpy array of bool of size
+            :attr:`~esmpy.api.locstream.LocStream.size`
+
+        :return: :class:`~esmpy.api.locstream.LocStream`
+        """
+        from esmpy.api.subset import _subset_locstream_
+
+        return _subset_locstream_(self, mask)
+
+    def subset_bbox(self, bounds):
+        """
+        Create a new :class:`~esmpy.api.locstream.LocStream` holding the
+        points of this :class:`~esmpy.api.locstream.LocStream` within
+        ``bounds``, see :meth:`~esmpy.api.locstream.LocStream.subset`.
+        Longitudes wrap around as in :meth:`~esmpy.api.grid.Grid.subset_bbox`.
+
+        This is a collective call.
+
+        *REQUIRED:*
+
+        :param list bounds: a ``(min, max)`` pair of inclusive bounds for
+            each coordinate key of the
+            :class:`~esmpy.api.locstream.LocStream`, e.g.
+            ``[(lon_min, lon_max), (lat_min, lat_max)]``.
+
+        :return: :class:`~esmpy.api.locstream.LocStream`
+        """
+        from esmpy.api.subset import _subset_locstream_bbox_
+
+        return _subset_locstream_bbox_(self, bounds)
+
     def _add_(self, key_name, typekind=None):
         # allocate the key
         ESMP_LocStreamAddKeyAlloc(self.struct, key_name, keyTypeKind=typekind)
@@ -308,6 +358,6 @@ class LocStream(dict):
         key_ptr = ESMP_LocStreamGetKeyPtr(self.struct, key_name)
 
         # create a numpy array out of the pointer
-        keyvals = ndarray_from_esmf(key_ptr, typekind, (self.size,))
+        keyvals = ndarray_from_esmf(key_ptr, typekind, (self.size,), owner=self._token)
 
         return keyvals
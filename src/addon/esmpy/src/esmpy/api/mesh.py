@@ -13,6 +13,8 @@ from esmpy.interface.cbindings import *
 from esmpy.util.decorators import initialize
 
 from esmpy.api.esmpymanager import *
+import esmpy.util.finalizers as finalizers
+from esmpy.api import trace
 from esmpy.util.slicing import get_formatted_slice, get_none_or_slice, get_none_or_bound_list
 
 import warnings
@@ -111,6 +113,7 @@ class Mesh(object):
     """
 
     @initialize
+    @trace.region("ESMPy Mesh create")
     def __init__(self, parametric_dim=None,
                  spatial_dim=None,
                  coord_sys=None,
@@ -122,6 +125,10 @@ class Mesh(object):
                  mask_flag=None,
                  varname=""):
 
+        # the lifetime of the ESMF allocation, shared with shallow copies and
+        # the arrays aliasing ESMF memory
+        self._token = finalizers.Token()
+
         # handle input arguments
         fromfile = False
         # in memory
@@ -212,12 +219,117 @@ class Mesh(object):
         # for arbitrary metadata
         self._meta = {}
 
-        # register with atexit
-        import atexit; atexit.register(self.__del__)
+        # release the ESMF allocation when the Mesh is garbage collected
+        self._finalizer = finalizers.register(self._token, ESMP_MeshDestroy,
+                                              finalizers.handle(self.struct),
+                                              owner=self)
         self._finalized = False
 
-    def __del__(self):
-        self.destroy()
+    @classmethod
+    def from_arrays(cls, node_coords, face_node_connectivity, fill_value=-1,
+                    start_index=0, node_owners=None, element_mask=None,
+                    element_area=None, element_coords=None, node_ids=None,
+                    element_ids=None, coord_sys=None):
+        """
+        Create a 2D :class:`~esmpy.api.mesh.Mesh` in one call from the node
+        coordinates and the padded face to node connectivity of a UGRID file,
+        e.g. the ``face_node_connectivity`` variable of the mesh topology::
+
+            mesh = esmpy.Mesh.from_arrays(np.array([lon, lat]).T, face_nodes,
+                                          fill_value=-1, start_index=1)
+
+        The element types, i.e. the number of nodes of each element, and the
+        flat connectivity are derived from the padding with array
+        operations, and arrays which already have the type expected by ESMF
+        are passed on without being copied.
+
+        *REQUIRED:*
+
+        :param ndarray node_coords: a numpy array of shape
+            ``(node_count, spatial_dim)`` with the coordinates of the nodes.
+        :param ndarray face_node_connectivity: an integer numpy array of shape
+            ``(element_count, max_nodes)`` with the indices of the nodes of
+            each element in **COUNTERCLOCKWISE** order. Elements with less than
+            ``max_nodes`` nodes are padded with ``fill_value`` or masked.
+
+        *OPTIONAL:*
+
+        :param int fill_value: the value padding the rows of
+            ``face_node_connectivity``. Defaults to ``-1``.
+        :param int start_index: the index of the first node in
+            ``face_node_connectivity``, as given by the ``start_index`` attribute
+            of a UGRID connectivity variable. Defaults to ``0``.
+        :param ndarray node_owners: a numpy array of shape ``(node_count,)`` to
+            specify the rank of the processor that owns each node.
+            If ``None``, all nodes are owned by the local processor.
+        :param ndarray element_mask: a numpy array of shape
+            ``(element_count,)`` containing integer values to specify masked
+            elements.
+        :param ndarray element_area: a numpy array of shape
+            ``(element_count,)`` to specify the areas of the elements.
+        :param ndarray element_coords: a numpy array of shape
+            ``(element_count, spatial_dim)`` to specify the coordinates of the
+            elements.
+        :param ndarray node_ids: a numpy array of shape ``(node_count,)`` to
+            specify the global node ids. If ``None``, defaults to
+            ``1..node_count``.
+        :param ndarray element_ids: a numpy array of shape
+            ``(element_count,)`` to specify the global element ids.
+            If ``None``, defaults to ``1..element_count``.
+        :param CoordSys coord_sys: Coordinate system for the
+            :class:`~esmpy.api.mesh.Mesh`.
+            If ``None``, defaults to :attr:`~esmpy.api.constants.CoordSys.SPH_DEG`.
+
+        :return: A :class:`~esmpy.api.mesh.Mesh`
+        """
+        node_coords = np.asarray(node_coords)
+        if node_coords.ndim != 2:
+            raise ValueError("node_coords must have shape (node_count, spatial_dim)")
+        node_count, spatial_dim = node_coords.shape
+
+        # masked entries, e.g. read from a variable with a _FillValue, and
+        # entries equal to fill_value both pad the rows
+        valid = ~np.ma.getmaskarray(face_node_connectivity)
+        conn = np.ma.getdata(face_node_connectivity)
+        if conn.ndim != 2:
+            raise ValueError("face_node_connectivity must have shape (element_count, max_nodes)")
+        if fill_value is not None:
+            valid &= conn != fill_value
+        element_count = conn.shape[0]
+
+        # the number of nodes of each element is its type, e.g. 3 for
+        # MeshElemType.TRI, 4 for MeshElemType.QUAD
+        element_types = np.count_nonzero(valid, axis=1).astype(np.int32)
+        if element_count > 0 and element_types.min() < 3:
+            raise ValueError("all elements must have at least 3 nodes")
+
+        # boolean indexing flattens the valid entries in row order
+        element_conn = conn[valid].astype(np.int32, copy=False)
+        if start_index != 0:
+            element_conn -= np.int32(start_index)
+
+        if node_ids is None:
+            node_ids = np.arange(1, node_count + 1, dtype=np.int32)
+        if element_ids is None:
+            element_ids = np.arange(1, element_count + 1, dtype=np.int32)
+
+        mesh = cls(parametric_dim=2, spatial_dim=spatial_dim,
+                   coord_sys=coord_sys)
+
+        if node_owners is None:
+            node_owners = np.full(node_count, local_pet(), dtype=np.int32)
+
+        # interleaved coordinates are a view of C ordered node_coords
+        mesh.add_nodes(node_count, node_ids, node_coords.reshape(-1),
+                       node_owners)
+        if element_coords is not None:
+            element_coords = np.asarray(element_coords).reshape(-1)
+        mesh.add_elements(element_count, element_ids, element_types,
+                          element_conn, element_mask=element_mask,
+                          element_area=element_area,
+                          element_coords=element_coords)
+
+        return mesh
 
     def __getitem__(self, slc):
         if pet_count() > 1:
@@ -394,6 +506,7 @@ class Mesh(object):
         """
         return self._struct
 
+    @trace.region("ESMPy Mesh add_elements")
     def add_elements(self, element_count,
                      element_ids,
                      element_types,
@@ -432,36 +545,20 @@ class Mesh(object):
         """
 
         # initialize not fromfile variables
+        # arrays are only copied if they do not have the type and the
+        # contiguous layout ESMF reads
         self._element_count = element_count
-        if not isinstance(element_ids.dtype, np.int32):
-            self._element_ids = np.array(element_ids, dtype=np.int32)
-        else:
-            self._element_ids = element_ids
-        if not isinstance(element_types.dtype, np.int32):
-            self._element_types = np.array(element_types, dtype=np.int32)
-        else:
-            self._element_types = element_types
-        if not isinstance(element_conn.dtype, np.int32):
-            self._element_conn = np.array(element_conn, dtype=np.int32)
-        else:
-            self._element_conn = element_conn
+        self._element_ids = np.ascontiguousarray(element_ids, dtype=np.int32)
+        self._element_types = np.ascontiguousarray(element_types, dtype=np.int32)
+        self._element_conn = np.ascontiguousarray(element_conn, dtype=np.int32)
         if not isinstance(element_mask, type(None)):
-            if not isinstance(element_mask.dtype, np.int32):
-                self._element_mask = np.array(element_mask, dtype=np.int32)
-            else:
-                self._element_mask = element_mask
+            self._element_mask = np.ascontiguousarray(element_mask, dtype=np.int32)
             self._mask[1] = self._element_mask
         if not isinstance(element_area, type(None)):
-            if not isinstance(element_area.dtype, np.float64):
-                self._element_area = np.array(element_area, dtype=np.float64)
-            else:
-                self._element_area = element_area
+            self._element_area = np.ascontiguousarray(element_area, dtype=np.float64)
             self._area = self._element_area
         if not isinstance(element_coords, type(None)):
-            if not isinstance(element_coords.dtype, np.float64):
-                self._element_coords = np.array(element_coords, dtype=np.float64)
-            else:
-                self._element_coords = element_coords
+            self._element_coords = np.ascontiguousarray(element_coords, dtype=np.float64)
 
         # call into ctypes layer
         ESMP_MeshAddElements(self, self.element_count, self.element_ids, 
@@ -478,6 +575,7 @@ class Mesh(object):
         # link the coords here for meshes not created from file
         self._link_coords_()
 
+    @trace.region("ESMPy Mesh add_nodes")
     def add_nodes(self, node_count,
                   node_ids,
                   node_coords,
@@ -496,19 +594,12 @@ class Mesh(object):
             specify the rank of the processor that owns each node.
         """
 
+        # arrays are only copied if they do not have the type and the
+        # contiguous layout ESMF reads
         self._node_count = node_count
-        if not isinstance(node_ids.dtype, np.int32):
-            self._node_ids = np.array(node_ids, dtype=np.int32)
-        else:
-            self._node_ids = node_ids
-        if not isinstance(node_coords.dtype, np.float64):
-            self._node_coords = np.array(node_coords, dtype=np.float64)
-        else:
-            self._node_coords = node_coords
-        if not isinstance(node_owners.dtype, np.int32):
-            self._node_owners = np.array(node_owners, dtype=np.int32)
-        else:
-            self._node_owners = node_owners
+        self._node_ids = np.ascontiguousarray(node_ids, dtype=np.int32)
+        self._node_coords = np.ascontiguousarray(node_coords, dtype=np.float64)
+        self._node_owners = np.ascontiguousarray(node_owners, dtype=np.int32)
  
         # call into ctypes layer
         ESMP_MeshAddNodes(self, self.node_count, self.node_ids, 
@@ -535,7 +626,7 @@ class Mesh(object):
         """
         if hasattr(self, '_finalized'):
             if not self._finalized:
-                ESMP_MeshDestroy(self)
+                self._finalizer()
                 self._finalized = True
 
     def free_memory(self):
@@ -605,17 +696,17 @@ class Mesh(object):
         self._coords = [[None for a in range(num_dims)] \
                         for b in range(2)]
 
-        # alias the coordinates to the mesh
-        self._coords[node][0] = np.array([coords_interleaved[2*i] for i in range(num_nodes)])
-        self._coords[node][1] = np.array([coords_interleaved[2*i+1] for i in range(num_nodes)])
-        if num_dims == 3:
-            self._coords[node][2] = np.array([coords_interleaved[2*i+2] for i in range(num_nodes)])
+        # alias the coordinates to the mesh, the interleaved buffers are viewed
+        # as (count, num_dims) arrays so each coordinate dimension is a strided
+        # view into the buffer rather than a copy
+        coords_node = coords_interleaved[:num_nodes * num_dims].reshape(num_nodes, num_dims)
+        for coord_dim in range(num_dims):
+            self._coords[node][coord_dim] = coords_node[:, coord_dim]
 
         if elemcoords:
-            self._coords[element][0] = np.array([coords_elem[2 * i] for i in range(num_elems)])
-            self._coords[element][1] = np.array([coords_elem[2 * i + 1] for i in range(num_elems)])
-            if num_dims == 3:
-                self._coords[element][2] = np.array([coords_elem[2 * i + 2] for i in range(num_elems)])
+            coords_elem = coords_elem[:num_elems * num_dims].reshape(num_elems, num_dims)
+            for coord_dim in range(num_dims):
+                self._coords[element][coord_dim] = coords_elem[:, coord_dim]
 
     def _write_(self, filename):
         """
@@ -0,0 +1,135 @@
+# $Id$
+
+"""
+The profile API
+"""
+
+#### IMPORT LIBRARIES #########################################################
+
+from esmpy.api.esmpymanager import *
+import esmpy.util.profiling as profiling
+
+#### UTILITIES ################################################################
+
+def _summarize_(records):
+    """
+    Reduce the ``records`` of all PETs into a summary of each binding. This is
+    a collective call, and the summary is returned on all PETs.
+    """
+    names = profiling._names
+    size = len(names)
+    local = np.zeros((4, size), dtype=np.float64)
+    for index, name in enumerate(names):
+        if name in records:
+            count, seconds, nbytes = records[name]
+            local[:, index] = [count, seconds, nbytes, seconds]
+
+    mg = Manager()
+    total = np.zeros(3 * size, dtype=np.float64)
+    slowest = np.zeros(size, dtype=np.float64)
+    mg._reduce_(local[:3].reshape(-1), total, 3 * size, reduceflag=Reduce.SUM)
+    mg._reduce_(np.ascontiguousarray(local[3]), slowest, size,
+                reduceflag=Reduce.MAX)
+    mg._broadcast_(total, 3 * size)
+    mg._broadcast_(slowest, size)
+    total = total.reshape(3, size)
+
+    ret = {}
+    for index, name in enumerate(names):
+        if total[0, index] > 0:
+            ret[name] = {'count': int(total[0, index]),
+                         'time': total[1, index],
+                         'time_max': slowest[index],
+                         'bytes': int(total[2, index])}
+    return ret
+
+def _format_(summary):
+    lines = ["{0:<36} {1:>10} {2:>12} {3:>12} {4:>14}".format(
+        "binding", "count", "time (s)", "max PET (s)", "bytes")]
+    for name in sorted(summary, key=lambda name: -summary[name]['time']):
+        entry = summary[name]
+        lines.append("{0:<36} {1:>10d} {2:>12.6f} {3:>12.6f} {4:>14d}".format(
+            name, entry['count'], entry['time'], entry['time_max'],
+            entry['bytes']))
+    return "\n".join(lines)
+
+#### profile class ############################################################
+
+class profile(object):
+    """
+    A context manager which records how often each binding to the ESMF C API
+    (the ``ESMP_*`` functions of ``esmpy.interface.cbindings``) is called
+    within its block, the wall time spent in it and the number of bytes of
+    the NumPy arrays passed to it, on each PET. The bindings wrap single ESMF
+    calls, so their wall time is the time spent inside ESMF::
+
+        with esmpy.profile() as prof:
+            regrid = esmpy.Regrid(srcfield, dstfield)
+            dstfield = regrid(srcfield, dstfield)
+        if esmpy.local_pet() == 0:
+            print(prof.report())
+
+    Profiling can also be enabled for the whole run with
+    :class:`Manager(profile=True) <esmpy.api.esmpymanager.Manager>`, see
+    :meth:`~esmpy.api.esmpymanager.Manager.profile_summary`.
+
+    .. note:: The timings of nested bindings are inclusive.
+    """
+
+    def __init__(self):
+        self._records = None
+        self._start = None
+
+    def __enter__(self):
+        self._start = profiling.snapshot()
+        profiling.enable()
+        return self
+
+    def __exit__(self, *args):
+        profiling.disable()
+        self._records = profiling.difference(profiling.snapshot(), self._start)
+        return False
+
+    def __repr__(self):
+        string = ("profile:\n"
+                  "    bindings = %r\n"
+                  %
+                  (sorted(self.local()),))
+
+        return string
+
+    def local(self):
+        """
+        :return: A dictionary mapping the name of each binding called in the
+            block on the current PET to a dictionary with its call ``count``,
+            ``time`` in seconds and ``bytes`` of array arguments.
+        """
+        records = self._records
+        if records is None:
+            # still within the block
+            records = profiling.difference(profiling.snapshot(), self._start)
+        return {name: {'count': count, 'time': seconds, 'bytes': nbytes}
+                for name, (count, seconds, nbytes) in records.items()}
+
+    def summary(self):
+        """
+        Reduce the records of all PETs. This is a collective call.
+
+        :return: A dictionary mapping the name of each binding called in the
+            block on any PET to a dictionary with its total call ``count``,
+            total ``time`` in seconds, the largest time of a single PET
+            ``time_max`` and total ``bytes`` of array arguments.
+        """
+        records = self._records
+        if records is None:
+            records = profiling.difference(profiling.snapshot(), self._start)
+        return _summarize_(records)
+
+    def report(self):
+        """
+        Format the result of :meth:`~esmpy.api.profile.profile.summary` as a
+        table, slowest binding first. This is a collective call.
+
+        :return: str
+        """
+        return _format_(self.summary())
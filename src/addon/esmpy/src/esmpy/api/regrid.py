@@ -3,8 +3,445 @@
 """
 The Regrid API
 """
+import json
+import struct
+import time
+import zipfile
+
 from esmpy.api import constants
 from esmpy.api.field import *
+from esmpy.api.weightcache import WeightCache, _fingerprint_
+import esmpy.util.finalizers as finalizers
+from esmpy.util.esmpyarray import ndarray_owned
+from esmpy.api import trace
+
+
+def _field_global_shape_(field):
+    """
+    Return the global shape of the gridded dimensions of a
+    :class:`~esmpy.api.field.Field`, in the Fortran index order used by the
+    ESMF sequence indices. This is a collective call.
+    """
+    if isinstance(field.grid, Mesh):
+        # Mesh sequence indices run over the owned nodes or elements of all PETs
+        local = np.array([field.grid.size_owned[field.staggerloc]], dtype=np.float64)
+        reduceflag = Reduce.SUM
+    else:
+        local = np.array(field.upper_bounds[:field.rank - field.xd], dtype=np.float64)
+        reduceflag = Reduce.MAX
+
+    mg = Manager()
+    shape = np.zeros(local.size, dtype=np.float64)
+    mg._reduce_(local, shape, local.size, reduceflag=reduceflag)
+    mg._broadcast_(shape, shape.size)
+
+    return tuple(int(s) for s in shape)
+
+# the largest number of elements of the temporaries of Regrid.apply
+_APPLY_BLOCK = 2 ** 22
+
+def _gridded_view_(values, shape, grid_axis):
+    """
+    Return a view of ``values`` with the gridded dimensions moved to the
+    front in reverse order, so that a C order reshape flattens them in the
+    Fortran order of the ESMF sequence indices, along with the shape of the
+    remaining batch dimensions.
+    """
+    ngrid = len(shape)
+    if tuple(values.shape[grid_axis:grid_axis + ngrid]) != tuple(shape):
+        raise ValueError("array dimensions {0} starting at axis {1} do not "
+                         "match the gridded shape {2}".format(
+                            values.shape, grid_axis, tuple(shape)))
+
+    gridded = list(range(grid_axis, grid_axis + ngrid))
+    values = np.moveaxis(values, gridded[::-1], list(range(ngrid)))
+
+    return values, values.shape[ngrid:]
+
+def _field_like_(field, ndbounds):
+    """
+    Return a new :class:`~esmpy.api.field.Field` on the same discretization,
+    stagger location and typekind as ``field`` with the given ``ndbounds``.
+    """
+    if isinstance(field.grid, Mesh):
+        return Field(field.grid, name=field.name, typekind=field.type,
+                     meshloc=MeshLoc(field.staggerloc), ndbounds=ndbounds)
+    return Field(field.grid, name=field.name, typekind=field.type,
+                 staggerloc=field.staggerloc, ndbounds=ndbounds)
+
+def _regrid_chunked_(routehandle, srcfield, dstfield, src_values, dst_values,
+                     chunk, zero_region):
+    """
+    Regrid ``src_values`` into ``dst_values`` through ``routehandle``,
+    ``chunk`` elements of the ungridded dimensions at a time. See
+    :meth:`Regrid.regrid_chunked`.
+    """
+    if chunk < 1:
+        raise ValueError("chunk must be a positive integer")
+
+    src_grid_shape = srcfield.data.shape[:srcfield.rank - srcfield.xd]
+    dst_grid_shape = dstfield.data.shape[:dstfield.rank - dstfield.xd]
+    src_ngrid, dst_ngrid = len(src_grid_shape), len(dst_grid_shape)
+    if tuple(src_values.shape[:src_ngrid]) != tuple(src_grid_shape):
+        raise ValueError("source dimensions {0} do not start with the local "
+                         "gridded shape {1}".format(tuple(src_values.shape),
+                                                    tuple(src_grid_shape)))
+    batch = tuple(src_values.shape[src_ngrid:])
+
+    if isinstance(dst_values, type(None)):
+        dst_values = np.zeros(tuple(dst_grid_shape) + batch,
+                              dtype=dstfield.data.dtype, order='F')
+    elif tuple(dst_values.shape) != tuple(dst_grid_shape) + batch:
+        raise ValueError("destination dimensions {0} do not match {1}".format(
+            tuple(dst_values.shape), tuple(dst_grid_shape) + batch))
+
+    ret = dst_values
+    if not batch:
+        # a single ungridded element
+        src_values, dst_values = src_values[..., None], dst_values[..., None]
+        batch = (1,)
+
+    # every PET must take part in each regrid call, so all PETs walk the
+    # same number of chunks
+    nbatch = int(np.prod(batch))
+    chunk = min(chunk, max(nbatch, 1))
+    keep = not isinstance(zero_region, type(None)) and \
+        zero_region != Region.TOTAL
+
+    # the routehandle only depends on the gridded dimensions, so a single
+    # pair of Fields with ``chunk`` ungridded elements is reused for all
+    srcchunk = _field_like_(srcfield, [chunk])
+    dstchunk = _field_like_(dstfield, [chunk])
+    try:
+        for start in range(0, nbatch, chunk):
+            stop = min(start + chunk, nbatch)
+            count = stop - start
+            # walk the ungridded elements in the Fortran order of Field.data
+            index = np.unravel_index(np.arange(start, stop), batch, order='F')
+            src_index = (slice(None),) * src_ngrid + index
+            dst_index = (slice(None),) * dst_ngrid + index
+
+            srcchunk.data[..., :count] = src_values[src_index]
+            srcchunk.data[..., count:] = 0
+            if keep:
+                dstchunk.data[..., :count] = dst_values[dst_index]
+            ESMP_FieldRegrid(srcchunk, dstchunk, routehandle,
+                             zeroregion=zero_region)
+            dst_values[dst_index] = dstchunk.data[..., :count]
+    finally:
+        srcchunk.destroy()
+        dstchunk.destroy()
+
+    return ret
+
+def _regrid_many_(routehandle, fields, zero_region):
+    """
+    Regrid the ``(srcfield, dstfield)`` pairs of ``fields`` through
+    ``routehandle``, see :meth:`Regrid.regrid_many`. The pairs with the same
+    typekinds and ungridded dimensions are packed along the ungridded
+    dimension of a single pair of work
+    :class:`Fields <esmpy.api.field.Field>`, so each group takes one sparse
+    matrix multiplication and one communication phase. Return the
+    destination Fields and the wall clock time spent on each pair.
+    """
+    # group the pairs in the order of their first appearance, which is the
+    # same on every PET, so all PETs make the same regrid calls
+    groups = {}
+    for ii, (srcfield, dstfield) in enumerate(fields):
+        key = (srcfield.type, dstfield.type, tuple(srcfield.ndbounds or ()),
+               tuple(dstfield.ndbounds or ()))
+        groups.setdefault(key, []).append(ii)
+
+    keep = not isinstance(zero_region, type(None)) and \
+        zero_region != Region.TOTAL
+
+    timings = [0.] * len(fields)
+    for members in groups.values():
+        pairs = [fields[ii] for ii in members]
+        if len(pairs) == 1:
+            start = time.perf_counter()
+            ESMP_FieldRegrid(pairs[0][0], pairs[0][1], routehandle,
+                             zeroregion=zero_region)
+            timings[members[0]] = time.perf_counter() - start
+            continue
+
+        srcfield, dstfield = pairs[0]
+        nbatch = int(np.prod(srcfield.ndbounds or [1]))
+        if nbatch != int(np.prod(dstfield.ndbounds or [1])):
+            raise ValueError("the source and destination Fields must have "
+                             "the same number of ungridded elements")
+
+        srcwork = _field_like_(srcfield, [nbatch * len(pairs)])
+        dstwork = _field_like_(dstfield, [nbatch * len(pairs)])
+        try:
+            for ii, (src, dst) in enumerate(pairs):
+                start = time.perf_counter()
+                block = slice(ii * nbatch, (ii + 1) * nbatch)
+                for work, data in zip(srcwork.local_data, src.local_data):
+                    work[..., block] = data.reshape(work.shape[:-1] + (nbatch,),
+                                                    order='F')
+                if keep:
+                    for work, data in zip(dstwork.local_data, dst.local_data):
+                        work[..., block] = data.reshape(
+                            work.shape[:-1] + (nbatch,), order='F')
+                timings[members[ii]] += time.perf_counter() - start
+
+            # the shared call is split evenly across the pairs of the group
+            start = time.perf_counter()
+            ESMP_FieldRegrid(srcwork, dstwork, routehandle,
+                             zeroregion=zero_region)
+            shared = (time.perf_counter() - start) / len(pairs)
+
+            for ii, (src, dst) in enumerate(pairs):
+                start = time.perf_counter()
+                block = slice(ii * nbatch, (ii + 1) * nbatch)
+                for work, data in zip(dstwork.local_data, dst.local_data):
+                    data[...] = work[..., block].reshape(data.shape, order='F')
+                timings[members[ii]] += time.perf_counter() - start + shared
+        finally:
+            srcwork.destroy()
+            dstwork.destroy()
+
+    return [dstfield for _, dstfield in fields], timings
+
+def _regrid_masked_(routehandle, srcfield, dstfield, src_mask, renormalize,
+                    zero_region):
+    """
+    Regrid ``srcfield`` into ``dstfield`` through ``routehandle`` without the
+    source points where ``src_mask`` is ``True``, and divide each destination
+    point by the sum of the weights of its remaining source points if
+    ``renormalize`` is set. See :meth:`Regrid.__call__`.
+    """
+    if srcfield.local_decount > 1 or dstfield.local_decount > 1:
+        raise ValueError("masking at apply time is not supported for Fields "
+                         "with more than one DE per PET")
+
+    shape = srcfield.data.shape
+    if isinstance(src_mask, type(None)):
+        valid = np.ones(shape, dtype=bool)
+    else:
+        src_mask = np.asarray(src_mask, dtype=bool)
+        if tuple(src_mask.shape) != tuple(shape[:src_mask.ndim]):
+            raise ValueError("src_mask of shape {0} does not match the source "
+                             "data of shape {1}".format(tuple(src_mask.shape),
+                                                        tuple(shape)))
+        # a mask of the gridded dimensions applies to every ungridded element
+        src_mask = src_mask.reshape(src_mask.shape + (1,) * (len(shape) - src_mask.ndim))
+        valid = ~np.broadcast_to(src_mask, shape)
+
+    srcwork = _field_like_(srcfield, srcfield.ndbounds)
+    try:
+        srcwork.data[...] = np.where(valid, srcfield.data, 0)
+        if not renormalize:
+            ESMP_FieldRegrid(srcwork, dstfield, routehandle,
+                             zeroregion=zero_region)
+            return dstfield
+
+        dstwork = _field_like_(dstfield, dstfield.ndbounds)
+        try:
+            ESMP_FieldRegrid(srcwork, dstwork, routehandle)
+            numerator = np.array(dstwork.data)
+            # the same weights applied to the valid points sum the weights
+            # left in each destination row
+            srcwork.data[...] = valid
+            ESMP_FieldRegrid(srcwork, dstwork, routehandle)
+            denominator = np.array(dstwork.data)
+        finally:
+            dstwork.destroy()
+    finally:
+        srcwork.destroy()
+
+    # destination points left without any source point count as unmapped
+    mapped = denominator != 0
+    result = np.divide(numerator, denominator, where=mapped,
+                       out=np.zeros_like(numerator))
+    if zero_region == Region.EMPTY:
+        dstfield.data[mapped] += result[mapped]
+    else:
+        if zero_region in (None, Region.TOTAL):
+            dstfield.data[...] = 0
+        dstfield.data[mapped] = result[mapped]
+
+    return dstfield
+
+def _release_routehandle_(routehandle, ptr_fl=None, ptr_fil=None,
+                          num_factors=None):
+    """
+    Release a routehandle and the factors ESMF allocated while computing it.
+    This is the finalizer of :class:`Regrid` and :class:`RegridFromFile`.
+    """
+    ESMP_FieldRegridRelease(routehandle)
+
+    # Also destroy factor allocations in Fortran
+    if not isinstance(ptr_fl, type(None)):
+        ESMP_FieldRegridReleaseFactors(ptr_fl, ptr_fil, ct.c_int(num_factors))
+
+def _read_weights_(filename):
+    """
+    Read the part of the ``row``, ``col`` and ``S`` variables of a weight file
+    assigned to the current PET. The factors are split into contiguous,
+    equally sized slices so no PET holds more than its share of the matrix.
+    Classic and 64 bit offset netCDF files are uncompressed and are memory
+    mapped, other formats are read with hyperslabs.
+
+    :return: ``(factorList, factorIndexList)`` as expected by
+        ``ESMP_FieldSMMStoreFactors``.
+    """
+    with open(filename, 'rb') as f:
+        magic = f.read(4)
+
+    pet, npet = local_pet(), pet_count()
+    if magic in (b'CDF\x01', b'CDF\x02'):
+        from scipy.io import netcdf_file
+        ds = netcdf_file(filename, 'r', mmap=True)
+        try:
+            size = ds.variables['S'].shape[0]
+            start, stop = size * pet // npet, size * (pet + 1) // npet
+            # copy the slices out of the mapping before it is closed
+            row = np.array(ds.variables['row'][start:stop], dtype=np.int32)
+            col = np.array(ds.variables['col'][start:stop], dtype=np.int32)
+            weights = np.array(ds.variables['S'][start:stop], dtype=np.float64)
+        finally:
+            ds.close()
+    else:
+        from netCDF4 import Dataset
+        with Dataset(filename) as ds:
+            ds.set_auto_mask(False)
+            size = ds.variables['S'].shape[0]
+            start, stop = size * pet // npet, size * (pet + 1) // npet
+            row = np.asarray(ds.variables['row'][start:stop], dtype=np.int32)
+            col = np.asarray(ds.variables['col'][start:stop], dtype=np.int32)
+            weights = np.asarray(ds.variables['S'][start:stop], dtype=np.float64)
+
+    # both the file and ESMF use 1-based sequence indices
+    return weights, np.column_stack((col, row))
+
+# layout of the "raw" weight format: the magic string, the length of the JSON
+# header as a little endian uint64, the header, then the row, col and S arrays
+# each starting on an aligned offset
+_WEIGHTS_MAGIC = b'ESMPYWT\x01'
+_WEIGHTS_ALIGN = 64
+_WEIGHTS_ARRAYS = (('row', '<i4'), ('col', '<i4'), ('S', '<f8'))
+
+def _align_(offset):
+    return -(-offset // _WEIGHTS_ALIGN) * _WEIGHTS_ALIGN
+
+def _write_weights_raw_(path, header, arrays):
+    """
+    Write the local ``arrays`` of each PET into one "raw" weight file, one
+    after the other in PET order. This is a collective call.
+    """
+    pet, npet = local_pet(), pet_count()
+    mg = Manager()
+
+    # exchange the local factor counts to find the slice of each PET
+    counts = np.zeros(npet, dtype=np.float64)
+    counts[pet] = arrays['S'].size
+    total = np.zeros(npet, dtype=np.float64)
+    mg._reduce_(counts, total, npet, reduceflag=Reduce.SUM)
+    mg._broadcast_(total, npet)
+    total = total.astype(np.int64)
+    start, size = int(total[:pet].sum()), int(total.sum())
+
+    header = dict(header, num_factors=size, arrays={})
+    offset = 0
+    for name, dtype in _WEIGHTS_ARRAYS:
+        header['arrays'][name] = {'dtype': dtype, 'offset': offset}
+        offset = _align_(offset + size * np.dtype(dtype).itemsize)
+    # the data offsets are relative to the end of the padded header
+    text = json.dumps(header, sort_keys=True).encode('utf-8')
+    base = _align_(len(_WEIGHTS_MAGIC) + 8 + len(text))
+    text = text.ljust(base - len(_WEIGHTS_MAGIC) - 8)
+
+    if pet == 0:
+        with open(path, 'wb') as f:
+            f.write(_WEIGHTS_MAGIC)
+            f.write(struct.pack('<Q', len(text)))
+            f.write(text)
+            f.truncate(base + offset)
+    mg.barrier()
+
+    if arrays['S'].size > 0:
+        for name, dtype in _WEIGHTS_ARRAYS:
+            itemsize = np.dtype(dtype).itemsize
+            out = np.memmap(path, dtype=dtype, mode='r+',
+                            offset=base + header['arrays'][name]['offset'] + start * itemsize,
+                            shape=(arrays[name].size,))
+            out[:] = arrays[name]
+            out.flush()
+            del out
+    mg.barrier()
+
+def _write_weights_npz_(path, header, arrays):
+    """Write ``arrays`` and the JSON ``header`` to an uncompressed npz file."""
+    header = dict(header, num_factors=int(arrays['S'].size))
+    text = json.dumps(header, sort_keys=True).encode('utf-8')
+    # pass a file object so that numpy does not append a suffix to the path
+    with open(path, 'wb') as f:
+        np.savez(f, header=np.frombuffer(text, dtype=np.uint8),
+                 **{name: np.asarray(arrays[name], dtype=dtype)
+                    for name, dtype in _WEIGHTS_ARRAYS})
+
+def _memmap_npz_member_(path, name):
+    """
+    Memory map the array ``name`` of an uncompressed npz file. Compressed
+    members are read into memory instead.
+    """
+    with zipfile.ZipFile(path) as zf:
+        info = zf.getinfo(name + '.npy')
+        if info.compress_type != zipfile.ZIP_STORED:
+            with zf.open(info) as member:
+                return np.lib.format.read_array(member)
+
+    with open(path, 'rb') as f:
+        # skip the local file header, whose name and extra field lengths may
+        # differ from the ones in the central directory
+        f.seek(info.header_offset)
+        local = f.read(30)
+        name_len, extra_len = struct.unpack('<HH', local[26:30])
+        f.seek(info.header_offset + 30 + name_len + extra_len)
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+
+    if int(np.prod(shape)) == 0:
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=shape,
+                     order='F' if fortran_order else 'C')
+
+def _open_weights_(path):
+    """
+    Return the header and the memory mapped ``row``, ``col`` and ``S`` arrays
+    of a weight file written by :meth:`Regrid.save_weights`.
+    """
+    with open(path, 'rb') as f:
+        magic = f.read(len(_WEIGHTS_MAGIC))
+        if magic == _WEIGHTS_MAGIC:
+            length, = struct.unpack('<Q', f.read(8))
+            header = json.loads(f.read(length).decode('utf-8'))
+            base = len(_WEIGHTS_MAGIC) + 8 + length
+            size = header['num_factors']
+            arrays = {}
+            for name, dtype in _WEIGHTS_ARRAYS:
+                if size == 0:
+                    arrays[name] = np.empty(0, dtype=dtype)
+                else:
+                    arrays[name] = np.memmap(path, dtype=dtype, mode='r',
+                                             offset=base + header['arrays'][name]['offset'],
+                                             shape=(size,))
+        elif magic[:2] == b'PK':
+            with np.load(path) as npz:
+                header = json.loads(npz['header'].tobytes().decode('utf-8'))
+            arrays = {name: _memmap_npz_member_(path, name)
+                      for name, _ in _WEIGHTS_ARRAYS}
+        else:
+            raise ValueError("{0} is not a weight file written by "
+                             "Regrid.save_weights()".format(path))
+
+    return header, arrays
 
 
 class Regrid(object):
@@ -104,10 +541,15 @@ class Regrid(object):
         format is not supported in the NetCDF version earlier than 3.6.0.  An error message 
         will be generated if this flag is specified while the application is linked with a 
         NetCDF library earlier than 3.6.0. Defaults to ``False``.
+    :param WeightCache cache: a :class:`~esmpy.api.weightcache.WeightCache`,
+        or the path of a cache directory, from which to read the regridding
+        operator if an identical one was stored before, and to which it is
+        written otherwise. If ``None``, no cache is used.
 
     """
 
     @initialize
+    @trace.region("ESMPy Regrid store")
     def __init__(self, srcfield=None, dstfield=None, filename=None, rh_filename=None, 
                  src_mask_values=None,
                  dst_mask_values=None, regrid_method=None, pole_method=None,
@@ -116,15 +558,22 @@ class Regrid(object):
                  unmapped_action=None, ignore_degenerate=None, create_rh=None, filemode=None, 
                  src_file=None, dst_file=None, src_file_type=None, dst_file_type=None, 
                  factors=False, large_file=None,
-                 src_frac_field=None, dst_frac_field=None):
+                 src_frac_field=None, dst_frac_field=None, cache=None):
 
         # Confirm the ESMF compiler will suport in-memory factor retrieval
         if factors and not constants._ESMF_USE_INMEM_FACTORS:
             raise RuntimeError("in-memory factors only supported with GNU (gfortran)")
 
 
+        # the lifetime of the ESMF allocations, shared with shallow copies and
+        # the factor arrays
+        self._token = finalizers.Token()
+
         # Routehandle storage
         self._routehandle = 0
+        # routehandle of the transposed weights, computed on first use
+        self._transpose_routehandle = None
+        self._transpose_finalizer = None
 
         # Factor storage - only used when "factors=True"
         self._factor_list = None
@@ -141,6 +590,32 @@ class Regrid(object):
         if not isinstance(dst_mask_values, type(None)):
             dst_mask_values = np.array(dst_mask_values, dtype=np.int32)
 
+        # Look up the operator in the weight cache if one is given. The cache
+        # only holds RouteHandles, so it is bypassed when anything else is
+        # requested from the store.
+        cached = None
+        cache_key = None
+        if (not isinstance(cache, type(None))) and isinstance(filename, type(None)) \
+                and (not factors) and isinstance(src_frac_field, type(None)) \
+                and isinstance(dst_frac_field, type(None)):
+            if not isinstance(cache, (WeightCache, _BatchWeightCache)):
+                cache = WeightCache(cache)
+            cache_key = cache.key(srcfield, dstfield,
+                                  src_mask_values=src_mask_values,
+                                  dst_mask_values=dst_mask_values,
+                                  regrid_method=regrid_method,
+                                  pole_method=pole_method,
+                                  regrid_pole_npoints=regrid_pole_npoints,
+                                  line_type=line_type,
+                                  norm_type=norm_type,
+                                  extrap_method=extrap_method,
+                                  extrap_num_src_pnts=extrap_num_src_pnts,
+                                  extrap_dist_exponent=extrap_dist_exponent,
+                                  extrap_num_levels=extrap_num_levels,
+                                  unmapped_action=unmapped_action,
+                                  ignore_degenerate=ignore_degenerate)
+            cached = cache.load(cache_key)
+
         # Write weights to file if requested.
         if not isinstance(filename, type(None)):
             self._routehandle = ESMP_FieldRegridStoreFile(
@@ -165,6 +640,8 @@ class Regrid(object):
                 largeFileFlag=large_file,
                 srcFracField=src_frac_field,
                 dstFracField=dst_frac_field)
+        elif not isinstance(cached, type(None)):
+            self._routehandle = cached
         else:
             # Initialize the factor array pointers if we are returning factors.
             if factors:
@@ -204,6 +681,9 @@ class Regrid(object):
             if factors:
                 self._handle_factors_(fil, fl, num_factors)
 
+            if not isinstance(cache_key, type(None)):
+                cache.store(cache_key, self._routehandle)
+
         if not isinstance(rh_filename, type(None)):
             ESMP_RouteHandleWrite(self._routehandle, rh_filename)
 
@@ -229,14 +709,30 @@ class Regrid(object):
         self._dst_frac_field = dst_frac_field
         # factors and large_file are not considered persistent object metadata
 
+        # global shapes of the gridded dimensions, used to interpret the
+        # factor indices outside of ESMF
+        self._src_shape = None
+        self._dst_shape = None
+        if factors:
+            self._src_shape = _field_global_shape_(srcfield)
+            self._dst_shape = _field_global_shape_(dstfield)
+        # 0-based factors sorted by destination row, built on first use
+        self._sorted_factors = None
+
         # for arbitrary metadata
         self._meta = {}
 
-        # regist with atexit
-        import atexit; atexit.register(self.__del__)
+        # release the ESMF allocations when the Regrid is garbage collected
+        self._finalizer = finalizers.register(self._token,
+                                              _release_routehandle_,
+                                              self._routehandle, self._ptr_fl,
+                                              self._ptr_fil, self._num_factors,
+                                              owner=self)
         self._finalized = False
 
-    def __call__(self, srcfield, dstfield, zero_region=None):
+    @trace.region("ESMPy Regrid apply")
+    def __call__(self, srcfield, dstfield, zero_region=None, src_mask=None,
+                 renormalize=False):
         """
         Call a regridding operation from srcfield to dstfield.
 
@@ -251,16 +747,170 @@ class Regrid(object):
             will be zeroed out before adding the values resulting from the
             interpolation.  If ``None``, defaults to
             :attr:`~esmpy.api.constants.Region.TOTAL`.
+        :param ndarray src_mask: a boolean array which is ``True`` at the
+            source points to leave out of this call, in the layout of
+            :attr:`~esmpy.api.field.Field.data` of ``srcfield``. It may
+            cover only the leading gridded dimensions, in which case it
+            applies to every ungridded element. The stored weights are reused
+            as they are, so a mask changing at every time step does not
+            require a new regridding store. If ``None``, no source point is
+            left out.
+        :param bool renormalize: If ``True``, divide each destination point
+            by the sum of the weights of its source points which are not
+            masked. Destination points left without any source point are
+            treated as unmapped. For conservative weights this gives the
+            result of a regridding store with the same mask and
+            :attr:`~esmpy.api.constants.NormType.FRACAREA`, at the cost of a
+            second sparse matrix multiplication. Defaults to ``False``.
 
         :return: dstfield
         """
+        if (not isinstance(src_mask, type(None))) or renormalize:
+            return _regrid_masked_(self._routehandle, srcfield, dstfield,
+                                   src_mask, renormalize, zero_region)
+
         # call into the ctypes layer
         ESMP_FieldRegrid(srcfield, dstfield,
                          self._routehandle, zeroregion=zero_region)
         return dstfield
 
-    def __del__(self):
-        self.destroy()
+    @trace.region("ESMPy Regrid apply")
+    def regrid_many(self, fields, zero_region=None):
+        """
+        Call a regridding operation on a sequence of source and destination
+        :class:`~esmpy.api.field.Field` pairs which share the
+        same source and destination discretization. All of the pairs are run
+        through the routehandle of this object, so no weights are recomputed.
+        The pairs with the same typekinds and ungridded dimensions are packed
+        along the ungridded dimension of one pair of work
+        :class:`Fields <esmpy.api.field.Field>` and regridded in a single
+        call, i.e. one communication phase instead of one per pair, at the
+        cost of a copy of their data.
+
+        This is a collective call.
+
+        *REQUIRED:*
+
+        :param list fields: a list of ``(srcfield, dstfield)`` tuples.
+
+        *OPTIONAL:*
+
+        :param Region zero_region: specify which region of the field indices
+            will be zeroed out before adding the values resulting from the
+            interpolation.  If ``None``, defaults to
+            :attr:`~esmpy.api.constants.Region.TOTAL`.
+
+        :return: a tuple of the list of the destination
+            :class:`Fields <esmpy.api.field.Field>` and the list of the wall
+            clock time in seconds spent on each pair on the current PET,
+            including the copies into and out of the work Fields and an even
+            share of the regrid call of its group.
+        """
+        return _regrid_many_(self._routehandle, fields, zero_region)
+
+    @trace.region("ESMPy Regrid apply")
+    def regrid_chunked(self, srcfield, dstfield, src_values, dst_values=None,
+                       chunk=1, zero_region=None):
+        """
+        Regrid NumPy arrays with ungridded dimensions that are too large to be
+        held in a :class:`~esmpy.api.field.Field`, ``chunk`` elements of the
+        ungridded dimensions at a time. A single pair of
+        :class:`Fields <esmpy.api.field.Field>` with ``chunk`` ungridded
+        elements is created for the whole call and reused for every block, so
+        the memory held by ESMF scales with ``chunk`` rather than with the
+        size of the ungridded dimensions. ``src_values`` and ``dst_values``
+        may be ``numpy.memmap`` arrays, in which case only one block of each
+        is read or written at a time::
+
+            src = np.load("thetao.npy", mmap_mode="r")
+            dst = np.lib.format.open_memmap("thetao_regridded.npy", mode="w+",
+                                            shape=dstfield.data.shape + src.shape[2:])
+            regrid.regrid_chunked(srcfield, dstfield, src, dst, chunk=75)
+
+        The arrays hold the data of the current PET in the layout of
+        :attr:`~esmpy.api.field.Field.data`: the local gridded dimensions
+        first, followed by any number of ungridded dimensions, e.g.
+        ``(lon, lat, lev, time)``. The blocks are taken in Fortran order over
+        the ungridded dimensions, so an array in Fortran order, like
+        :attr:`~esmpy.api.field.Field.data`, is read contiguously.
+
+        This is a collective call.
+
+        *REQUIRED:*
+
+        :param Field srcfield: a :class:`~esmpy.api.field.Field` on the source
+            discretization of this regridding operator. Its own ungridded
+            dimensions and data are not used.
+        :param Field dstfield: a :class:`~esmpy.api.field.Field` on the
+            destination discretization of this regridding operator. Its own
+            ungridded dimensions and data are not used.
+        :param ndarray src_values: the source data to regrid.
+
+        *OPTIONAL:*
+
+        :param ndarray dst_values: an array to hold the regridded data, with
+            the local gridded shape of ``dstfield`` followed by the ungridded
+            shape of ``src_values``. If ``None``, a new array is allocated.
+        :param int chunk: the number of ungridded elements regridded at a
+            time. Defaults to ``1``.
+        :param Region zero_region: specify which region of the field indices
+            will be zeroed out before adding the values resulting from the
+            interpolation.  If ``None``, defaults to
+            :attr:`~esmpy.api.constants.Region.TOTAL`.
+
+        :return: ndarray of the regridded data
+        """
+        return _regrid_chunked_(self._routehandle, srcfield, dstfield,
+                                src_values, dst_values, chunk, zero_region)
+
+    @trace.region("ESMPy Regrid apply")
+    def apply_transpose(self, dstfield, srcfield, zero_region=None):
+        """
+        Apply the transpose of the regridding weights, i.e. the adjoint of
+        this operator, from dstfield to srcfield. This requires the
+        :class:`~esmpy.api.regrid.Regrid` to be created with ``factors=True``.
+        The routehandle of the transposed weights is computed from the stored
+        factors on the first call and reused afterwards, so no weights are
+        recomputed and the result is exactly the adjoint of
+        :meth:`~esmpy.api.regrid.Regrid.__call__`, unlike the weights of a
+        :class:`~esmpy.api.regrid.Regrid` created in the reverse direction.
+
+        The :class:`Fields <esmpy.api.field.Field>` may have ungridded
+        dimensions, which must match, as for the forward call.
+
+        This is a collective call.
+
+        *REQUIRED:*
+
+        :param Field dstfield: a :class:`~esmpy.api.field.Field` on the
+            destination discretization of this regridding operator, holding
+            the data to transpose.
+        :param Field srcfield: a :class:`~esmpy.api.field.Field` on the source
+            discretization of this regridding operator, to hold the result.
+
+        *OPTIONAL:*
+
+        :param Region zero_region: specify which region of the field indices
+            will be zeroed out before adding the values resulting from the
+            transposed weights.  If ``None``, defaults to
+            :attr:`~esmpy.api.constants.Region.TOTAL`.
+
+        :return: srcfield
+        """
+        if isinstance(self._factor_list, type(None)):
+            raise ValueError("factors are not available, the Regrid must be created with factors=True")
+
+        if isinstance(self._transpose_routehandle, type(None)):
+            factor_list, factor_index_list = self.get_factors()
+            # swap the source and destination indices of every factor
+            self._transpose_routehandle = ESMP_FieldSMMStoreFactors(
+                dstfield, srcfield, factor_list, factor_index_list[:, ::-1])
+            self._transpose_finalizer = finalizers.register(
+                self._token, _release_routehandle_, self._transpose_routehandle)
+
+        ESMP_FieldRegrid(dstfield, srcfield, self._transpose_routehandle,
+                         zeroregion=zero_region)
+        return srcfield
 
     def __repr__(self):
         string = ("Regrid:\n"
@@ -306,6 +956,16 @@ class Regrid(object):
     def dst_mask_values(self):
         return self._dst_mask_values
 
+    @property
+    def dst_shape(self):
+        """
+        :rtype: tuple
+        :return: The global shape of the gridded dimensions of the destination
+            :class:`~esmpy.api.field.Field`. Only available if the
+            :class:`~esmpy.api.regrid.Regrid` was created with ``factors=True``.
+        """
+        return self._dst_shape
+
     @property
     def extrap_method(self):
         return self._extrap_method
@@ -380,6 +1040,16 @@ class Regrid(object):
     def src_mask_values(self):
         return self._src_mask_values
 
+    @property
+    def src_shape(self):
+        """
+        :rtype: tuple
+        :return: The global shape of the gridded dimensions of the source
+            :class:`~esmpy.api.field.Field`. Only available if the
+            :class:`~esmpy.api.regrid.Regrid` was created with ``factors=True``.
+        """
+        return self._src_shape
+
     @property
     def struct(self):
         """
@@ -394,6 +1064,92 @@ class Regrid(object):
     def unmapped_action(self):
         return self._unmapped_action
 
+    def apply(self, src_values, dst_values=None, grid_axis=0):
+        """
+        Apply the regridding weights to NumPy array data without going through
+        :class:`Fields <esmpy.api.field.Field>`. This requires the
+        :class:`~esmpy.api.regrid.Regrid` to be created with ``factors=True``.
+
+        The gridded dimensions of ``src_values`` must match
+        :attr:`~esmpy.api.regrid.Regrid.src_shape` and start at axis
+        ``grid_axis``. Any dimensions before or after them are treated as batch
+        dimensions and are carried through to the result, so a stack of time
+        slices or levels is regridded at once. The batch is processed in
+        blocks written directly into the result, so the temporary memory
+        does not grow with the batch.
+
+        .. note:: The factors held by each PET only cover the destination
+            points owned by that PET, so this method is only safe to use in
+            serial.
+
+        *REQUIRED:*
+
+        :param ndarray src_values: the source data to regrid.
+
+        *OPTIONAL:*
+
+        :param ndarray dst_values: an array to hold the regridded data, of
+            the shape of ``src_values`` with the gridded dimensions replaced
+            by :attr:`~esmpy.api.regrid.Regrid.dst_shape`. It is overwritten
+            in place, the destination points without weights are set to 0.
+            If ``None``, a new array is allocated.
+        :param int grid_axis: the axis of the first gridded dimension in
+            ``src_values`` and ``dst_values``. Defaults to ``0``, matching the
+            layout of :attr:`~esmpy.api.field.Field.data`.
+
+        :return: ndarray of the regridded data
+        """
+        if pet_count() > 1:
+            raise SerialMethod
+        if isinstance(self._factor_list, type(None)):
+            raise ValueError("factors are not available, the Regrid must be created with factors=True")
+
+        rows, cols, weights = self._get_sorted_factors_()
+
+        src_values = np.asarray(src_values)
+        src_view, batch = _gridded_view_(src_values, self.src_shape, grid_axis)
+        ngrid = len(self.src_shape)
+        shape = src_values.shape[:grid_axis] + tuple(self.dst_shape) + \
+            src_values.shape[grid_axis + ngrid:]
+
+        dtype = np.result_type(src_values.dtype, np.float64)
+        if isinstance(dst_values, type(None)):
+            dst_values = np.empty(shape, dtype=dtype)
+        elif tuple(dst_values.shape) != shape:
+            raise ValueError("destination dimensions {0} do not match {1}".format(
+                tuple(dst_values.shape), shape))
+        dst_view, _ = _gridded_view_(dst_values, self.dst_shape, grid_axis)
+
+        if not batch:
+            src_view, dst_view = src_view[..., None], dst_view[..., None]
+            batch = (1,)
+
+        # the batch is walked in blocks written directly into dst_values, so
+        # the temporaries are bounded by _APPLY_BLOCK elements instead of
+        # growing with the batch
+        nsrc = int(np.prod(self.src_shape))
+        ndst = int(np.prod(self.dst_shape))
+        nbatch = int(np.prod(batch))
+        block = max(1, _APPLY_BLOCK // max(weights.size, ndst, 1))
+        starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+        for start in range(0, nbatch, block):
+            stop = min(start + block, nbatch)
+            index = np.unravel_index(np.arange(start, stop), batch)
+            src_block = src_view[(slice(None),) * ngrid + index]
+            src_block = src_block.reshape((nsrc, stop - start))
+
+            dst_block = np.zeros((ndst, stop - start), dtype=dtype)
+            if weights.size > 0:
+                # sum the weighted source values of each destination row in
+                # one reduction over the row-sorted factors
+                contrib = src_block[cols] * weights[:, None]
+                dst_block[rows[starts]] = np.add.reduceat(contrib, starts, axis=0)
+
+            dst_view[(slice(None),) * len(self.dst_shape) + index] = \
+                dst_block.reshape(tuple(self.dst_shape[::-1]) + (stop - start,))
+
+        return dst_values
+
     def copy(self):
         """
         Copy a :class:`~esmpy.api.regrid.Regrid` in an ESMF-safe manner.
@@ -417,22 +1173,126 @@ class Regrid(object):
         # before the destroy method has been called
         if hasattr(self, '_finalized'):
             if not self._finalized:
-                ESMP_FieldRegridRelease(self.routehandle)
+                if not isinstance(self._transpose_finalizer, type(None)):
+                    self._transpose_finalizer()
+                    self._transpose_routehandle = None
+                    self._transpose_finalizer = None
+                self._finalizer()
 
-                # Also destroy factor allocations in Fortran
+                # the factor arrays alias the released Fortran allocations
                 if not isinstance(self._ptr_fl, type(None)):
-                    numfac = ct.c_int(self._num_factors)
                     self._factor_list = None
                     self._factor_index_list = None
                     self._num_factors = None
-                    ESMP_FieldRegridReleaseFactors(self._ptr_fl,
-                                                   self._ptr_fil,
-                                                   numfac)
+                    self._sorted_factors = None
                     self._ptr_fl = None
                     self._ptr_fil = None
 
                 self._finalized = True
 
+    @classmethod
+    @initialize
+    @trace.region("ESMPy Regrid from_weights")
+    def from_weights(cls, path, srcfield, dstfield, check=True):
+        """
+        Create a :class:`~esmpy.api.regrid.Regrid` from a weight file written
+        by :meth:`~esmpy.api.regrid.Regrid.save_weights`. The weights are
+        memory mapped, and each PET reads only an equal, contiguous part of
+        them before they are distributed while the routehandle is computed,
+        so no weights are recomputed and the file is never read in full by
+        any single PET.
+
+        The returned object holds the factors read by the current PET, which
+        are all of them in serial, so :meth:`~esmpy.api.regrid.Regrid.apply`
+        and :meth:`~esmpy.api.regrid.Regrid.to_sparse` can be used on it.
+
+        *REQUIRED:*
+
+        :param str path: the weight file, in either format.
+        :param Field srcfield: the source :class:`~esmpy.api.field.Field`.
+        :param Field dstfield: the destination :class:`~esmpy.api.field.Field`.
+
+        *OPTIONAL:*
+
+        :param bool check: if ``True``, check that the global shapes of the
+            :class:`Fields <esmpy.api.field.Field>` match the ones stored in
+            the file and, if the file was written with the same number of
+            PETs, that their fingerprints match as well. Defaults to ``True``.
+
+        :return: :class:`~esmpy.api.regrid.Regrid`
+        """
+        header, arrays = _open_weights_(path)
+
+        src_shape = _field_global_shape_(srcfield)
+        dst_shape = _field_global_shape_(dstfield)
+        if check:
+            if (tuple(header['src_shape']) != src_shape) or \
+                    (tuple(header['dst_shape']) != dst_shape):
+                raise ValueError("the weights in {0} map {1} to {2}, not {3} to {4}".format(
+                    path, tuple(header['src_shape']), tuple(header['dst_shape']),
+                    src_shape, dst_shape))
+            # fingerprints depend on the decomposition
+            if header['pet_count'] == pet_count():
+                if (header['src_fingerprint'] != _fingerprint_(srcfield)) or \
+                        (header['dst_fingerprint'] != _fingerprint_(dstfield)):
+                    raise ValueError("the weights in {0} were computed for "
+                                     "different Fields".format(path))
+
+        # only the pages of the local part are read from the mapping
+        size = header['num_factors']
+        start, stop = size * local_pet() // pet_count(), size * (local_pet() + 1) // pet_count()
+        factor_list = np.array(arrays['S'][start:stop], dtype=np.float64)
+        factor_index_list = np.empty((stop - start, 2), dtype=np.int32)
+        factor_index_list[:, 0] = arrays['col'][start:stop]
+        factor_index_list[:, 1] = arrays['row'][start:stop]
+        del arrays
+
+        regrid_method = header['regrid_method']
+        if not isinstance(regrid_method, type(None)):
+            regrid_method = RegridMethod(regrid_method)
+
+        return cls._from_factors_(srcfield, dstfield, factor_list,
+                                  factor_index_list, src_shape, dst_shape,
+                                  regrid_method)
+
+    @classmethod
+    def _from_factors_(cls, srcfield, dstfield, factor_list, factor_index_list,
+                       src_shape, dst_shape, regrid_method):
+        """
+        Create a :class:`~esmpy.api.regrid.Regrid` applying the factors of the
+        current PET, computing its routehandle with ESMF_FieldSMMStore().
+        This is a collective call.
+        """
+        ret = cls.__new__(cls)
+        ret._token = finalizers.Token()
+        for name in ('src_mask_values', 'dst_mask_values', 'pole_method',
+                     'regrid_pole_npoints', 'norm_type', 'extrap_method',
+                     'extrap_num_src_pnts', 'extrap_dist_exponent',
+                     'unmapped_action', 'ignore_degenerate', 'filemode',
+                     'src_file', 'dst_file', 'src_file_type', 'dst_file_type',
+                     'src_frac_field', 'dst_frac_field', 'ptr_fl', 'ptr_fil',
+                     'sorted_factors', 'transpose_routehandle',
+                     'transpose_finalizer'):
+            setattr(ret, '_' + name, None)
+        ret._routehandle = ESMP_FieldSMMStoreFactors(srcfield, dstfield,
+                                                     factor_list,
+                                                     factor_index_list)
+        ret._srcfield = srcfield
+        ret._dstfield = dstfield
+        ret._regrid_method = regrid_method
+        ret._factor_list = factor_list
+        ret._factor_index_list = factor_index_list
+        ret._num_factors = factor_list.size
+        ret._src_shape = src_shape
+        ret._dst_shape = dst_shape
+        ret._meta = {}
+
+        ret._finalizer = finalizers.register(ret._token, _release_routehandle_,
+                                             ret._routehandle, owner=ret)
+        ret._finalized = False
+
+        return ret
+
     def get_factors(self, deep_copy=False):
         """
         Return factor and factor index arrays. These arrays will only be
@@ -510,6 +1370,121 @@ class Regrid(object):
 
         return ret
 
+    def save_weights(self, path, format="npz"):
+        """
+        Save the regridding weights to a compact binary file which can be
+        read back with :meth:`~esmpy.api.regrid.Regrid.from_weights` much
+        faster than a netCDF weight file. This requires the
+        :class:`~esmpy.api.regrid.Regrid` to be created with ``factors=True``.
+
+        The file holds the 1-based destination indices ``row`` and source
+        indices ``col`` as int32 and the weights ``S`` as float64, in
+        coordinate format, along with a header recording the regrid method,
+        the global shapes and the fingerprints of the source and destination
+        :class:`Fields <esmpy.api.field.Field>`. Each array is stored
+        contiguously, uncompressed, so that it can be memory mapped.
+
+        ================== ==================================================
+        Format             Description
+        ================== ==================================================
+        ``"npz"``          A NumPy ``.npz`` archive with ``row``, ``col``,
+                           ``S`` and a JSON ``header`` member. Only
+                           available in serial.
+        ``"raw"``          A JSON header followed by the three arrays at
+                           aligned offsets. In parallel, every PET writes its
+                           own factors to the same file.
+        ================== ==================================================
+
+        This is a collective call.
+
+        *REQUIRED:*
+
+        :param str path: the path of the file to write.
+
+        *OPTIONAL:*
+
+        :param str format: ``"npz"`` or ``"raw"``. Defaults to ``"npz"``.
+        """
+        if format not in ("npz", "raw"):
+            raise ValueError("format must be 'npz' or 'raw'")
+        if format == "npz" and pet_count() > 1:
+            raise SerialMethod
+        if isinstance(self._src_shape, type(None)):
+            raise ValueError("factors are not available, the Regrid must be created with factors=True")
+
+        if isinstance(self._factor_list, type(None)):
+            # there are no local factors, e.g. if no destination point is mapped
+            rows = cols = np.zeros(0, dtype=np.int64)
+            weights = np.zeros(0, dtype=np.float64)
+        else:
+            rows, cols, weights = self._get_sorted_factors_()
+        arrays = {'row': (rows + 1).astype(np.int32),
+                  'col': (cols + 1).astype(np.int32),
+                  'S': weights}
+
+        regrid_method = self.regrid_method
+        if not isinstance(regrid_method, type(None)):
+            regrid_method = int(regrid_method)
+        header = {'version': 1,
+                  'layout': 'coo',
+                  'regrid_method': regrid_method,
+                  'src_shape': list(self.src_shape),
+                  'dst_shape': list(self.dst_shape),
+                  'src_fingerprint': _fingerprint_(self.srcfield),
+                  'dst_fingerprint': _fingerprint_(self.dstfield),
+                  'pet_count': pet_count(),
+                  'esmf_version': constants._ESMF_VERSION}
+
+        if format == "raw":
+            _write_weights_raw_(path, header, arrays)
+        else:
+            _write_weights_npz_(path, header, arrays)
+
+    def to_sparse(self):
+        """
+        Return the regridding weights as a SciPy CSR sparse matrix of shape
+        ``(prod(dst_shape), prod(src_shape))`` with 0-based indices. Row and
+        column indices follow the Fortran (first dimension fastest) ordering of
+        the gridded dimensions, so ``field.data.ravel(order='F')`` is a valid
+        operand for a :class:`~esmpy.api.field.Field` without ungridded
+        dimensions. The gridded shapes are attached to the returned matrix as
+        ``src_shape`` and ``dst_shape`` attributes.
+
+        This requires the :class:`~esmpy.api.regrid.Regrid` to be created with
+        ``factors=True`` and SciPy to be installed. In parallel, the matrix
+        holds the factors of the current PET only.
+
+        :return: scipy.sparse.csr_matrix
+        """
+        try:
+            import scipy.sparse
+        except ImportError:
+            raise ImportError("SciPy is required for Regrid.to_sparse()")
+        if isinstance(self._factor_list, type(None)):
+            raise ValueError("factors are not available, the Regrid must be created with factors=True")
+
+        rows, cols, weights = self._get_sorted_factors_()
+        shape = (int(np.prod(self.dst_shape)), int(np.prod(self.src_shape)))
+        ret = scipy.sparse.csr_matrix((weights, (rows, cols)), shape=shape)
+        ret.src_shape = self.src_shape
+        ret.dst_shape = self.dst_shape
+
+        return ret
+
+    def _get_sorted_factors_(self):
+        """
+        Return 0-based destination indices, 0-based source indices and weights
+        sorted by destination index. The arrays are cached on first use.
+        """
+        if isinstance(self._sorted_factors, type(None)):
+            fl, fil = self.get_factors()
+            rows = fil[:, 1].astype(np.int64) - 1
+            cols = fil[:, 0].astype(np.int64) - 1
+            order = np.argsort(rows, kind='stable')
+            self._sorted_factors = (rows[order], cols[order], fl[order])
+
+        return self._sorted_factors
+
     def _handle_factors_(self, fil, fl, num_factors):
         """Handle factor array creation and referencing."""
 
@@ -523,18 +1498,18 @@ class Regrid(object):
             self._ptr_fl = fl
             # Cast the pointer to the appropriate size.
             cptr_fl = ct.cast(fl, ct.POINTER(ct.c_double * self._num_factors))
-            self._factor_list = np.frombuffer(cptr_fl.contents,
-                                              count=self._num_factors,
-                                              dtype=np.float64)
+            self._factor_list = ndarray_owned(
+                np.frombuffer(cptr_fl.contents, count=self._num_factors,
+                              dtype=np.float64), self._token)
 
             # The factor index list is (m, 2) hence the multiplication
             # of the factor count by 2.
             self._ptr_fil = fil  # Hold onto the pointer for deallocation
             cptr_fil = ct.cast(fil,
                                ct.POINTER(ct.c_int * self._num_factors * 2))
-            self._factor_index_list = np.frombuffer(cptr_fil.contents,
-                                                    count=self._num_factors * 2,
-                                                    dtype=np.int32)
+            self._factor_index_list = ndarray_owned(
+                np.frombuffer(cptr_fil.contents, count=self._num_factors * 2,
+                              dtype=np.int32), self._token)
             self._factor_index_list = self._factor_index_list.reshape(
                 self._num_factors, 2)
         else:
@@ -573,17 +1548,40 @@ class RegridFromFile(object):
         weights.
     :param string rh_filename: the name of the file from which to retrieve the
         routehandle information.
+
+    *OPTIONAL:*
+
+    :param bool lazy: if ``True``, each PET reads only an equal, contiguous
+        part of the weights in ``filename`` and the parts are distributed
+        while the routehandle is computed, instead of the whole weight matrix
+        being read at once. This bounds the memory used for large weight
+        files. Classic and 64 bit offset netCDF files are memory mapped,
+        which requires scipy, other netCDF formats are read with hyperslabs,
+        which requires netCDF4. Defaults to ``False``.
     """
 
     @initialize
-    def __init__(self, srcfield, dstfield, filename=None, rh_filename=None):
+    @trace.region("ESMPy RegridFromFile store")
+    def __init__(self, srcfield, dstfield, filename=None, rh_filename=None,
+                 lazy=False):
 
         if (not isinstance(filename, type(None))) and (not isinstance(rh_filename, type(None))):
             raise ValueError('only a regrid file or a routehandle file can be specified')
         elif (isinstance(filename, type(None))) and (isinstance(rh_filename, type(None))):
             raise ValueError('either a regrid file or a routehandle file must be specified')
 
-        if not isinstance(filename, type(None)):
+        if lazy and isinstance(filename, type(None)):
+            raise ValueError('lazy loading requires a regrid file')
+
+        # the lifetime of the ESMF allocation, shared with shallow copies
+        self._token = finalizers.Token()
+
+        if lazy:
+            factor_list, factor_index_list = _read_weights_(filename)
+            self._routehandle = ESMP_FieldSMMStoreFactors(srcfield, dstfield,
+                                                          factor_list,
+                                                          factor_index_list)
+        elif not isinstance(filename, type(None)):
             self._routehandle = ESMP_FieldSMMStore(srcfield, dstfield, filename)
         elif not isinstance(rh_filename, type(None)):
             self._routehandle = ESMP_RouteHandleCreateFromFile(rh_filename)
@@ -591,12 +1589,16 @@ class RegridFromFile(object):
         # Holds arbitrary metadata if needed by the client.
         self._meta = {}
 
-        # Register with "atexit" to attempt and ensure __del__ is called by
-        # the Python garbage collector.
-        import atexit; atexit.register(self.__del__)
+        # release the ESMF allocation when the RegridFromFile is garbage
+        # collected
+        self._finalizer = finalizers.register(self._token,
+                                              _release_routehandle_,
+                                              self._routehandle, owner=self)
         self._finalized = False
 
-    def __call__(self, srcfield, dstfield, zero_region=None):
+    @trace.region("ESMPy RegridFromFile apply")
+    def __call__(self, srcfield, dstfield, zero_region=None, src_mask=None,
+                 renormalize=False):
         """
         Call a regridding operation from srcfield to dstfield.
 
@@ -611,17 +1613,122 @@ class RegridFromFile(object):
             will be zeroed out before adding the values resulting from the
             interpolation.  If ``None``, defaults to
             :attr:`~esmpy.api.constants.Region.TOTAL`.
+        :param ndarray src_mask: a boolean array which is ``True`` at the
+            source points to leave out of this call, in the layout of
+            :attr:`~esmpy.api.field.Field.data` of ``srcfield``. It may
+            cover only the leading gridded dimensions, in which case it
+            applies to every ungridded element. The stored weights are reused
+            as they are, so a mask changing at every time step does not
+            require a new regridding store. If ``None``, no source point is
+            left out.
+        :param bool renormalize: If ``True``, divide each destination point
+            by the sum of the weights of its source points which are not
+            masked. Destination points left without any source point are
+            treated as unmapped. For conservative weights this gives the
+            result of a regridding store with the same mask and
+            :attr:`~esmpy.api.constants.NormType.FRACAREA`, at the cost of a
+            second sparse matrix multiplication. Defaults to ``False``.
 
         :return: dstfield
         """
 
+        if (not isinstance(src_mask, type(None))) or renormalize:
+            return _regrid_masked_(self._routehandle, srcfield, dstfield,
+                                   src_mask, renormalize, zero_region)
+
         # call into the ctypes layer
         ESMP_FieldRegrid(srcfield, dstfield,
                          self._routehandle, zeroregion=zero_region)
         return dstfield
 
-    def __del__(self):
-        self.destroy()
+    @trace.region("ESMPy RegridFromFile apply")
+    def regrid_many(self, fields, zero_region=None):
+        """
+        Call a regridding operation on a sequence of source and destination
+        :class:`~esmpy.api.field.Field` pairs which share the
+        same source and destination discretization. All of the pairs are run
+        through the routehandle of this object, so no weights are recomputed.
+        The pairs with the same typekinds and ungridded dimensions are packed
+        along the ungridded dimension of one pair of work
+        :class:`Fields <esmpy.api.field.Field>` and regridded in a single
+        call, i.e. one communication phase instead of one per pair, at the
+        cost of a copy of their data.
+
+        This is a collective call.
+
+        *REQUIRED:*
+
+        :param list fields: a list of ``(srcfield, dstfield)`` tuples.
+
+        *OPTIONAL:*
+
+        :param Region zero_region: specify which region of the field indices
+            will be zeroed out before adding the values resulting from the
+            interpolation.  If ``None``, defaults to
+            :attr:`~esmpy.api.constants.Region.TOTAL`.
+
+        :return: a tuple of the list of the destination
+            :class:`Fields <esmpy.api.field.Field>` and the list of the wall
+            clock time in seconds spent on each pair on the current PET,
+            including the copies into and out of the work Fields and an even
+            share of the regrid call of its group.
+        """
+        return _regrid_many_(self._routehandle, fields, zero_region)
+
+    @trace.region("ESMPy RegridFromFile apply")
+    def regrid_chunked(self, srcfield, dstfield, src_values, dst_values=None,
+                       chunk=1, zero_region=None):
+        """
+        Regrid NumPy arrays with ungridded dimensions that are too large to be
+        held in a :class:`~esmpy.api.field.Field`, ``chunk`` elements of the
+        ungridded dimensions at a time. A single pair of
+        :class:`Fields <esmpy.api.field.Field>` with ``chunk`` ungridded
+        elements is created for the whole call and reused for every block, so
+        the memory held by ESMF scales with ``chunk`` rather than with the
+        size of the ungridded dimensions. ``src_values`` and ``dst_values``
+        may be ``numpy.memmap`` arrays, in which case only one block of each
+        is read or written at a time::
+
+            src = np.load("thetao.npy", mmap_mode="r")
+            dst = np.lib.format.open_memmap("thetao_regridded.npy", mode="w+",
+                                            shape=dstfield.data.shape + src.shape[2:])
+            regrid.regrid_chunked(srcfield, dstfield, src, dst, chunk=75)
+
+        The arrays hold the data of the current PET in the layout of
+        :attr:`~esmpy.api.field.Field.data`: the local gridded dimensions
+        first, followed by any number of ungridded dimensions, e.g.
+        ``(lon, lat, lev, time)``. The blocks are taken in Fortran order over
+        the ungridded dimensions, so an array in Fortran order, like
+        :attr:`~esmpy.api.field.Field.data`, is read contiguously.
+
+        This is a collective call.
+
+        *REQUIRED:*
+
+        :param Field srcfield: a :class:`~esmpy.api.field.Field` on the source
+            discretization of this regridding operator. Its own ungridded
+            dimensions and data are not used.
+        :param Field dstfield: a :class:`~esmpy.api.field.Field` on the
+            destination discretization of this regridding operator. Its own
+            ungridded dimensions and data are not used.
+        :param ndarray src_values: the source data to regrid.
+
+        *OPTIONAL:*
+
+        :param ndarray dst_values: an array to hold the regridded data, with
+            the local gridded shape of ``dstfield`` followed by the ungridded
+            shape of ``src_values``. If ``None``, a new array is allocated.
+        :param int chunk: the number of ungridded elements regridded at a
+            time. Defaults to ``1``.
+        :param Region zero_region: specify which region of the field indices
+            will be zeroed out before adding the values resulting from the
+            interpolation.  If ``None``, defaults to
+            :attr:`~esmpy.api.constants.Region.TOTAL`.
+
+        :return: ndarray of the regridded data
+        """
+        return _regrid_chunked_(self._routehandle, srcfield, dstfield,
+                                src_values, dst_values, chunk, zero_region)
 
     def __repr__(self):
         string = "RegridFromFile:\n    routehandle = {}\n".format(self._routehandle)
@@ -686,5 +1793,249 @@ class RegridFromFile(object):
 
         if hasattr(self, '_finalized'):
             if not self._finalized:
-                ESMP_FieldRegridRelease(self.routehandle)
+                self._finalizer()
                 self._finalized = True
+
+
+class _BatchWeightCache(object):
+    """
+    Delegate to the :class:`~esmpy.api.weightcache.WeightCache` ``cache``,
+    computing its keys with the fingerprint ``memo`` of a
+    :class:`RegridStoreBatch`.
+    """
+
+    def __init__(self, cache, memo):
+        self._cache = cache
+        self._memo = memo
+
+    def key(self, srcfield, dstfield, **options):
+        return self._cache.key(srcfield, dstfield, memo=self._memo, **options)
+
+    def load(self, key):
+        return self._cache.load(key)
+
+    def store(self, key, routehandle):
+        return self._cache.store(key, routehandle)
+
+class RegridStoreBatch(object):
+    """
+    The :class:`~esmpy.api.regrid.RegridStoreBatch` object holds one
+    :class:`~esmpy.api.regrid.Regrid` from a single source
+    :class:`~esmpy.api.field.Field` to each of a list of destination
+    :class:`Fields <esmpy.api.field.Field>`, e.g. from a model grid to all of
+    its product grids and station :class:`LocStreams <esmpy.api.locstream.LocStream>`::
+
+        batch = esmpy.RegridStoreBatch(srcfield, [dstfield1, dstfield2],
+                                       regrid_method=esmpy.RegridMethod.CONSERVE,
+                                       cache="weights")
+        for regrid, dstfield in zip(batch, batch.dstfields):
+            regrid(srcfield, dstfield)
+
+    With a ``cache``, the work done by ESMPy on the source side is shared by
+    the operators: the :class:`~esmpy.api.weightcache.WeightCache` is opened
+    once and the source :class:`~esmpy.api.field.Field` is fingerprinted
+    once for all of the cache lookups. ESMF builds its source mesh and
+    search structures within each ESMF_FieldRegridStore() call, so combined
+    with a cache the batch pays for them only on the first run. Without a
+    ``cache`` nothing is shared, and the batch is the same as one
+    :class:`~esmpy.api.regrid.Regrid` for each destination.
+
+    This is a collective call.
+
+    *REQUIRED:*
+
+    :param Field srcfield: the source :class:`~esmpy.api.field.Field`.
+    :param list dstfields: the destination
+        :class:`Fields <esmpy.api.field.Field>`.
+
+    *OPTIONAL:*
+
+    :param kwargs: the options of :class:`~esmpy.api.regrid.Regrid`, which
+        are used for every destination. ``filename``, ``rh_filename``,
+        ``src_frac_field`` and ``dst_frac_field`` belong to a single operator
+        and are not accepted.
+    """
+
+    @initialize
+    @trace.region("ESMPy RegridStoreBatch store")
+    def __init__(self, srcfield, dstfields, **kwargs):
+        for name in ('filename', 'rh_filename', 'src_frac_field', 'dst_frac_field'):
+            if not isinstance(kwargs.get(name), type(None)):
+                raise ValueError("{0} cannot be used for all of the Regrids of "
+                                 "a batch".format(name))
+        cache = kwargs.get('cache')
+        if not isinstance(cache, (type(None), WeightCache)):
+            kwargs['cache'] = WeightCache(cache)
+
+        self._srcfield = srcfield
+        self._dstfields = list(dstfields)
+        self._regrids = []
+        self._timings = []
+
+        # the Fields are not modified while the batch is stored, so their
+        # fingerprints are computed once for all of the cache lookups
+        if not isinstance(kwargs.get('cache'), type(None)):
+            kwargs['cache'] = _BatchWeightCache(kwargs['cache'], {})
+        try:
+            for dstfield in self._dstfields:
+                start = time.perf_counter()
+                self._regrids.append(Regrid(srcfield, dstfield, **kwargs))
+                self._timings.append(time.perf_counter() - start)
+        except:
+            self.destroy()
+            raise
+
+    def __getitem__(self, index):
+        return self._regrids[index]
+
+    def __iter__(self):
+        return iter(self._regrids)
+
+    def __len__(self):
+        return len(self._regrids)
+
+    def __repr__(self):
+        string = ("RegridStoreBatch:\n"
+                  "    srcfield = %r\n"
+                  "    regrids = %r\n"
+                  %
+                  (self.srcfield,
+                   self.regrids))
+
+        return string
+
+    @property
+    def dstfields(self):
+        """
+        :rtype: list
+        :return: The destination :class:`Fields <esmpy.api.field.Field>`, in
+            the order of the operators.
+        """
+        return self._dstfields
+
+    @property
+    def regrids(self):
+        """
+        :rtype: list
+        :return: The :class:`Regrids <esmpy.api.regrid.Regrid>`, one for each
+            destination :class:`~esmpy.api.field.Field`.
+        """
+        return self._regrids
+
+    @property
+    def srcfield(self):
+        """
+        :rtype: :class:`~esmpy.api.field.Field`
+        :return: The source :class:`~esmpy.api.field.Field`.
+        """
+        return self._srcfield
+
+    @property
+    def timings(self):
+        """
+        :rtype: list
+        :return: The wall clock time in seconds spent creating each operator
+            on the current PET.
+        """
+        return self._timings
+
+    def destroy(self):
+        """
+        Release the memory associated with the
+        :class:`Regrids <esmpy.api.regrid.Regrid>` of the batch.
+        """
+        for regrid in self._regrids:
+            regrid.destroy()
+
+def _compose_factors_(first, second, src_size):
+    """
+    Return the 0-based destination indices, source indices and weights of
+    the product of two operators given as factors sorted by destination
+    index, ``second`` applied after ``first``. The product is sorted by
+    destination index with duplicate entries summed.
+    """
+    rows1, cols1, weights1 = first
+    rows2, cols2, weights2 = second
+
+    # the run of factors of the first operator writing each intermediate
+    # point read by the second
+    start = np.searchsorted(rows1, cols2, side='left')
+    count = np.searchsorted(rows1, cols2, side='right') - start
+    outer = np.repeat(np.arange(cols2.size), count)
+    inner = np.repeat(start - np.cumsum(count) + count, count) + np.arange(count.sum())
+
+    key = rows2[outer] * src_size + cols1[inner]
+    key, inverse = np.unique(key, return_inverse=True)
+    weights = np.bincount(inverse.reshape(-1), weights=weights2[outer] * weights1[inner],
+                          minlength=key.size)
+
+    return key // src_size, key % src_size, weights
+
+@trace.region("ESMPy Regrid compose")
+def compose(*regrids, tolerance=1e-12):
+    """
+    Fold a chain of regridding operators into a single
+    :class:`~esmpy.api.regrid.Regrid`, so that the data is regridded from the
+    source of the first one to the destination of the last one in a single
+    pass, without the intermediate :class:`Fields <esmpy.api.field.Field>`::
+
+        regrid_ac = esmpy.compose(regrid_ab, regrid_bc)
+        dstfield = regrid_ac(srcfield, dstfield)
+
+    The product of the weight matrices is computed once from the factors of
+    the operators, which must be created with ``factors=True``, and the
+    destination of each operator must have the global shape of the source of
+    the next one. The returned :class:`~esmpy.api.regrid.Regrid` holds the
+    composed factors, so it can be composed further or saved with
+    :meth:`~esmpy.api.regrid.Regrid.save_weights`.
+
+    .. note:: The factors held by each PET only cover the destination points
+        owned by that PET, so this function is only safe to use in serial.
+
+    *REQUIRED:*
+
+    :param Regrid regrids: two or more
+        :class:`Regrids <esmpy.api.regrid.Regrid>`, in the order in which
+        they are applied.
+
+    *OPTIONAL:*
+
+    :param float tolerance: the composed weights whose magnitude is not
+        greater than this are dropped. Defaults to ``1e-12``.
+
+    :return: :class:`~esmpy.api.regrid.Regrid`
+    """
+    if pet_count() > 1:
+        raise SerialMethod
+    if len(regrids) < 2:
+        raise ValueError("at least two Regrids are needed for a composition")
+    for regrid in regrids:
+        if isinstance(regrid._factor_list, type(None)) or \
+                isinstance(regrid._src_shape, type(None)):
+            raise ValueError("factors are not available, the Regrids must be created with factors=True")
+    for first, second in zip(regrids[:-1], regrids[1:]):
+        if tuple(first.dst_shape) != tuple(second.src_shape):
+            raise ValueError("a Regrid to {0} cannot be followed by a Regrid "
+                             "from {1}".format(tuple(first.dst_shape),
+                                               tuple(second.src_shape)))
+
+    src_size = int(np.prod(regrids[0].src_shape))
+    rows, cols, weights = regrids[0]._get_sorted_factors_()
+    for regrid in regrids[1:]:
+        rows, cols, weights = _compose_factors_((rows, cols, weights),
+                                                regrid._get_sorted_factors_(),
+                                                src_size)
+
+    keep = np.abs(weights) > tolerance
+    factor_list = np.ascontiguousarray(weights[keep], dtype=np.float64)
+    factor_index_list = np.empty((factor_list.size, 2), dtype=np.int32)
+    factor_index_list[:, 0] = cols[keep] + 1
+    factor_index_list[:, 1] = rows[keep] + 1
+
+    methods = set(regrid.regrid_method for regrid in regrids)
+    regrid_method = methods.pop() if len(methods) == 1 else None
+
+    return Regrid._from_factors_(regrids[0].srcfield, regrids[-1].dstfield,
+                                 factor_list, factor_index_list,
+                                 tuple(regrids[0].src_shape),
+                                 tuple(regrids[-1].dst_shape), regrid_method)
@@ -0,0 +1,210 @@
+# $Id$
+
+"""
+The streaming regrid API
+"""
+
+#### IMPORT LIBRARIES #########################################################
+
+from concurrent.futures import ThreadPoolExecutor
+
+from esmpy.api.field import *
+from esmpy.api import trace
+
+#### UTILITIES ################################################################
+
+def _slab_(field, localde, timeslice):
+    """
+    Return the index of the part of ``field`` on the local DE ``localde`` in
+    a netCDF variable with dimensions ``(time, <ungridded>, <gridded>)`` in C
+    order, which is the reverse of the Fortran order of
+    :attr:`~esmpy.api.field.Field.data`.
+    """
+    gridded = field.rank - field.xd
+    lb = field.local_lower_bounds[localde]
+    ub = field.local_upper_bounds[localde]
+    slices = [slice(int(lb[d]), int(ub[d])) for d in range(gridded)]
+    slices += [slice(None)] * field.xd
+    return (timeslice - 1,) + tuple(reversed(slices))
+
+def _read_slab_(variable, field, timeslice):
+    """
+    Read the local part of ``timeslice`` of ``variable`` into each local DE
+    of ``field``.
+    """
+    # netCDF4 releases the GIL while reading, which lets the regridding of
+    # the previous time slice proceed
+    for localde, data in enumerate(field.local_data):
+        values = np.asarray(variable[_slab_(field, localde, timeslice)])
+        data[...] = values.T
+
+def _stream_read_(regrid, srcfield, dstfield, filename, variable, timeslices,
+                  dst_writer, zero_region):
+    """
+    Regrid ``timeslices`` of ``variable``, each read synchronously with
+    :meth:`~esmpy.api.field.Field.read`, see :func:`stream_regrid`.
+    """
+    for timeslice in timeslices:
+        srcfield.read(filename, variable, timeslice=timeslice)
+        dstfield = regrid(srcfield, dstfield, zero_region=zero_region)
+        if dst_writer is not None:
+            dst_writer(timeslice, dstfield)
+        yield timeslice, dstfield
+
+def _stream_netcdf_(regrid, srcfield, dstfield, Dataset, filename, variable,
+                    timeslices, dst_writer, prefetch, zero_region):
+    """
+    Regrid ``timeslices`` of ``variable``, read with the netCDF4 ``Dataset``
+    class, reading the next time slice in a background thread if
+    ``prefetch`` is set, see :func:`stream_regrid`.
+    """
+    dataset = Dataset(filename)
+    executor = None
+    buffers = [srcfield]
+    try:
+        ncvar = dataset.variables[variable]
+        ncvar.set_auto_mask(False)
+        if ncvar.ndim != srcfield.rank + 1:
+            raise ValueError("variable {0} has {1} dimensions, {2} expected "
+                             "for a time dimension and the dimensions of the "
+                             "source Field".format(variable, ncvar.ndim,
+                                                   srcfield.rank + 1))
+        if timeslices is None:
+            timeslices = range(1, ncvar.shape[0] + 1)
+        timeslices = list(timeslices)
+
+        if prefetch and len(timeslices) > 1:
+            executor = ThreadPoolExecutor(max_workers=1)
+            buffers.append(Field(srcfield.grid, name=srcfield.name,
+                                 typekind=srcfield.type,
+                                 staggerloc=srcfield.staggerloc,
+                                 ndbounds=srcfield.ndbounds))
+
+        pending = None
+        if timeslices:
+            with trace.region("ESMPy stream_regrid read"):
+                _read_slab_(ncvar, buffers[0], timeslices[0])
+
+        for index, timeslice in enumerate(timeslices):
+            current = buffers[index % len(buffers)]
+            following = index + 1 < len(timeslices)
+
+            if following and executor is not None:
+                pending = executor.submit(_read_slab_, ncvar,
+                                          buffers[(index + 1) % len(buffers)],
+                                          timeslices[index + 1])
+
+            dstfield = regrid(current, dstfield, zero_region=zero_region)
+
+            if pending is not None:
+                with trace.region("ESMPy stream_regrid read"):
+                    pending.result()
+                pending = None
+            elif following:
+                with trace.region("ESMPy stream_regrid read"):
+                    _read_slab_(ncvar, buffers[(index + 1) % len(buffers)],
+                                timeslices[index + 1])
+
+            if dst_writer is not None:
+                dst_writer(timeslice, dstfield)
+            yield timeslice, dstfield
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+        dataset.close()
+        for field in buffers[1:]:
+            field.destroy()
+
+#### stream_regrid ############################################################
+
+def stream_regrid(regrid, srcfield, dstfield, filename, variable,
+                  timeslices=None, dst_writer=None, prefetch=True,
+                  zero_region=None):
+    """
+    Regrid the time slices of a netCDF variable one after the other,
+    reading time slice ``t+1`` while time slice ``t`` is being regridded.
+    It returns a generator which yields ``(timeslice, dstfield)`` once each
+    time slice is regridded. ``dstfield`` is overwritten by the next time slice,
+    so its data must be used or copied before the generator is advanced::
+
+        for timeslice, dstfield in esmpy.stream_regrid(regrid, srcfield, dstfield,
+                                                       "tas_day.nc", "tas"):
+            output[timeslice - 1] = dstfield.data
+
+    The source variable must have the time as its first dimension, followed by
+    the ungridded dimensions of ``srcfield`` and its gridded dimensions, in the
+    C order used by netCDF, e.g. ``(time, lev, lat, lon)`` for a
+    :class:`~esmpy.api.field.Field` with ``data`` of shape ``(lon, lat, lev)``.
+    Each PET reads the part of the variable it owns.
+
+    Prefetching uses a second :class:`~esmpy.api.field.Field` on the source
+    :class:`~esmpy.api.grid.Grid` so that the two time slices do not share
+    memory, and a background thread which reads with netCDF4. Only the reads
+    run in the background thread; all ESMF calls and ``dst_writer`` run in the
+    calling thread, and ``dst_writer`` is only called while no read is in
+    progress, so it may use netCDF4 as well.
+
+    Each local DE of ``srcfield`` is read separately. A multi-tile
+    :class:`~esmpy.api.grid.Grid`, such as a cubed sphere, is not supported.
+
+    If netCDF4 is not installed or ``srcfield`` is built on a
+    :class:`~esmpy.api.mesh.Mesh`, whose owned elements are not contiguous in
+    the file, each time slice is instead read synchronously with
+    :meth:`~esmpy.api.field.Field.read`. It does not support ungridded
+    dimensions, so a ``ValueError`` is raised in that case if ``srcfield``
+    has any.
+
+    This is a collective call.
+
+    *REQUIRED:*
+
+    :param Regrid regrid: the :class:`~esmpy.api.regrid.Regrid` or
+        :class:`~esmpy.api.regrid.RegridFromFile` from ``srcfield`` to
+        ``dstfield``.
+    :param Field srcfield: the source :class:`~esmpy.api.field.Field`.
+    :param Field dstfield: the destination :class:`~esmpy.api.field.Field`.
+    :param str filename: the name of the netCDF file.
+    :param str variable: the name of the variable to read.
+
+    *OPTIONAL:*
+
+    :param list timeslices: the 1-based time slices to regrid, in order. If
+        ``None``, all time slices of the variable are regridded, which requires
+        netCDF4.
+    :param dst_writer: a function called as ``dst_writer(timeslice, dstfield)``
+        for each regridded time slice, before it is yielded.
+    :param bool prefetch: if ``False``, each time slice is read only after the
+        previous one is regridded. Defaults to ``True``.
+    :param Region zero_region: specify which region of the field indices
+        will be zeroed out before adding the values resulting from the
+        interpolation.  If ``None``, defaults to
+        :attr:`~esmpy.api.constants.Region.TOTAL`.
+
+    :return: a generator of ``(timeslice, dstfield)`` tuples
+    """
+    try:
+        from netCDF4 import Dataset
+    except ImportError:
+        Dataset = None
+
+    # the arguments are checked here rather than when the generator is
+    # first advanced
+    if isinstance(srcfield.grid, Mesh) or Dataset is None:
+        if srcfield.xd > 0:
+            raise ValueError("a source Field with ungridded dimensions can "
+                             "only be streamed from a Grid with netCDF4 "
+                             "installed")
+        if timeslices is None:
+            raise ValueError("timeslices must be given to read without netCDF4")
+        return _stream_read_(regrid, srcfield, dstfield, filename, variable,
+                             timeslices, dst_writer, zero_region)
+
+    # the bounds of the DEs of a multi-tile Grid are local to their tile,
+    # which has no dimension in the variable
+    if isinstance(srcfield.grid, Grid) and srcfield.grid.decount > 1:
+        raise ValueError("streaming the Fields of a multi-tile Grid is not "
+                         "supported")
+
+    return _stream_netcdf_(regrid, srcfield, dstfield, Dataset, filename,
+                           variable, timeslices, dst_writer, prefetch,
+                           zero_region)
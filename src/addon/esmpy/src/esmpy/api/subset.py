@@ -0,0 +1,318 @@
+# $Id$
+
+"""
+The collective subsetting of Grids, LocStreams and Fields
+"""
+
+#### IMPORT LIBRARIES #########################################################
+
+import weakref
+
+from esmpy.api.field import *
+from esmpy.api import trace
+
+#### UTILITIES ################################################################
+
+def _global_extent_(field):
+    """
+    Return the global shape of the gridded dimensions of a
+    :class:`~esmpy.api.field.Field` on a single tile
+    :class:`~esmpy.api.grid.Grid`. This is a collective call.
+    """
+    rank = field.rank - field.xd
+    local = np.zeros(rank, dtype=np.float64)
+    for ub in field.local_upper_bounds:
+        local = np.maximum(local, ub[:rank])
+
+    mg = Manager()
+    extent = np.zeros(rank, dtype=np.float64)
+    mg._reduce_(local, extent, extent.size, reduceflag=Reduce.MAX)
+    mg._broadcast_(extent, extent.size)
+
+    return extent.astype(np.int64)
+
+def _sequence_index_(indices, extent):
+    """
+    Return the 1-based ESMF sequence indices of the 0-based global
+    ``indices`` of a single tile index space of shape ``extent``.
+    """
+    ret = np.ones(indices[0].shape, dtype=np.int64)
+    stride = 1
+    for index, size in zip(indices, extent):
+        ret += index * stride
+        stride *= int(size)
+
+    return ret
+
+def _identity_factors_(srcfield, dstfield, lower):
+    """
+    Return the factors copying ``srcfield`` to the local DEs of
+    ``dstfield``, whose global index 0 is ``lower`` in ``srcfield``. The
+    index of a periodic dimension wraps around, which gives the last corner
+    of a subset ending at the periodic edge. This is a collective call.
+    """
+    rank = dstfield.rank - dstfield.xd
+    src_extent = _global_extent_(srcfield)
+    dst_extent = _global_extent_(dstfield)
+
+    src = []
+    dst = []
+    for lb, ub in zip(dstfield.local_lower_bounds, dstfield.local_upper_bounds):
+        index = np.meshgrid(*[np.arange(lb[d], ub[d], dtype=np.int64)
+                              for d in range(rank)], indexing="ij")
+        index = [i.reshape(-1) for i in index]
+        dst.append(_sequence_index_(index, dst_extent))
+        src.append(_sequence_index_([(index[d] + lower[d]) % src_extent[d]
+                                     for d in range(rank)], src_extent))
+
+    factor_index_list = np.empty((sum(i.size for i in dst), 2), dtype=np.int32)
+    if dst:
+        factor_index_list[:, 0] = np.concatenate(src)
+        factor_index_list[:, 1] = np.concatenate(dst)
+    factor_list = np.ones(factor_index_list.shape[0], dtype=np.float64)
+
+    return factor_list, factor_index_list
+
+def _redistribute_(srcfield, dstfield, factors):
+    """
+    Copy ``srcfield`` into ``dstfield`` across PETs with the identity
+    ``factors``. This returns a function doing the copy, which must finally
+    be called with ``done=True`` to release the routehandle. This is a
+    collective call.
+    """
+    routehandle = ESMP_FieldSMMStoreFactors(srcfield, dstfield, *factors)
+
+    def redistribute(done=False):
+        if done:
+            ESMP_FieldRegridRelease(routehandle)
+        else:
+            ESMP_FieldRegrid(srcfield, dstfield, routehandle)
+
+    return redistribute
+
+def _inside_(values, bounds, coord_dim, coord_sys):
+    """
+    Return whether ``values`` of coordinate dimension ``coord_dim`` lie in
+    ``bounds``. Longitudes wrap around, so ``(350, 10)`` selects 20 degrees
+    across the prime meridian.
+    """
+    vmin, vmax = bounds
+    if coord_dim == 0 and coord_sys in (None, CoordSys.SPH_DEG, CoordSys.SPH_RAD):
+        period = 2 * np.pi if coord_sys == CoordSys.SPH_RAD else 360.
+        if vmax - vmin >= period:
+            return np.ones(np.shape(values), dtype=bool)
+        return np.mod(values - vmin, period) <= np.mod(vmax - vmin, period)
+
+    return (values >= vmin) & (values <= vmax)
+
+def _check_bounds_(bounds, rank):
+    bounds = [tuple(b) for b in bounds]
+    if len(bounds) != rank or any(len(b) != 2 for b in bounds):
+        raise ValueError("bounds must hold a (min, max) pair for each of the "
+                         "{0} coordinate dimensions".format(rank))
+    return bounds
+
+#### Grid ####################################################################
+
+@trace.region("ESMPy Grid subset")
+def _subset_grid_(grid, lower, upper):
+    if grid.decount > 1:
+        raise ValueError("subsets of multi-tile Grids are not supported")
+
+    lower = np.array(lower, dtype=np.int32).reshape(-1)
+    upper = np.array(upper, dtype=np.int32).reshape(-1)
+    if lower.size != grid.rank or upper.size != grid.rank:
+        raise ValueError("lower and upper must have {0} values".format(grid.rank))
+    # the box wraps around the edge of a periodic dimension, its indices past
+    # the edge are taken modulo the extent by _identity_factors_
+    limit = np.array(grid.max_index, dtype=np.int32)
+    if grid.num_peri_dims == 1:
+        limit[grid.periodic_dim] += lower[grid.periodic_dim]
+    if np.any(lower < 0) or np.any(lower >= grid.max_index) or \
+            np.any(upper > limit) or np.any(lower >= upper):
+        raise ValueError("the index box [{0}, {1}) is empty or not within the "
+                         "Grid of shape {2}".format(lower.tolist(), upper.tolist(),
+                                                    grid.max_index.tolist()))
+
+    # a periodic dimension stays periodic if the subset spans all of it
+    keywords = {}
+    if grid.num_peri_dims == 1 and \
+            upper[grid.periodic_dim] - lower[grid.periodic_dim] == \
+            grid.max_index[grid.periodic_dim]:
+        keywords = dict(num_peri_dims=1, periodic_dim=grid.periodic_dim,
+                        pole_dim=grid.pole_dim, pole_kind=grid.pole_kind)
+
+    staggers = [stagger for stagger in range(2 ** grid.rank)
+                if grid.staggerloc[stagger]]
+    sub = Grid(upper - lower, coord_sys=grid.coord_sys,
+               coord_typekind=grid.type,
+               staggerloc=staggers if staggers else None,
+               rectilinear=grid.rectilinear, **keywords)
+    sub._subset_parent = weakref.ref(grid._token)
+    sub._subset_lower = lower
+    sub._subset_factors = {}
+
+    for stagger in staggers:
+        items = [(sub.local_coords[stagger][coord_dim],
+                  grid.local_coords[stagger][coord_dim], coord_dim)
+                 for coord_dim in range(grid.rank)]
+        if grid.local_mask[stagger] is not None:
+            sub.add_item(GridItem.MASK, staggerloc=stagger)
+            items.append((sub.local_mask[stagger], grid.local_mask[stagger], None))
+        if grid.local_area[stagger] is not None:
+            sub.add_item(GridItem.AREA, staggerloc=stagger)
+            items.append((sub.local_area[stagger], grid.local_area[stagger], None))
+
+        srcfield = Field(grid, typekind=TypeKind.R8, staggerloc=stagger)
+        dstfield = Field(sub, typekind=TypeKind.R8, staggerloc=stagger)
+        factors = _identity_factors_(srcfield, dstfield, lower)
+        sub._subset_factors[stagger] = factors
+
+        redistribute = _redistribute_(srcfield, dstfield, factors)
+        try:
+            for dst, src, axis in items:
+                for localde in range(grid.local_decount):
+                    values = src[localde]
+                    # the 1D axes of rectilinear grids span a single dimension
+                    if grid.rectilinear and axis is not None:
+                        shape = [1] * grid.rank
+                        shape[axis] = values.size
+                        values = values.reshape(shape)
+                    srcfield.local_data[localde][...] = values
+                redistribute()
+                for localde in range(sub.local_decount):
+                    values = dstfield.local_data[localde]
+                    if sub.rectilinear and axis is not None:
+                        values = values[tuple(slice(None) if d == axis else 0
+                                              for d in range(sub.rank))]
+                    dst[localde][...] = values
+        finally:
+            redistribute(done=True)
+            srcfield.destroy()
+            dstfield.destroy()
+
+    return sub
+
+def _circular_interval_(hits):
+    """
+    Return the smallest ``[lower, upper)`` interval of a periodic dimension
+    holding all of the indices where ``hits`` is set, with ``upper`` past
+    the end of the dimension if the interval wraps around its edge.
+    """
+    index = np.flatnonzero(hits)
+    size = hits.size
+    # the interval is the complement of the largest gap between two hits,
+    # which is either the gap around the edge or one of the inner gaps
+    gaps = np.diff(index)
+    if gaps.size == 0 or index[0] + size - index[-1] >= gaps.max():
+        return int(index[0]), int(index[-1]) + 1
+    k = int(np.argmax(gaps))
+    return int(index[k + 1]), int(index[k]) + 1 + size
+
+def _subset_grid_bbox_(grid, bounds):
+    bounds = _check_bounds_(bounds, grid.rank)
+    if grid.local_coords[StaggerLoc.CENTER][0] is None:
+        raise ValueError("the Grid has no coordinates at the center stagger location")
+
+    # the index box of the cell centers in bounds, its lower end negated so
+    # that a single reduction finds both ends, followed by whether each index
+    # of a periodic dimension holds a cell center in bounds
+    periodic = grid.periodic_dim if grid.num_peri_dims == 1 else None
+    nperiodic = 0 if periodic is None else int(grid.max_index[periodic])
+    local = np.full(2 * grid.rank + nperiodic, -np.inf, dtype=np.float64)
+    local[2 * grid.rank:] = 0
+    for localde in range(grid.local_decount):
+        lb = grid.local_lower_bounds[StaggerLoc.CENTER][localde]
+        coords = [grid.local_coords[StaggerLoc.CENTER][coord_dim][localde]
+                  for coord_dim in range(grid.rank)]
+        if grid.rectilinear:
+            found = [np.nonzero(_inside_(coords[d], bounds[d], d, grid.coord_sys))[0]
+                     for d in range(grid.rank)]
+        else:
+            inside = np.ones(coords[0].shape, dtype=bool)
+            for d in range(grid.rank):
+                inside &= _inside_(coords[d], bounds[d], d, grid.coord_sys)
+            found = np.nonzero(inside)
+        if all(index.size > 0 for index in found):
+            for d in range(grid.rank):
+                local[d] = max(local[d], -(found[d].min() + lb[d]))
+                local[grid.rank + d] = max(local[grid.rank + d], found[d].max() + lb[d] + 1)
+            if periodic is not None:
+                local[2 * grid.rank + found[periodic] + lb[periodic]] = 1
+
+    box = Manager().allreduce(local, op=Reduce.MAX)
+    if np.any(np.isinf(box[:2 * grid.rank])):
+        raise ValueError("no cell center of the Grid lies within {0}".format(bounds))
+
+    lower, upper = -box[:grid.rank], box[grid.rank:2 * grid.rank]
+    # the box may wrap around the edge of the periodic dimension
+    if periodic is not None:
+        lower[periodic], upper[periodic] = \
+            _circular_interval_(box[2 * grid.rank:] > 0)
+
+    return _subset_grid_(grid, lower, upper)
+
+#### LocStream ################################################################
+
+def _subset_locstream_(locstream, mask):
+    mask = np.asarray(mask, dtype=bool)
+    if mask.shape != (locstream.size,):
+        raise ValueError("mask must be a boolean array of shape ({0},)".format(
+            locstream.size))
+
+    sub = LocStream(int(np.count_nonzero(mask)), coord_sys=locstream._coord_sys,
+                    name=locstream.name)
+    for key, values in locstream.items():
+        # keys are added from their type, which also works for empty subsets
+        keyvals = sub._add_(key, typekind=constants._Python2ESMFType[values.dtype.type])
+        dict.__setitem__(sub, key, keyvals)
+        keyvals[...] = values[mask]
+    sub._subset_parent = weakref.ref(locstream._token)
+    sub._subset_mask = mask
+
+    return sub
+
+def _subset_locstream_bbox_(locstream, bounds):
+    if locstream._coord_sys == CoordSys.CART:
+        keys = ["ESMF:X", "ESMF:Y", "ESMF:Z"]
+    else:
+        keys = ["ESMF:Lon", "ESMF:Lat", "ESMF:Radius"]
+    keys = [key for key in keys if key in locstream]
+    bounds = _check_bounds_(bounds, len(keys))
+
+    mask = np.ones(locstream.size, dtype=bool)
+    for coord_dim, key in enumerate(keys):
+        mask &= _inside_(locstream[key], bounds[coord_dim], coord_dim,
+                         locstream._coord_sys)
+
+    return _subset_locstream_(locstream, mask)
+
+#### Field ####################################################################
+
+@trace.region("ESMPy Field subset")
+def _subset_field_(field, sub):
+    parent = getattr(sub, '_subset_parent', None)
+    if parent is None or parent() is not field.grid._token:
+        raise ValueError("the Field must be built on the Grid or LocStream "
+                         "the subset was taken from")
+
+    if isinstance(sub, LocStream):
+        ret = Field(sub, name=field.name, typekind=field.type,
+                    ndbounds=field.ndbounds)
+        ret.data[...] = field.data[sub._subset_mask]
+        return ret
+
+    ret = Field(sub, name=field.name, typekind=field.type,
+                staggerloc=field.staggerloc, ndbounds=field.ndbounds)
+    # the factors of a stagger location without coordinates
+    if field.staggerloc not in sub._subset_factors:
+        sub._subset_factors[field.staggerloc] = _identity_factors_(
+            field, ret, sub._subset_lower)
+
+    redistribute = _redistribute_(field, ret, sub._subset_factors[field.staggerloc])
+    try:
+        redistribute()
+    finally:
+        redistribute(done=True)
+
+    return ret
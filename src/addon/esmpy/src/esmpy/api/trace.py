@@ -0,0 +1,106 @@
+# $Id$
+
+"""
+The trace API
+"""
+
+#### IMPORT LIBRARIES #########################################################
+
+import functools
+
+from esmpy.api.esmpymanager import *
+
+#### UTILITIES ################################################################
+
+# whether the ESMF trace is open on this PET, which is fixed once ESMF is
+# initialized, so it is only queried once
+_enabled = None
+
+@initialize
+def enabled():
+    """
+    :rtype: bool
+    :return: Whether tracing or profiling was enabled on the current PET
+        with the ``ESMF_RUNTIME_TRACE`` or ``ESMF_RUNTIME_PROFILE``
+        environment variables when ESMF was initialized. Regions are only
+        recorded if this is ``True``.
+    """
+    global _enabled
+    if _enabled is None:
+        _enabled = ESMP_TraceIsEnabled()
+    return _enabled
+
+#### region class #############################################################
+
+class region(object):
+    """
+    Record a named region of Python code in the ESMF trace, so that it
+    appears in the ESMF profile summary and trace output next to the regions
+    timed inside ESMF. A :class:`~esmpy.api.trace.region` is used as a
+    context manager::
+
+        with esmpy.trace.region("read input"):
+            srcfield.read(filename, variable)
+
+    or as a function decorator::
+
+        @esmpy.trace.region("postprocess")
+        def postprocess(field):
+            ...
+
+    Tracing and profiling are enabled by setting the ``ESMF_RUNTIME_TRACE``
+    or ``ESMF_RUNTIME_PROFILE`` environment variables to ``ON`` before ESMF
+    is initialized, see the Trace class of the
+    `ESMF Reference Manual <http://earthsystemmodeling.org/docs/release/latest/ESMF_refdoc/>`_.
+    When they are not set, regions cost a single check. Regions may be
+    nested, but must be exited in the reverse order they were entered.
+
+    The ESMPy :class:`~esmpy.api.grid.Grid` and
+    :class:`~esmpy.api.mesh.Mesh` creation, :class:`~esmpy.api.regrid.Regrid`
+    and :class:`~esmpy.api.regrid.RegridFromFile` store and apply, and file
+    reads are recorded as regions with names starting with ``ESMPy``.
+
+    *REQUIRED:*
+
+    :param str name: the name of the region.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        # the number of times this region is currently entered
+        self._depth = 0
+
+    def __enter__(self):
+        if enabled():
+            ESMP_TraceRegionEnter(self._name)
+            self._depth += 1
+        return self
+
+    def __exit__(self, *args):
+        if self._depth > 0:
+            self._depth -= 1
+            ESMP_TraceRegionExit(self._name)
+        return False
+
+    def __call__(self, func):
+        @functools.wraps(func)
+        def new_func(*args, **kwargs):
+            with self:
+                return func(*args, **kwargs)
+        return new_func
+
+    def __repr__(self):
+        string = ("region:\n"
+                  "    name = %r\n"
+                  %
+                  (self.name,))
+
+        return string
+
+    @property
+    def name(self):
+        """
+        :rtype: str
+        :return: The name of the region.
+        """
+        return self._name
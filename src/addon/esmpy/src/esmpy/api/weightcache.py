@@ -0,0 +1,349 @@
+# $Id$
+
+"""
+The WeightCache API
+"""
+
+#### IMPORT LIBRARIES #########################################################
+
+import hashlib
+import os
+import random
+import shutil
+
+from esmpy.api.esmpymanager import *
+from esmpy.api.grid import Grid
+from esmpy.api.mesh import Mesh
+from esmpy.api.locstream import LocStream
+import esmpy.api.constants as constants
+from esmpy.util.slicing import get_none_or_slice
+
+#### UTILITIES ################################################################
+
+def _hash_array_(hsh, array):
+    if isinstance(array, type(None)):
+        hsh.update(b'None')
+    else:
+        array = np.ascontiguousarray(array)
+        hsh.update(str(array.dtype).encode('utf-8'))
+        hsh.update(str(array.shape).encode('utf-8'))
+        hsh.update(array.view(np.uint8).reshape(-1))
+
+def _hash_grid_(hsh, grid):
+    hsh.update(repr((grid.rank, grid.coord_sys, grid.num_peri_dims,
+                     grid.periodic_dim, grid.pole_dim, grid.decount)).encode('utf-8'))
+    _hash_array_(hsh, grid.pole_kind)
+    # every local DE, e.g. every tile of a cubed sphere held by this PET
+    for stagger in range(2 ** grid.rank):
+        for localde in range(grid.local_decount):
+            _hash_array_(hsh, grid.local_lower_bounds[stagger][localde])
+            for coord_dim in range(grid.rank):
+                _hash_array_(hsh, get_none_or_slice(grid.local_coords[stagger][coord_dim], localde))
+            _hash_array_(hsh, get_none_or_slice(grid.local_mask[stagger], localde))
+            _hash_array_(hsh, get_none_or_slice(grid.local_area[stagger], localde))
+
+def _hash_mesh_(hsh, mesh):
+    hsh.update(repr((mesh.parametric_dim, mesh.spatial_dim, mesh.coord_sys,
+                     mesh.size, mesh.size_owned)).encode('utf-8'))
+    for meshloc in range(2):
+        for coords in mesh.coords[meshloc]:
+            _hash_array_(hsh, coords)
+        _hash_array_(hsh, mesh.mask[meshloc])
+    _hash_array_(hsh, mesh.area if isinstance(mesh.area, np.ndarray) else None)
+    # connectivity is only known for meshes created in memory
+    if hasattr(mesh, '_element_conn'):
+        _hash_array_(hsh, mesh.element_types)
+        _hash_array_(hsh, mesh.element_conn)
+        _hash_array_(hsh, mesh.node_ids)
+        _hash_array_(hsh, mesh.node_owners)
+        _hash_array_(hsh, mesh.element_ids)
+
+def _hash_locstream_(hsh, locstream):
+    hsh.update(repr(locstream.lower_bounds).encode('utf-8'))
+    for key in sorted(locstream.keys()):
+        hsh.update(key.encode('utf-8'))
+        _hash_array_(hsh, locstream[key])
+
+def _fingerprint_(field, memo=None):
+    """
+    Return a hex digest identifying the discretization and data layout of a
+    :class:`~esmpy.api.field.Field` across all PETs. The digest covers the
+    coordinates, masks and areas of the underlying
+    :class:`~esmpy.api.grid.Grid`, :class:`~esmpy.api.mesh.Mesh` or
+    :class:`~esmpy.api.locstream.LocStream`, the stagger location and the
+    ungridded bounds. If ``memo`` is a dictionary, the digest is stored in
+    it and reused by the later calls with the same ``memo`` and
+    :class:`~esmpy.api.field.Field`, which must not be modified meanwhile.
+    This is a collective call.
+    """
+    # the Field is kept in the memo so that its id is not reused
+    if not isinstance(memo, type(None)) and id(field) in memo:
+        return memo[id(field)][1]
+
+    hsh = hashlib.sha256()
+    hsh.update(repr((local_pet(), type(field.grid).__name__, field.staggerloc,
+                     field.type, field.ndbounds)).encode('utf-8'))
+    if isinstance(field.grid, Grid):
+        _hash_grid_(hsh, field.grid)
+    elif isinstance(field.grid, Mesh):
+        _hash_mesh_(hsh, field.grid)
+    elif isinstance(field.grid, LocStream):
+        _hash_locstream_(hsh, field.grid)
+    else:
+        raise FieldDOError
+
+    # combine the local digests by summing them as 32 bit words, these sums are
+    # exact in float64 for any realistic number of PETs
+    words = np.frombuffer(hsh.digest(), dtype=np.uint32).astype(np.float64)
+    total = np.zeros(words.size, dtype=np.float64)
+    mg = Manager()
+    mg._reduce_(words, total, words.size, reduceflag=Reduce.SUM)
+    mg._broadcast_(total, total.size)
+
+    ret = hashlib.sha256(total.tobytes()).hexdigest()
+    if not isinstance(memo, type(None)):
+        memo[id(field)] = (field, ret)
+
+    return ret
+
+#### WeightCache class #########################################################
+
+class WeightCache(object):
+    """
+    The :class:`~esmpy.api.weightcache.WeightCache` is an opt-in, persistent
+    on-disk cache of regridding operators. It is passed to
+    :class:`~esmpy.api.regrid.Regrid` with the ``cache`` argument. The first
+    construction of a :class:`~esmpy.api.regrid.Regrid` computes the weights
+    as usual and writes the resulting RouteHandle to the cache directory.
+    Later constructions with identical source and destination
+    :class:`Fields <esmpy.api.field.Field>` and options, in the same or a later
+    job, read the RouteHandle back instead of recomputing the weights.
+
+    Entries are keyed by a fingerprint of the source and destination
+    coordinates, masks, areas, stagger locations and ungridded bounds, of all
+    regridding options and of the number of PETs, because a RouteHandle can
+    only be used with the decomposition it was computed on.
+
+    Entries are written to a temporary file and renamed into place, and
+    read through a private hard link, so several jobs can share the same
+    cache directory and evict each other's entries. When ``max_size`` is
+    set, the least recently used entries are removed once the total size
+    of the cache exceeds it.
+
+    .. note:: The cache is bypassed when weights are written to file, or when
+        factors or fraction :class:`Fields <esmpy.api.field.Field>` are
+        requested, since these are not restored from a RouteHandle.
+
+    *REQUIRED:*
+
+    :param str directory: the directory holding the cache entries. It is
+        created if it does not exist.
+
+    *OPTIONAL:*
+
+    :param int max_size: the maximum total size of the cache in bytes. If
+        ``None``, the cache is unbounded.
+    """
+
+    _suffix = '.rh'
+
+    @initialize
+    def __init__(self, directory, max_size=None):
+        self._directory = os.path.abspath(directory)
+        self._max_size = max_size
+
+        os.makedirs(self._directory, exist_ok=True)
+
+    def __repr__(self):
+        string = ("WeightCache:\n"
+                  "    directory = %r\n"
+                  "    max_size = %r\n"
+                  %
+                  (self.directory,
+                   self.max_size))
+
+        return string
+
+    @property
+    def directory(self):
+        """
+        :rtype: str
+        :return: The directory holding the cache entries.
+        """
+        return self._directory
+
+    @property
+    def max_size(self):
+        """
+        :rtype: int
+        :return: The maximum total size of the cache in bytes, or ``None`` if
+            the cache is unbounded.
+        """
+        return self._max_size
+
+    def key(self, srcfield, dstfield, memo=None, **options):
+        """
+        Compute the cache key of a regridding operation. This is a collective
+        call.
+
+        :param Field srcfield: the source :class:`~esmpy.api.field.Field`.
+        :param Field dstfield: the destination :class:`~esmpy.api.field.Field`.
+        :param dict memo: a dictionary holding the fingerprints of the
+            :class:`Fields <esmpy.api.field.Field>` computed by the calls
+            sharing it, e.g. to fingerprint the same source
+            :class:`~esmpy.api.field.Field` once for several destinations.
+            The :class:`Fields <esmpy.api.field.Field>` must not be modified
+            while it is used. If ``None``, nothing is reused.
+        :param options: the regridding options, as passed to
+            :class:`~esmpy.api.regrid.Regrid`.
+
+        :return: str
+        """
+        hsh = hashlib.sha256()
+        hsh.update(_fingerprint_(srcfield, memo).encode('utf-8'))
+        hsh.update(_fingerprint_(dstfield, memo).encode('utf-8'))
+        hsh.update(repr((pet_count(), constants._ESMF_VERSION)).encode('utf-8'))
+        for name in sorted(options):
+            value = options[name]
+            if isinstance(value, np.ndarray):
+                value = value.tolist()
+            hsh.update(repr((name, value)).encode('utf-8'))
+
+        return hsh.hexdigest()
+
+    def path(self, key):
+        """
+        :param str key: a cache key.
+        :return: The path of the cache entry for ``key``.
+        """
+        return os.path.join(self.directory, key + self._suffix)
+
+    def load(self, key):
+        """
+        Read the RouteHandle stored for ``key``. This is a collective call.
+
+        :param str key: a cache key.
+        :return: The RouteHandle, or ``None`` if the entry is not cached.
+        """
+        path = self.path(key)
+
+        # let the root PET decide so that all PETs agree on hit or miss. On a
+        # hit the root PET links the entry to a private name first, so that
+        # the entry can be evicted by another process while it is read
+        token = 0.
+        if local_pet() == 0:
+            token = float(random.getrandbits(48) or 1)
+            try:
+                self._link_(path, self._private_(path, token))
+            except OSError:
+                self._remove_(self._private_(path, token))
+                token = 0.
+            try:
+                # refresh the entry for least recently used eviction
+                os.utime(path)
+            except OSError:
+                pass
+        token = self._broadcast_(token)
+        if not token:
+            return None
+
+        private = self._private_(path, token)
+        try:
+            return ESMP_RouteHandleCreateFromFile(private)
+        finally:
+            Manager().barrier()
+            if local_pet() == 0:
+                self._remove_(private)
+
+    def store(self, key, routehandle):
+        """
+        Write ``routehandle`` to the cache entry for ``key``, then evict the
+        least recently used entries if the cache is over its size limit. This
+        is a collective call.
+
+        :param str key: a cache key.
+        :param routehandle: the RouteHandle to store.
+        """
+        path = self.path(key)
+
+        # all PETs write to the same temporary file, which is only renamed to
+        # the final entry name once complete
+        token = self._broadcast_(float(random.getrandbits(48)))
+        tmp = "{0}.{1:d}.tmp".format(path, int(token))
+        ESMP_RouteHandleWrite(routehandle, tmp)
+        Manager().barrier()
+
+        if local_pet() == 0:
+            os.replace(tmp, path)
+            self._evict_(keep=path)
+        Manager().barrier()
+
+    def clear(self):
+        """
+        Remove all entries from the cache. This is a collective call.
+        """
+        if local_pet() == 0:
+            for path, _, _ in self._entries_():
+                self._remove_(path)
+        Manager().barrier()
+
+    def _broadcast_(self, value):
+        buf = np.array([value], dtype=np.float64)
+        Manager()._broadcast_(buf, 1)
+        return buf[0]
+
+    def _entries_(self):
+        """Return ``(path, mtime, size)`` of all entries, oldest first."""
+        ret = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(self._suffix):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                # removed by another process
+                continue
+            ret.append((path, stat.st_mtime, stat.st_size))
+
+        return sorted(ret, key=lambda entry: entry[1])
+
+    @staticmethod
+    def _link_(path, private):
+        """
+        Make ``private`` refer to the content of ``path``, which is kept even
+        if ``path`` is removed, with a copy on file systems without hard
+        links.
+        """
+        try:
+            os.link(path, private)
+        except OSError:
+            if not os.path.exists(path):
+                raise
+            shutil.copyfile(path, private)
+
+    @staticmethod
+    def _private_(path, token):
+        return "{0}.{1:d}.load".format(path, int(token))
+
+    def _evict_(self, keep=None):
+        if isinstance(self.max_size, type(None)):
+            return
+
+        entries = self._entries_()
+        total = sum(entry[2] for entry in entries)
+        for path, _, size in entries:
+            if total <= self.max_size:
+                break
+            if path == keep:
+                continue
+            if self._remove_(path):
+                total -= size
+
+    @staticmethod
+    def _remove_(path):
+        try:
+            os.remove(path)
+        except OSError:
+            return False
+        return True
@@ -10,6 +10,7 @@ import sys
 
 import esmpy.api.constants as constants
 from esmpy.util.decorators import *
+from esmpy.util.profiling import profiled
 from esmpy.interface.loadESMF import _ESMF
 
 
@@ -290,6 +291,141 @@ def ESMP_InterfaceIntNDSet(iiptr, arrayArg, dimArg, lenArg):
 
 #### VM #######################################################################
 
+def _vm_typekind_(*bufs):
+    """
+    Return the TypeKind of the VM communication buffers in bufs, which must
+    all have the same dtype of int32, int64, float32 or float64.
+    """
+    dtype = bufs[0].dtype
+    for buf in bufs:
+        if buf.dtype != dtype:
+            raise TypeError('buffers must all have the same dtype')
+    if dtype.type not in (np.int32, np.int64, np.float32, np.float64):
+        raise TypeError('buffers must have dtype=int32, int64, float32 or float64')
+
+    return constants._Python2ESMFType[dtype.type]
+
+_ESMF.ESMC_VMAllGather.restype = ct.c_int
+_ESMF.ESMC_VMAllGather.argtypes = [ct.c_void_p,
+                                   np.ctypeslib.ndpointer(flags='C_CONTIGUOUS'),
+                                   np.ctypeslib.ndpointer(flags='C_CONTIGUOUS'),
+                                   ct.c_int,
+                                   OptionalNamedConstant]
+
+def ESMP_VMAllGather(vm, sendBuf, recvBuf, count):
+    """
+    Preconditions: An ESMP_VM object has been retrieved.\n
+    Postconditions: The sendBuf of every PET has been gathered into recvBuf
+                    on every PET.\n
+    Arguments:\n
+        ESMP_VM :: vm\n
+        Numpy.array(dtype=int32, int64, float32 or float64) :: sendBuf\n
+        Numpy.array(dtype=int32, int64, float32 or float64) :: recvBuf\n
+        int :: count\n
+    """
+    typekind = _vm_typekind_(sendBuf, recvBuf)
+
+    rc = _ESMF.ESMC_VMAllGather(vm, sendBuf, recvBuf, ct.c_int(count), typekind)
+    if rc != constants._ESMP_SUCCESS:
+        raise ValueError('ESMC_VMAllGather() failed with rc = '+str(rc)+'.    '+
+                        constants._errmsg)
+
+_ESMF.ESMC_VMAllGatherV.restype = ct.c_int
+_ESMF.ESMC_VMAllGatherV.argtypes = [ct.c_void_p,
+                                    np.ctypeslib.ndpointer(flags='C_CONTIGUOUS'),
+                                    ct.c_int,
+                                    np.ctypeslib.ndpointer(flags='C_CONTIGUOUS'),
+                                    np.ctypeslib.ndpointer(dtype=np.int32),
+                                    np.ctypeslib.ndpointer(dtype=np.int32),
+                                    OptionalNamedConstant]
+
+def ESMP_VMAllGatherV(vm, sendBuf, sendCount, recvBuf, recvCounts,
+                      recvOffsets):
+    """
+    Preconditions: An ESMP_VM object has been retrieved.\n
+    Postconditions: The sendBuf of every PET has been gathered into recvBuf
+                    on every PET.\n
+    Arguments:\n
+        ESMP_VM :: vm\n
+        Numpy.array(dtype=int32, int64, float32 or float64) :: sendBuf\n
+        int :: sendCount\n
+        Numpy.array(dtype=int32, int64, float32 or float64) :: recvBuf\n
+        Numpy.array(dtype=int32) :: recvCounts\n
+        Numpy.array(dtype=int32) :: recvOffsets\n
+    """
+    typekind = _vm_typekind_(sendBuf, recvBuf)
+
+    rc = _ESMF.ESMC_VMAllGatherV(vm, sendBuf, ct.c_int(sendCount), recvBuf,
+                                  recvCounts, recvOffsets, typekind)
+    if rc != constants._ESMP_SUCCESS:
+        raise ValueError('ESMC_VMAllGatherV() failed with rc = '+str(rc)+'.    '+
+                        constants._errmsg)
+
+_ESMF.ESMC_VMAllReduce.restype = ct.c_int
+_ESMF.ESMC_VMAllReduce.argtypes = [ct.c_void_p,
+                                   np.ctypeslib.ndpointer(flags='C_CONTIGUOUS'),
+                                   np.ctypeslib.ndpointer(flags='C_CONTIGUOUS'),
+                                   ct.c_int,
+                                   OptionalNamedConstant,
+                                   OptionalNamedConstant]
+
+def ESMP_VMAllReduce(vm, sendBuf, recvBuf, count, reduceflag):
+    """
+    Preconditions: An ESMP_VM object has been retrieved.\n
+    Postconditions: The values in sendBuf have been reduced to recvBuf on
+                    every PET.\n
+    Arguments:\n
+        ESMP_VM :: vm\n
+        Numpy.array(dtype=int32, int64, float32 or float64) :: sendBuf\n
+        Numpy.array(dtype=int32, int64, float32 or float64) :: recvBuf\n
+        int :: count\n
+        Reduce :: reduceflag\n
+            Argument Values:\n
+                Reduce.SUM\n
+                Reduce.MIN\n
+                Reduce.MAX\n
+    """
+    typekind = _vm_typekind_(sendBuf, recvBuf)
+
+    rc = _ESMF.ESMC_VMAllReduce(vm, sendBuf, recvBuf, ct.c_int(count), typekind,
+                                 reduceflag)
+    if rc != constants._ESMP_SUCCESS:
+        raise ValueError('ESMC_VMAllReduce() failed with rc = '+str(rc)+'.    '+
+                        constants._errmsg)
+
+_ESMF.ESMC_VMAllToAllV.restype = ct.c_int
+_ESMF.ESMC_VMAllToAllV.argtypes = [ct.c_void_p,
+                                   np.ctypeslib.ndpointer(flags='C_CONTIGUOUS'),
+                                   np.ctypeslib.ndpointer(dtype=np.int32),
+                                   np.ctypeslib.ndpointer(dtype=np.int32),
+                                   np.ctypeslib.ndpointer(flags='C_CONTIGUOUS'),
+                                   np.ctypeslib.ndpointer(dtype=np.int32),
+                                   np.ctypeslib.ndpointer(dtype=np.int32),
+                                   OptionalNamedConstant]
+
+def ESMP_VMAllToAllV(vm, sendBuf, sendCounts, sendOffsets, recvBuf, recvCounts,
+                     recvOffsets):
+    """
+    Preconditions: An ESMP_VM object has been retrieved.\n
+    Postconditions: The parts of sendBuf have been sent to the PETs and the
+                    parts received from them stored in recvBuf.\n
+    Arguments:\n
+        ESMP_VM :: vm\n
+        Numpy.array(dtype=int32, int64, float32 or float64) :: sendBuf\n
+        Numpy.array(dtype=int32) :: sendCounts\n
+        Numpy.array(dtype=int32) :: sendOffsets\n
+        Numpy.array(dtype=int32, int64, float32 or float64) :: recvBuf\n
+        Numpy.array(dtype=int32) :: recvCounts\n
+        Numpy.array(dtype=int32) :: recvOffsets\n
+    """
+    typekind = _vm_typekind_(sendBuf, recvBuf)
+
+    rc = _ESMF.ESMC_VMAllToAllV(vm, sendBuf, sendCounts, sendOffsets, recvBuf,
+                                 recvCounts, recvOffsets, typekind)
+    if rc != constants._ESMP_SUCCESS:
+        raise ValueError('ESMC_VMAllToAllV() failed with rc = '+str(rc)+'.    '+
+                        constants._errmsg)
+
 _ESMF.ESMC_VMBarrier.restype = ct.c_int
 _ESMF.ESMC_VMBarrier.argtypes = [ct.c_void_p]
 
@@ -339,6 +475,68 @@ def ESMP_VMBroadcast(vm, bcstBuf, count, rootPet):
         raise ValueError('ESMC_VMBroadcast() failed with rc = '+str(rc)+'.    '+
                         constants._errmsg)
 
+_ESMF.ESMC_VMGather.restype = ct.c_int
+_ESMF.ESMC_VMGather.argtypes = [ct.c_void_p,
+                                np.ctypeslib.ndpointer(flags='C_CONTIGUOUS'),
+                                np.ctypeslib.ndpointer(flags='C_CONTIGUOUS'),
+                                ct.c_int,
+                                OptionalNamedConstant,
+                                ct.c_int]
+
+def ESMP_VMGather(vm, sendBuf, recvBuf, count, rootPet):
+    """
+    Preconditions: An ESMP_VM object has been retrieved.\n
+    Postconditions: The sendBuf of every PET has been gathered into recvBuf
+                    on rootPet.\n
+    Arguments:\n
+        ESMP_VM :: vm\n
+        Numpy.array(dtype=int32, int64, float32 or float64) :: sendBuf\n
+        Numpy.array(dtype=int32, int64, float32 or float64) :: recvBuf\n
+        int :: count\n
+        int :: rootPet\n
+    """
+    typekind = _vm_typekind_(sendBuf, recvBuf)
+
+    rc = _ESMF.ESMC_VMGather(vm, sendBuf, recvBuf, ct.c_int(count), typekind,
+                              ct.c_int(rootPet))
+    if rc != constants._ESMP_SUCCESS:
+        raise ValueError('ESMC_VMGather() failed with rc = '+str(rc)+'.    '+
+                        constants._errmsg)
+
+_ESMF.ESMC_VMGatherV.restype = ct.c_int
+_ESMF.ESMC_VMGatherV.argtypes = [ct.c_void_p,
+                                 np.ctypeslib.ndpointer(flags='C_CONTIGUOUS'),
+                                 ct.c_int,
+                                 np.ctypeslib.ndpointer(flags='C_CONTIGUOUS'),
+                                 np.ctypeslib.ndpointer(dtype=np.int32),
+                                 np.ctypeslib.ndpointer(dtype=np.int32),
+                                 OptionalNamedConstant,
+                                 ct.c_int]
+
+def ESMP_VMGatherV(vm, sendBuf, sendCount, recvBuf, recvCounts, recvOffsets,
+                   rootPet):
+    """
+    Preconditions: An ESMP_VM object has been retrieved.\n
+    Postconditions: The sendBuf of every PET has been gathered into recvBuf
+                    on rootPet.\n
+    Arguments:\n
+        ESMP_VM :: vm\n
+        Numpy.array(dtype=int32, int64, float32 or float64) :: sendBuf\n
+        int :: sendCount\n
+        Numpy.array(dtype=int32, int64, float32 or float64) :: recvBuf\n
+        Numpy.array(dtype=int32) :: recvCounts\n
+        Numpy.array(dtype=int32) :: recvOffsets\n
+        int :: rootPet\n
+    """
+    typekind = _vm_typekind_(sendBuf, recvBuf)
+
+    rc = _ESMF.ESMC_VMGatherV(vm, sendBuf, ct.c_int(sendCount), recvBuf,
+                               recvCounts, recvOffsets, typekind,
+                               ct.c_int(rootPet))
+    if rc != constants._ESMP_SUCCESS:
+        raise ValueError('ESMC_VMGatherV() failed with rc = '+str(rc)+'.    '+
+                        constants._errmsg)
+
 def ESMP_VMGet(vm):
     """
     Preconditions: An ESMP_VM object has been retrieved.\n
@@ -458,6 +656,68 @@ def ESMP_VMReduce(vm, sendBuf, recvBuf, count, reduceflag, rootPet):
         raise ValueError('ESMC_VMReduce() failed with rc = '+str(rc)+'.    '+
                         constants._errmsg)
 
+_ESMF.ESMC_VMScatter.restype = ct.c_int
+_ESMF.ESMC_VMScatter.argtypes = [ct.c_void_p,
+                                 np.ctypeslib.ndpointer(flags='C_CONTIGUOUS'),
+                                 np.ctypeslib.ndpointer(flags='C_CONTIGUOUS'),
+                                 ct.c_int,
+                                 OptionalNamedConstant,
+                                 ct.c_int]
+
+def ESMP_VMScatter(vm, sendBuf, recvBuf, count, rootPet):
+    """
+    Preconditions: An ESMP_VM object has been retrieved.\n
+    Postconditions: The parts of sendBuf on rootPet have been scattered into
+                    recvBuf on every PET.\n
+    Arguments:\n
+        ESMP_VM :: vm\n
+        Numpy.array(dtype=int32, int64, float32 or float64) :: sendBuf\n
+        Numpy.array(dtype=int32, int64, float32 or float64) :: recvBuf\n
+        int :: count\n
+        int :: rootPet\n
+    """
+    typekind = _vm_typekind_(sendBuf, recvBuf)
+
+    rc = _ESMF.ESMC_VMScatter(vm, sendBuf, recvBuf, ct.c_int(count), typekind,
+                               ct.c_int(rootPet))
+    if rc != constants._ESMP_SUCCESS:
+        raise ValueError('ESMC_VMScatter() failed with rc = '+str(rc)+'.    '+
+                        constants._errmsg)
+
+_ESMF.ESMC_VMScatterV.restype = ct.c_int
+_ESMF.ESMC_VMScatterV.argtypes = [ct.c_void_p,
+                                  np.ctypeslib.ndpointer(flags='C_CONTIGUOUS'),
+                                  np.ctypeslib.ndpointer(dtype=np.int32),
+                                  np.ctypeslib.ndpointer(dtype=np.int32),
+                                  np.ctypeslib.ndpointer(flags='C_CONTIGUOUS'),
+                                  ct.c_int,
+                                  OptionalNamedConstant,
+                                  ct.c_int]
+
+def ESMP_VMScatterV(vm, sendBuf, sendCounts, sendOffsets, recvBuf, recvCount,
+                    rootPet):
+    """
+    Preconditions: An ESMP_VM object has been retrieved.\n
+    Postconditions: The parts of sendBuf on rootPet have been scattered into
+                    recvBuf on every PET.\n
+    Arguments:\n
+        ESMP_VM :: vm\n
+        Numpy.array(dtype=int32, int64, float32 or float64) :: sendBuf\n
+        Numpy.array(dtype=int32) :: sendCounts\n
+        Numpy.array(dtype=int32) :: sendOffsets\n
+        Numpy.array(dtype=int32, int64, float32 or float64) :: recvBuf\n
+        int :: recvCount\n
+        int :: rootPet\n
+    """
+    typekind = _vm_typekind_(sendBuf, recvBuf)
+
+    rc = _ESMF.ESMC_VMScatterV(vm, sendBuf, sendCounts, sendOffsets, recvBuf,
+                                ct.c_int(recvCount), typekind,
+                                ct.c_int(rootPet))
+    if rc != constants._ESMP_SUCCESS:
+        raise ValueError('ESMC_VMScatterV() failed with rc = '+str(rc)+'.    '+
+                        constants._errmsg)
+
 #### LOG ######################################################################
 
 _ESMF.ESMC_LogSet.restype = ct.c_int
@@ -604,6 +864,82 @@ def ESMP_GridCreateNoPeriDim(maxIndex, coordSys=None, coordTypeKind=None):
     # create the ESMP Grid object from ctypes pointer
     return gridstruct
 
+#TODO: InterfaceInt should be passed by value when ticket 3613642 is resolved
+_ESMF.ESMC_GridCreateRectilinear.restype = ESMP_GridStruct
+_ESMF.ESMC_GridCreateRectilinear.argtypes = [ct.POINTER(ESMP_InterfaceInt),
+                                             OptionalInterfaceInt,
+                                             OptionalNamedConstant,
+                                             OptionalNamedConstant,
+                                             OptionalNamedConstant,
+                                             OptionalNamedConstant,
+                                             OptionalNamedConstant,
+                                             ct.POINTER(ct.c_int)]
+
+def ESMP_GridCreateRectilinear(maxIndex, polekindflag=None, periodicDim=None,
+                               poleDim=None, coordSys=None, coordTypeKind=None):
+    """
+    Preconditions: ESMP has been initialized.\n
+    Postconditions: An ESMP_Grid with 1D coordinate arrays, where coordinate
+                    dimension i only depends on index dimension i, has been
+                    created. It has 1 periodic dimension if periodicDim is
+                    given and none otherwise.\n
+    Arguments:\n
+        :RETURN: ESMP_Grid    :: grid\n
+        Numpy.array(dtype=int32) :: maxIndex\n
+        Numpy.array(dtype=int32) (optional) :: polekindflag\n
+        integer (optional) :: periodicDim\n
+        integer (optional) :: poleDim\n
+        CoordSys (optional)   :: coordSys\n
+            Argument Values:\n
+                CoordSys.CART\n
+                (default) CoordSys.SPH_DEG\n
+                CoordSys.SPH_RAD\n
+        TypeKind (optional)   :: coordTypeKind\n
+            Argument Values:\n
+                TypeKind.I4\n
+                TypeKind.I8\n
+                TypeKind.R4\n
+                (default) TypeKind.R8\n
+    """
+    lrc = ct.c_int(0)
+
+    #InterfaceInt requires int32 type numpy arrays
+    if (maxIndex.dtype != np.int32):
+        raise TypeError('maxIndex must have dtype=int32')
+
+    # set up the max index interface int
+    maxIndex_i = ESMP_InterfaceInt(maxIndex)
+
+    #InterfaceInt requires int32 type numpy arrays
+    if not isinstance(polekindflag, type(None)):
+        if (polekindflag.dtype != np.int32):
+            raise TypeError('pole_kind must have dtype=int32')
+
+    # reset the periodic_dim and pole_dim to be 1 based for ESMF
+    if not isinstance(periodicDim, type(None)):
+        periodicDim += 1
+    if not isinstance(poleDim, type(None)):
+        poleDim += 1
+
+    # dummy value to correspond to ESMF_INDEX_GLOBAL = 1 for global indexing
+    indexflag = 1
+
+    # create the ESMF Grid and retrieve a ctypes pointer to it
+    gridstruct = _ESMF.ESMC_GridCreateRectilinear(ct.byref(maxIndex_i),
+                                                  polekindflag,
+                                                  periodicDim, poleDim, coordSys,
+                                                  coordTypeKind, indexflag,
+                                                  ct.byref(lrc))
+
+    # check the return code from ESMF
+    rc = lrc.value
+    if rc != constants._ESMP_SUCCESS:
+        raise ValueError('ESMC_GridCreateRectilinear() failed with rc = '+str(rc)+
+                        '.    '+constants._errmsg)
+
+    # create the ESMP Grid object from ctypes pointer
+    return gridstruct
+
 #TODO: InterfaceInt should be passed by value when ticket 3613642 is resolved
 _ESMF.ESMC_GridCreateCubedSphere.restype = ESMP_GridStruct
 _ESMF.ESMC_GridCreateCubedSphere.argtypes = [ct.POINTER(ct.c_int),
@@ -846,7 +1182,8 @@ def ESMP_GridAddItem(grid, item,
                         constants._errmsg)
 
 _ESMF.ESMC_GridGetCoord.restype = ct.POINTER(ct.c_void_p)
-_ESMF.ESMC_GridGetCoord.argtypes = [ct.c_void_p, ct.c_int, ct.c_uint, ct.c_int,
+_ESMF.ESMC_GridGetCoord.argtypes = [ct.c_void_p, ct.c_int, ct.c_uint,
+                                    ct.POINTER(ct.c_int),
                                     np.ctypeslib.ndpointer(dtype=np.int32),
                                     np.ctypeslib.ndpointer(dtype=np.int32),
                                     ct.POINTER(ct.c_int)]
@@ -893,7 +1230,8 @@ def ESMP_GridGetCoordPtr(grid, coordDim,
     exUB = np.array(np.zeros(grid.rank),dtype=np.int32)
 
     gridCoordPtr = _ESMF.ESMC_GridGetCoord(grid.struct.ptr, lcd, staggerloc,
-                                           lde, exLB, exUB, ct.byref(lrc))
+                                           ct.byref(lde), exLB, exUB,
+                                           ct.byref(lrc))
 
     # adjust bounds to be 0 based, even though it's just a placeholder..
     exLB = exLB - 1
@@ -906,7 +1244,8 @@ def ESMP_GridGetCoordPtr(grid, coordDim,
     return gridCoordPtr
 
 _ESMF.ESMC_GridGetCoordBounds.restype = ct.c_int
-_ESMF.ESMC_GridGetCoordBounds.argtypes = [ct.c_void_p, ct.c_uint, ct.c_int,
+_ESMF.ESMC_GridGetCoordBounds.argtypes = [ct.c_void_p, ct.c_uint,
+                                         ct.POINTER(ct.c_int),
                                          np.ctypeslib.ndpointer(dtype=np.int32),
                                          np.ctypeslib.ndpointer(dtype=np.int32),
                                          ct.POINTER(ct.c_int)]
@@ -947,7 +1286,7 @@ def ESMP_GridGetCoordBounds(grid, staggerloc=constants.StaggerLoc.CENTER,
     exclusiveLBound = np.array(np.zeros(grid.rank),dtype=np.int32)
     exclusiveUBound = np.array(np.zeros(grid.rank),dtype=np.int32)
 
-    rc = _ESMF.ESMC_GridGetCoordBounds(grid.struct.ptr, staggerloc, lde,
+    rc = _ESMF.ESMC_GridGetCoordBounds(grid.struct.ptr, staggerloc, ct.byref(lde),
                                        exclusiveLBound, exclusiveUBound,
                                        ct.byref(lrc))
 
@@ -961,9 +1300,30 @@ def ESMP_GridGetCoordBounds(grid, staggerloc=constants.StaggerLoc.CENTER,
 
     return exclusiveLBound, exclusiveUBound
 
+_ESMF.ESMC_GridGetLocalDECount.restype = ct.c_int
+_ESMF.ESMC_GridGetLocalDECount.argtypes = [ct.c_void_p, ct.POINTER(ct.c_int)]
+
+def ESMP_GridGetLocalDECount(grid):
+    """
+    Preconditions: An ESMP_Grid has been created.\n
+    Postconditions: The number of DEs of the Grid on this PET has been
+                    returned.\n
+    Arguments:\n
+        :RETURN: integer      :: localDECount\n
+        ESMP_Grid             :: grid\n
+    """
+    localDECount = ct.c_int(0)
+
+    rc = _ESMF.ESMC_GridGetLocalDECount(grid.struct.ptr, ct.byref(localDECount))
+    if rc != constants._ESMP_SUCCESS:
+        raise ValueError('ESMC_GridGetLocalDECount() failed with rc = '+str(rc)+'.    '+
+                        constants._errmsg)
+
+    return localDECount.value
+
 _ESMF.ESMC_GridGetItem.restype = ct.POINTER(ct.c_void_p)
-_ESMF.ESMC_GridGetItem.argtypes = [ct.c_void_p, ct.c_uint, ct.c_uint, ct.c_int,
-                                   ct.POINTER(ct.c_int)]
+_ESMF.ESMC_GridGetItem.argtypes = [ct.c_void_p, ct.c_uint, ct.c_uint,
+                                   ct.POINTER(ct.c_int), ct.POINTER(ct.c_int)]
 
 def ESMP_GridGetItem(grid, item, staggerloc=constants.StaggerLoc.CENTER,
                      localde=0):
@@ -1004,7 +1364,7 @@ def ESMP_GridGetItem(grid, item, staggerloc=constants.StaggerLoc.CENTER,
     # localde
     lde = ct.c_int(localde)
 
-    gridItemPtr = _ESMF.ESMC_GridGetItem(grid.struct.ptr, item, staggerloc, lde,
+    gridItemPtr = _ESMF.ESMC_GridGetItem(grid.struct.ptr, item, staggerloc, ct.byref(lde),
                                          ct.byref(lrc))
 
     rc = lrc.value
@@ -1158,11 +1518,11 @@ def ESMP_MeshAddNodes(mesh, nodeCount,
     """
     lnc = ct.c_int(nodeCount)
 
-    # copy the numpy arrays to a specific type
-    nodeIdsD = np.array(nodeIds, dtype=np.int32)
-    nodeCoordsD = np.array(nodeCoords, dtype=np.float64)
-    # this variant uses the ndarray.astype casting function
-    nodeOwnersD = np.ndarray.astype(nodeOwners, np.int32)
+    # convert the numpy arrays to a specific type, arrays which already have
+    # it are not copied
+    nodeIdsD = np.ascontiguousarray(nodeIds, dtype=np.int32)
+    nodeCoordsD = np.ascontiguousarray(nodeCoords, dtype=np.float64)
+    nodeOwnersD = np.ascontiguousarray(nodeOwners, dtype=np.int32)
 
     rc = _ESMF.ESMC_MeshAddNodes(mesh.struct.ptr, lnc,
                                  nodeIdsD, nodeCoordsD, nodeOwnersD)
@@ -1962,6 +2322,38 @@ def ESMP_FieldRead(field, filename, variablename, timeslice, iofmt=1):
         raise ValueError('ESMC_FieldRead() failed with rc = '+str(rc)+'.    '+
                         constants._errmsg)
 
+_ESMF.ESMC_FieldReadMulti.restype = ct.c_int
+_ESMF.ESMC_FieldReadMulti.argtypes = [ct.POINTER(ct.c_void_p),
+                                      ct.c_int,
+                                      Py3Char,
+                                      OptionalArrayOfStrings,
+                                      np.ctypeslib.ndpointer(dtype=np.int32),
+                                      ct.c_uint]
+@pio
+@netcdf
+def ESMP_FieldReadMulti(fields, filename, variablenames, timeslices, iofmt=1):
+    """
+    Preconditions: The ESMP_Fields have been created.\n
+    Postconditions: The contents of each of 'fields' have been read from
+                    file, which is opened once for all of them.\n
+    Arguments:\n
+        list of ESMP_Field :: fields\n
+        string             :: filename\n
+        list of strings    :: variablenames\n
+        list of integers   :: timeslices\n
+        IOFmt              :: iofmt\n
+    """
+    count = len(fields)
+    lfields = (ct.c_void_p * count)(*[field.struct.ptr for field in fields])
+    # a timeslice below 1 reads a variable without time axis
+    ltimeslices = np.array(timeslices, dtype=np.int32)
+
+    rc = _ESMF.ESMC_FieldReadMulti(lfields, count, filename, variablenames,
+                                   ltimeslices, iofmt)
+    if rc != constants._ESMP_SUCCESS:
+        raise ValueError('ESMC_FieldReadMulti() failed with rc = '+str(rc)+'.    '+
+                        constants._errmsg)
+
 
 
 _ESMF.ESMC_FieldRegridGetArea.restype = ct.c_int
@@ -1983,6 +2375,40 @@ def ESMP_FieldRegridGetArea(field):
         raise ValueError('ESMC_FieldRegridGetArea failed! rc = '+str(rc)+
                         '.    '+constants._errmsg)
 
+_ESMF.ESMC_FieldWrite.restype = ct.c_int
+_ESMF.ESMC_FieldWrite.argtypes = [ct.c_void_p,
+                                  Py3Char,
+                                  Py3Char,
+                                  ct.c_int,
+                                  ct.c_int,
+                                  ct.c_int,
+                                  ct.c_uint]
+@pio
+@netcdf
+def ESMP_FieldWrite(field, filename, variablename, overwrite=False,
+                    timeslice=None, iofmt=1):
+    """
+    Preconditions: An ESMP_Field has been created.\n
+    Postconditions: The contents of 'field' have been written to file.\n
+    Arguments:\n
+        ESMP_Field            :: field\n
+        string                :: filename\n
+        string                :: variablename\n
+        bool       (optional) :: overwrite\n
+        integer    (optional) :: timeslice\n
+        IOFmt      (optional) :: iofmt\n
+    """
+    # the file status is left to ESMF, a timeslice of 0 writes no time axis
+    status = 0
+    if isinstance(timeslice, type(None)):
+        timeslice = 0
+
+    rc = _ESMF.ESMC_FieldWrite(field.struct.ptr, filename, variablename,
+                               int(overwrite), status, timeslice, iofmt)
+    if rc != constants._ESMP_SUCCESS:
+        raise ValueError('ESMC_FieldWrite() failed with rc = '+str(rc)+'.    '+
+                        constants._errmsg)
+
 
 #### Regrid #####################################################
 
@@ -2361,6 +2787,49 @@ def ESMP_FieldSMMStore(srcField, dstField, filename,
 
     return routehandle
 
+_ESMF.ESMC_FieldSMMStoreFactors.restype = ct.c_int
+_ESMF.ESMC_FieldSMMStoreFactors.argtypes = [ct.c_void_p, ct.c_void_p,
+                                            np.ctypeslib.ndpointer(dtype=np.float64),
+                                            np.ctypeslib.ndpointer(dtype=np.int32),
+                                            ct.c_int,
+                                            ct.POINTER(ESMP_RouteHandle),
+                                            ct.c_void_p,
+                                            ct.POINTER(ct.c_int), ct.POINTER(ct.c_int)]
+def ESMP_FieldSMMStoreFactors(srcField, dstField, factorList, factorIndexList):
+    """
+    Preconditions: Two ESMP_Fields have been created and initialized
+                   sufficiently for a regridding operation to take
+                   place.  Each PET holds an arbitrary part of the
+                   sparse matrix, which may be empty.
+    Postconditions: A handle to the sparse matrix multiplication has been
+                    returned into 'routehandle'.\n
+    Arguments:\n
+        :RETURN: ESMP_RouteHandle           :: routehandle\n
+        ESMP_Field                          :: srcField\n
+        ESMP_Field                          :: dstField\n
+        Numpy.array(dtype=np.float64)       :: factorList\n
+        Numpy.array(dtype=np.int32)         :: factorIndexList\n
+    """
+    routehandle = ESMP_RouteHandle()
+
+    factorList = np.ascontiguousarray(factorList, dtype=np.float64)
+    factorIndexList = np.ascontiguousarray(factorIndexList, dtype=np.int32)
+    if factorIndexList.shape != (factorList.size, 2):
+        raise ValueError('factorIndexList must have shape (numFactors, 2)')
+
+    rc = _ESMF.ESMC_FieldSMMStoreFactors(srcField.struct.ptr,
+                                         dstField.struct.ptr,
+                                         factorList,
+                                         factorIndexList,
+                                         factorList.size,
+                                         ct.byref(routehandle),
+                                         None, None, None)
+    if rc != constants._ESMP_SUCCESS:
+        raise ValueError('ESMC_FieldSMMStoreFactors() failed with rc = '+str(rc)+
+                        '.    '+constants._errmsg)
+
+    return routehandle
+
 #### File Inquiry Utilities ##############################################
 _ESMF.ESMC_ScripInq.restype = None
 _ESMF.ESMC_ScripInq.argtypes = [Py3Char,
@@ -2447,3 +2916,62 @@ def ESMP_RouteHandleWrite(routehandle, filename):
     if rc != constants._ESMP_SUCCESS:
         raise NameError('ESMC_RouteHandleWrite() failed with rc = '+str(rc))
     return
+
+#### Trace #####################################################
+
+_ESMF.ESMC_TraceIsEnabled.restype = ct.c_int
+_ESMF.ESMC_TraceIsEnabled.argtypes = [ct.POINTER(ct.c_int)]
+def ESMP_TraceIsEnabled():
+    """
+    Preconditions: ESMP has been initialized.\n
+    Postconditions: Whether the ESMF trace is open on the local PET has been
+                    returned.\n
+    Arguments:\n
+        :RETURN: bool                       :: enabled\n
+    """
+    lenabled = ct.c_int(0)
+    rc = _ESMF.ESMC_TraceIsEnabled(ct.byref(lenabled))
+    if rc != constants._ESMP_SUCCESS:
+        raise ValueError('ESMC_TraceIsEnabled() failed with rc = '+str(rc)+'.    '+
+                        constants._errmsg)
+    return lenabled.value == 1
+
+_ESMF.ESMC_TraceRegionEnter.restype = ct.c_int
+_ESMF.ESMC_TraceRegionEnter.argtypes = [ct.c_char_p]
+def ESMP_TraceRegionEnter(name):
+    """
+    Preconditions: ESMP has been initialized.\n
+    Postconditions: Entry into the region 'name' has been recorded in the
+                    trace of the local PET.\n
+    Arguments:\n
+        string :: name\n
+    """
+    rc = _ESMF.ESMC_TraceRegionEnter(name.encode('utf-8'))
+    if rc != constants._ESMP_SUCCESS:
+        raise ValueError('ESMC_TraceRegionEnter() failed with rc = '+str(rc)+'.    '+
+                        constants._errmsg)
+
+_ESMF.ESMC_TraceRegionExit.restype = ct.c_int
+_ESMF.ESMC_TraceRegionExit.argtypes = [ct.c_char_p]
+def ESMP_TraceRegionExit(name):
+    """
+    Preconditions: ESMP has been initialized and the region 'name' has been
+                   entered.\n
+    Postconditions: Exit from the region 'name' has been recorded in the
+                    trace of the local PET.\n
+    Arguments:\n
+        string :: name\n
+    """
+    rc = _ESMF.ESMC_TraceRegionExit(name.encode('utf-8'))
+    if rc != constants._ESMP_SUCCESS:
+        raise ValueError('ESMC_TraceRegionExit() failed with rc = '+str(rc)+'.    '+
+                        constants._errmsg)
+
+#### Profiling ###########################################################
+# Instrument all of the bindings, the instrumentation only records timings
+# once profiling is enabled with esmpy.profile() or Manager(profile=True).
+for _name, _func in sorted(globals().items()):
+    if _name.startswith('ESMP_') and callable(_func) and \
+            not isinstance(_func, type):
+        globals()[_name] = profiled(_func)
+del _name, _func
@@ -0,0 +1,59 @@
+"""
+arena unit test file
+"""
+
+import pytest
+
+from esmpy import *
+from esmpy.test.base import TestBase
+from esmpy.util.grid_utilities import *
+import esmpy.util.finalizers as finalizers
+
+
+class TestArena(TestBase):
+
+    def test_arena(self):
+        dstgrid = grid_create_from_bounds([0, 4], [0, 4], 15, 18)
+        dstfield = Field(dstgrid)
+
+        live = finalizers.live()
+        with arena() as scope:
+            srcgrid = grid_create_from_bounds([0, 4], [0, 4], 24, 20)
+            srcfield = initialize_field_grid(Field(srcgrid))
+            rh = Regrid(srcfield, dstfield, regrid_method=RegridMethod.BILINEAR,
+                        unmapped_action=UnmappedAction.IGNORE)
+            dstfield = rh(srcfield, dstfield)
+            self.assertEqual(len(scope), 3)
+
+        # destroyed in the reverse order of creation, objects created before
+        # the block are untouched
+        self.assertTrue(rh.finalized)
+        self.assertTrue(srcfield.finalized)
+        self.assertTrue(srcgrid.finalized)
+        self.assertFalse(dstfield.finalized)
+        self.assertFalse(dstgrid.finalized)
+        self.assertEqual(finalizers.live(), live)
+
+    def test_arena_keep(self):
+        live = finalizers.live()
+        with arena() as scope:
+            grid = grid_create_from_bounds([0, 4], [0, 4], 24, 20)
+            field = scope.keep(Field(grid))
+            other = Field(grid)
+            with arena():
+                inner = Field(grid)
+            self.assertTrue(inner.finalized)
+            self.assertEqual(len(scope), 1)
+
+        self.assertTrue(other.finalized)
+        # the Grid of a kept Field is kept as well
+        self.assertFalse(field.finalized)
+        self.assertFalse(grid.finalized)
+        self.assertEqual(finalizers.live(), live + 2)
+
+    def test_arena_exception(self):
+        with self.assertRaises(RuntimeError):
+            with arena():
+                grid = grid_create_from_bounds([0, 4], [0, 4], 24, 20)
+                raise RuntimeError
+        self.assertTrue(grid.finalized)
@@ -0,0 +1,88 @@
+"""
+diagnostics unit test file
+"""
+
+import pytest
+
+from esmpy import *
+from esmpy.test.base import TestBase
+from esmpy.util.field_utilities import compare_fields
+from esmpy.util.grid_utilities import *
+from esmpy.util.mesh_utilities import *
+
+
+class TestDiagnostics(TestBase):
+
+    def test_diagnostics_mass(self):
+        grid = grid_create_from_bounds([0, 21], [0, 21], 21, 21, corners=True)
+        field = Field(grid, ndbounds=[2])
+        field.data[...] = 1
+        field.data[..., 1] = 2
+
+        # the areas are computed once for the Grid
+        area = diagnostics.cell_area(field)
+        self.assertIs(diagnostics.cell_area(Field(grid)), area)
+        self.assertEqual(area.shape, field.data.shape[:2])
+
+        self.assertAlmostEqual(diagnostics.mass(field), 3 * 21 * 21)
+
+        frac = Field(grid)
+        frac.data[...] = 0.5
+        self.assertAlmostEqual(diagnostics.mass(field, frac=frac), 1.5 * 21 * 21)
+
+        with self.assertRaises(ValueError):
+            diagnostics.cell_area(Field(LocStream(4)))
+
+    @pytest.mark.skipif(pet_count() not in {1, 4}, reason="test requires 1 or 4 cores")
+    def test_diagnostics_mesh_area(self):
+        if pet_count() == 4:
+            mesh, _, _, _, _ = mesh_create_5_parallel()
+        else:
+            mesh, _, _, _, _, _ = mesh_create_5()
+
+        area = diagnostics.cell_area(Field(mesh, meshloc=MeshLoc.ELEMENT))
+        self.assertEqual(area.shape, (mesh.size[element],))
+
+        # the nodes of a Mesh have no area
+        with self.assertRaises(ValueError):
+            diagnostics.cell_area(Field(mesh, meshloc=MeshLoc.NODE))
+
+    def test_diagnostics_compare(self):
+        srcgrid = grid_create_from_bounds([0, 21], [0, 21], 21, 21, corners=True, domask=True)
+        dstgrid = grid_create_from_bounds([0.5, 19.5], [0.5, 19.5], 19, 19, corners=True)
+
+        srcfield = initialize_field_grid(Field(srcgrid))
+        srcfracfield = Field(srcgrid)
+        dstfield = Field(dstgrid)
+        dstfracfield = Field(dstgrid)
+        exactfield = initialize_field_grid(Field(dstgrid))
+
+        rh = Regrid(srcfield, dstfield, src_mask_values=[0],
+                    regrid_method=RegridMethod.CONSERVE,
+                    unmapped_action=UnmappedAction.ERROR,
+                    src_frac_field=srcfracfield, dst_frac_field=dstfracfield)
+        rh(srcfield, dstfield)
+
+        stats = diagnostics.compare(dstfield, exactfield, frac=dstfracfield,
+                                    srcfield=srcfield, src_frac=srcfracfield)
+        self.assertAlmostEqual(stats['mean_relative_error'], 0.0024803189848013785)
+        self.assertAlmostEqual(stats['conservation_error'], 0.0)
+        self.assertGreaterEqual(stats['max_relative_error'], stats['mean_relative_error'])
+        self.assertLessEqual(stats['min_relative_error'], stats['mean_relative_error'])
+
+        # the same statistics as the pointwise utility
+        meanrel, csrvrel, _ = compare_fields(dstfield, exactfield, 10E-2, 10E-2, 10E-16,
+                                             dstfracfield=dstfracfield,
+                                             mass1=stats['src_mass'] / pet_count(),
+                                             mass2=stats['dst_mass'] / pet_count())
+        self.assertAlmostEqual(meanrel, stats['mean_relative_error'])
+        self.assertAlmostEqual(csrvrel, stats['conservation_error'])
+
+        # nothing left to compare
+        dstfracfield.data[...] = 0
+        stats = diagnostics.compare(dstfield, exactfield, frac=dstfracfield)
+        self.assertEqual(stats['count'], 0)
+        self.assertTrue(np.isnan(stats['mean_relative_error']))
+        self.assertNotIn('src_mass', stats)
+
+        rh.destroy()
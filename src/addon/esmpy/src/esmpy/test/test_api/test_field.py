@@ -4,8 +4,11 @@ field unit test file
 
 import pytest
 
+import os
+
 from esmpy import *
 from esmpy.test.base import TestBase
+from esmpy.api.constants import _ESMF_NETCDF, _ESMF_PIO
 from esmpy.util.mesh_utilities import mesh_create_50, mesh_create_50_parallel
 
 
@@ -265,6 +268,230 @@ class TestField(TestBase):
         assert np.all(field.grid.coords == field2.grid.coords)
         assert np.all(field.data == field2.data)
 
+    def test_field_finalizer(self):
+        import gc
+        import esmpy.util.finalizers as finalizers
+
+        live = finalizers.live()
+        field = self.make_field(np.array([10, 10], dtype=np.int32))
+        self.assertEqual(finalizers.live(), live + 2)
+
+        # copies and arrays aliasing ESMF memory keep the allocation alive
+        field2 = field.copy()
+        data = field.data
+        del field
+        gc.collect()
+        self.assertEqual(finalizers.live(), live + 2)
+        data[...] = 1
+        self.assertTrue(np.all(field2.data == 1))
+
+        # the Field is released before the Grid it is built on
+        del field2
+        gc.collect()
+        self.assertEqual(finalizers.live(), live + 2)
+        del data
+        gc.collect()
+        self.assertEqual(finalizers.live(), live)
+
+        # destroy() releases the allocation immediately, once
+        field = self.make_field(np.array([10, 10], dtype=np.int32))
+        field.destroy()
+        self.assertTrue(field.finalized)
+        field.destroy()
+        del field
+        gc.collect()
+        self.assertEqual(finalizers.live(), live)
+
+    def test_field_local_des(self):
+        # without regDecompPTile each of the 6 tiles is a DE
+        grid = Grid(tilesize=12, name="cubed_sphere")
+        field = Field(grid, ndbounds=[2])
+
+        assert field.local_decount == grid.local_decount
+        assert len(field.local_data) == field.local_decount
+        for localde in range(field.local_decount):
+            lb = field.local_lower_bounds[localde]
+            ub = field.local_upper_bounds[localde]
+            assert field.local_data[localde].shape == tuple(ub - lb)
+            assert field.local_data[localde].shape[:2] == \
+                   grid.get_coords(0, localde=localde).shape
+            field.local_data[localde][...] = localde
+
+        # the DEs do not share memory
+        for localde in range(field.local_decount):
+            assert np.all(field.local_data[localde] == localde)
+
+        if field.local_decount > 0:
+            assert field.data is field.local_data[0]
+        else:
+            assert field.data.size == 0
+
+        field.destroy()
+        grid.destroy()
+
+    def test_field_subset(self):
+        grid = Grid(np.array([20, 16]), coord_sys=CoordSys.CART,
+                    staggerloc=[StaggerLoc.CENTER])
+        field = Field(grid, ndbounds=[3])
+        index = np.meshgrid(*[np.arange(lb, ub) for lb, ub in
+                              zip(field.lower_bounds, field.upper_bounds)], indexing="ij")
+        field.data[...] = index[0] + 100 * index[1] + 10000 * index[2]
+
+        sub = grid.subset([5, 2], [15, 10])
+        subfield = field.subset(sub)
+        assert subfield.grid is sub
+        assert subfield.ndbounds == [3]
+
+        index = np.meshgrid(*[np.arange(lb, ub) for lb, ub in
+                              zip(subfield.lower_bounds, subfield.upper_bounds)], indexing="ij")
+        assert np.all(subfield.data == (index[0] + 5) + 100 * (index[1] + 2) + 10000 * index[2])
+
+        # only subsets of the Grid of the Field
+        with pytest.raises(ValueError):
+            field.subset(Grid(np.array([10, 8]), staggerloc=[StaggerLoc.CENTER]))
+
+    def test_field_gather_scatter(self):
+        grid = Grid(np.array([20, 16]), coord_sys=CoordSys.CART,
+                    staggerloc=[StaggerLoc.CENTER])
+        field = Field(grid, typekind=TypeKind.I4, ndbounds=[3])
+        index = np.meshgrid(*[np.arange(lb, ub) for lb, ub in
+                              zip(field.lower_bounds, field.upper_bounds)], indexing="ij")
+        field.data[...] = index[0] + 100 * index[1] + 10000 * index[2]
+
+        # the blocks of the PETs are placed at their bounds
+        ret = field.gather(root=pet_count() - 1)
+        if local_pet() == pet_count() - 1:
+            assert ret.shape == (20, 16, 3)
+            assert ret.dtype == np.int32
+            index = np.meshgrid(np.arange(20), np.arange(16), np.arange(3), indexing="ij")
+            assert np.all(ret == index[0] + 100 * index[1] + 10000 * index[2])
+        else:
+            assert ret is None
+
+        expected = np.arange(20 * 16 * 3).reshape(20, 16, 3)
+        field.scatter(expected if local_pet() == 0 else None)
+        assert np.all(field.data == expected[tuple(slice(lb, ub) for lb, ub in
+                                                   zip(field.lower_bounds, field.upper_bounds))])
+
+        # the points of a LocStream follow the PET order
+        locstream = LocStream(4, coord_sys=CoordSys.CART)
+        field = Field(locstream, ndbounds=[2])
+        field.data[...] = local_pet()
+        ret = field.gather()
+        if local_pet() == 0:
+            assert ret.shape == (4 * pet_count(), 2)
+            assert np.all(ret == np.repeat(np.arange(pet_count()), 4)[:, None])
+
+        field.scatter(np.arange(8 * pet_count()).reshape(-1, 2))
+        assert np.all(field.data == np.arange(8 * local_pet(), 8 * (local_pet() + 1)).reshape(-1, 2))
+
+        # a global array of the wrong shape raises on every PET
+        with self.assertRaises(ValueError):
+            field.scatter(np.zeros((3, 2)) if local_pet() == 0 else None)
+
+        # the DEs of the tiles of a cubed sphere would overlap in the global
+        # index space, so every PET raises
+        field = Field(Grid(tilesize=12, name="cubed_sphere"))
+        with self.assertRaises(ValueError):
+            field.gather()
+        with self.assertRaises(ValueError):
+            field.scatter(np.zeros((12, 12)) if local_pet() == 0 else None)
+
+    @pytest.mark.skipif(_ESMF_PIO==False, reason="PIO required in ESMF build")
+    @pytest.mark.skipif(_ESMF_NETCDF==False, reason="NetCDF required in ESMF build")
+    def test_field_write(self):
+        filename = 'esmpy_test_field_write.nc'
+        path = os.path.join(os.getcwd(), filename)
+        if local_pet() == 0:
+            if os.path.isfile(path):
+                os.remove(path)
+        self.mg.barrier()
+
+        grid = Grid(np.array([20, 16]), coord_sys=CoordSys.CART,
+                    staggerloc=[StaggerLoc.CENTER])
+        field = Field(grid)
+        index = np.meshgrid(*[np.arange(lb, ub) for lb, ub in
+                              zip(field.lower_bounds, field.upper_bounds)], indexing="ij")
+        field.data[...] = index[0] + 100 * index[1]
+        field.write(filename, "data")
+
+        # every PET reads back its own part
+        field2 = Field(grid)
+        field2.read(filename, "data", timeslice=1)
+        self.assertNumpyAll(field2.data, field.data)
+
+        # without overwrite the variable cannot be written again
+        with self.assertRaises(ValueError):
+            field.write(filename, "data")
+        field.data[...] = 1
+        field.write(filename, "data", overwrite=True)
+        field2.read(filename, "data", timeslice=1)
+        assert np.all(field2.data == 1)
+
+        # ungridded dimensions and time slices
+        field = Field(grid, ndbounds=[3])
+        for timeslice in [1, 2]:
+            field.data[...] = timeslice
+            field.write(filename, "levels", timeslice=timeslice)
+
+        with self.assertRaises(ValueError):
+            field.write(filename, "levels", timeslice=0)
+
+        self.mg.barrier()
+        if local_pet() == 0:
+            os.remove(path)
+
+    @pytest.mark.skipif(_ESMF_PIO==False, reason="PIO required in ESMF build")
+    @pytest.mark.skipif(_ESMF_NETCDF==False, reason="NetCDF required in ESMF build")
+    def test_read_fields(self):
+        filename = 'esmpy_test_read_fields.nc'
+        path = os.path.join(os.getcwd(), filename)
+        if local_pet() == 0:
+            if os.path.isfile(path):
+                os.remove(path)
+        self.mg.barrier()
+
+        grid = Grid(np.array([20, 16]), coord_sys=CoordSys.CART,
+                    staggerloc=[StaggerLoc.CENTER])
+        field = Field(grid)
+        variables = ["tas", "pr"]
+        for v, variable in enumerate(variables):
+            for timeslice in [1, 2, 3]:
+                field.data[...] = 10 * v + timeslice
+                field.write(filename, variable, timeslice=timeslice)
+
+        # a list of Fields for each variable
+        fields = [[Field(grid) for _ in range(2)] for _ in variables]
+        read_fields(filename, fields, variables, timeslices=[1, 3])
+        for v in range(len(variables)):
+            for t, timeslice in enumerate([1, 3]):
+                assert np.all(fields[v][t].data == 10 * v + timeslice)
+
+        # the last ungridded dimension of a single Field
+        field = Field(grid, ndbounds=[6])
+        read_fields(filename, field, variables, timeslices=[1, 2, 3])
+        assert np.all(field.data == np.array([1, 2, 3, 11, 12, 13]))
+
+        # fewer temporaries than slices
+        field.data[...] = 0
+        read_fields(filename, field, variables, timeslices=[1, 2, 3],
+                    max_temporaries=4)
+        assert np.all(field.data == np.array([1, 2, 3, 11, 12, 13]))
+
+        field = Field(grid)
+        field.read(filename, "pr")
+        assert np.all(field.data == 11)
+
+        with self.assertRaises(ValueError):
+            read_fields(filename, Field(grid, ndbounds=[2]), variables,
+                        timeslices=[1, 2])
+        with self.assertRaises(ValueError):
+            read_fields(filename, fields, variables, timeslices=[0])
+
+        self.mg.barrier()
+        if local_pet() == 0:
+            os.remove(path)
+
     # don't change this function, it's used in the documentation
     def create_field(gml, name):
         '''
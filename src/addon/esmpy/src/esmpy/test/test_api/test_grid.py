@@ -10,6 +10,7 @@ import os
 
 from esmpy import *
 from esmpy.interface.cbindings import *
+from esmpy.util.esmpyarray import ndarray_from_esmf
 from esmpy.test.base import TestBase
 from esmpy.api.constants import _ESMF_NETCDF
 from esmpy.util.cache_data import DATA_DIR
@@ -297,6 +298,106 @@ class TestGrid(TestBase):
             grid.destroy()
             # grid2.destroy()
 
+    def test_grid_local_des(self):
+        # without regDecompPTile each of the 6 tiles is a DE
+        grid = Grid(tilesize=12, name="cubed_sphere")
+        grid.add_item(GridItem.MASK)
+        grid.add_item(GridItem.AREA)
+
+        if pet_count() == 1:
+            assert grid.local_decount == 6
+
+        center = StaggerLoc.CENTER
+        assert len(grid.local_lower_bounds[center]) == grid.local_decount
+        assert len(grid.local_mask[center]) == grid.local_decount
+        assert len(grid.local_area[center]) == grid.local_decount
+        for localde in range(grid.local_decount):
+            shape = tuple(grid.local_upper_bounds[center][localde] -
+                          grid.local_lower_bounds[center][localde])
+            for coord_dim in range(grid.rank):
+                assert len(grid.local_coords[center][coord_dim]) == grid.local_decount
+                assert grid.get_coords(coord_dim, localde=localde).shape == shape
+            assert np.all(grid.get_item(GridItem.MASK, localde=localde) == 1)
+
+            # the arrays alias the ESMF allocation of each DE
+            grid.local_area[center][localde][...] = localde
+            area = ndarray_from_esmf(ESMP_GridGetItem(grid, GridItem.AREA, staggerloc=center,
+                                                      localde=localde),
+                                     TypeKind.R8, shape)
+            assert np.all(area == localde)
+
+        # the single DE properties are those of the first local DE
+        if grid.local_decount > 0:
+            assert grid.coords[center][0] is grid.local_coords[center][0][0]
+            assert grid.mask[center] is grid.local_mask[center][0]
+
+        grid.destroy()
+
+    def test_grid_subset(self):
+        staggers = [StaggerLoc.CENTER, StaggerLoc.CORNER]
+        grid = Grid(np.array([20, 16]), coord_sys=CoordSys.CART, staggerloc=staggers)
+        # the coordinates are the global indices
+        for stagger in staggers:
+            lb, ub = grid.lower_bounds[stagger], grid.upper_bounds[stagger]
+            index = np.meshgrid(np.arange(lb[0], ub[0]), np.arange(lb[1], ub[1]), indexing="ij")
+            for coord_dim in range(2):
+                grid.get_coords(coord_dim, staggerloc=stagger)[...] = index[coord_dim]
+        mask = grid.add_item(GridItem.MASK)
+        mask[...] = grid.get_coords(0) % 2
+
+        sub = grid.subset([5, 2], [15, 10])
+        assert sub.max_index.tolist() == [10, 8]
+        assert sub.num_peri_dims == 0
+        for stagger in staggers:
+            lb, ub = sub.lower_bounds[stagger], sub.upper_bounds[stagger]
+            index = np.meshgrid(np.arange(lb[0], ub[0]), np.arange(lb[1], ub[1]), indexing="ij")
+            assert np.all(sub.get_coords(0, staggerloc=stagger) == index[0] + 5)
+            assert np.all(sub.get_coords(1, staggerloc=stagger) == index[1] + 2)
+        assert np.all(sub.get_item(GridItem.MASK) == sub.get_coords(0) % 2)
+
+        # the index box of the cell centers within the bounds
+        sub = grid.subset_bbox([(4.5, 9.5), (2, 3)])
+        assert sub.max_index.tolist() == [5, 2]
+
+        with pytest.raises(ValueError):
+            grid.subset([0, 0], [21, 16])
+        with pytest.raises(ValueError):
+            grid.subset_bbox([(30, 40), (0, 16)])
+
+    def test_grid_subset_rectilinear(self):
+        lon_bounds = np.linspace(0, 360, 37)
+        lat_bounds = np.linspace(-90, 90, 19)
+        grid = Grid.from_axes((lon_bounds[:-1] + lon_bounds[1:]) / 2,
+                              (lat_bounds[:-1] + lat_bounds[1:]) / 2,
+                              lon_bounds=lon_bounds, lat_bounds=lat_bounds,
+                              periodic=True)
+
+        sub = grid.subset_bbox([(40, 80), (-20, 20)])
+        assert sub.rectilinear
+        assert sub.max_index.tolist() == [4, 4]
+        for stagger, offset in ((StaggerLoc.CENTER, 5), (StaggerLoc.CORNER, 0)):
+            lb, ub = sub.lower_bounds[stagger], sub.upper_bounds[stagger]
+            assert np.all(sub.get_coords(0, staggerloc=stagger) ==
+                          40 + offset + 10 * np.arange(lb[0], ub[0]))
+            assert np.all(sub.get_coords(1, staggerloc=stagger) ==
+                          -20 + offset + 10 * np.arange(lb[1], ub[1]))
+
+        # a subset spanning the periodic dimension stays periodic
+        sub = grid.subset([0, 4], [36, 14])
+        assert sub.num_peri_dims == 1
+
+        # a box across the periodic edge wraps around it
+        sub = grid.subset_bbox([(340, 20), (-20, 20)])
+        assert sub.max_index.tolist() == [4, 4]
+        assert sub.num_peri_dims == 0
+        lb, ub = sub.lower_bounds[StaggerLoc.CENTER], sub.upper_bounds[StaggerLoc.CENTER]
+        assert np.all(sub.get_coords(0) == (345 + 10 * np.arange(lb[0], ub[0])) % 360)
+
+        sub = grid.subset([30, 4], [66, 14])
+        assert sub.num_peri_dims == 1
+        with pytest.raises(ValueError):
+            grid.subset([30, 4], [67, 14])
+
     @pytest.mark.skipif(pet_count()!=1, reason="test must be run in serial")
     def test_grid_slice_2d(self):
         grid = self.make_grid_2d()
@@ -429,6 +530,59 @@ class TestGrid(TestBase):
         assert grid3.coords[StaggerLoc.CORNER][0].shape == (3, 2)
         assert grid3.upper_bounds[StaggerLoc.CORNER].tolist() == [3, 2]
 
+    def test_grid_from_axes(self):
+        lon_bounds = np.linspace(0, 360, 37)
+        lat_bounds = np.linspace(-90, 90, 19)
+        lon = (lon_bounds[:-1] + lon_bounds[1:]) / 2
+        lat = (lat_bounds[:-1] + lat_bounds[1:]) / 2
+
+        # CF bounds of shape (n, 2) are converted to edges
+        lat_cf = np.array([lat_bounds[:-1], lat_bounds[1:]]).T
+
+        grid = Grid.from_axes(lon, lat, lon_bounds=lon_bounds, lat_bounds=lat_cf,
+                              periodic=True)
+
+        assert grid.rectilinear
+        assert grid.ndims == 1
+        assert grid.has_corners
+
+        for stagger, axes in ((StaggerLoc.CENTER, (lon, lat)),
+                              (StaggerLoc.CORNER, (lon_bounds, lat_bounds))):
+            lb = grid.lower_bounds[stagger]
+            ub = grid.upper_bounds[stagger]
+            for coord_dim in range(2):
+                coords = grid.get_coords(coord_dim, staggerloc=stagger)
+                assert coords.shape == (ub[coord_dim] - lb[coord_dim],)
+                assert np.all(coords == axes[coord_dim][lb[coord_dim]:ub[coord_dim]])
+
+        # the corners of the periodic dimension omit the last edge
+        assert grid.max_index.tolist() == [36, 18]
+        if pet_count() == 1:
+            assert grid.upper_bounds[StaggerLoc.CORNER].tolist() == [36, 19]
+
+        grid.add_item(GridItem.MASK)
+        assert grid.mask[StaggerLoc.CENTER].shape == tuple(grid.size[StaggerLoc.CENTER])
+
+        with pytest.raises(ValueError):
+            Grid.from_axes(lon, lat, lon_bounds=lon_bounds, lat_bounds=lat_bounds[1:])
+
+    @pytest.mark.skipif(pet_count()!=1, reason="test must be run in serial")
+    def test_grid_slice_rectilinear(self):
+        lon_bounds = np.linspace(0, 40, 41)
+        lat_bounds = np.linspace(-10, 10, 21)
+        grid = Grid.from_axes(lon_bounds[:-1] + .5, lat_bounds[:-1] + .5,
+                              lon_bounds=lon_bounds, lat_bounds=lat_bounds,
+                              coord_sys=CoordSys.CART)
+
+        grid2 = grid[1:21, 3:17]
+
+        assert grid2.coords[StaggerLoc.CENTER][0].shape == (20,)
+        assert grid2.coords[StaggerLoc.CENTER][1].shape == (14,)
+        assert grid2.upper_bounds[StaggerLoc.CENTER].tolist() == [20, 14]
+        assert grid2.coords[StaggerLoc.CORNER][0].shape == (21,)
+        assert grid2.upper_bounds[StaggerLoc.CORNER].tolist() == [21, 15]
+        assert np.all(grid2.coords[StaggerLoc.CORNER][1] == lat_bounds[3:18])
+
     @pytest.mark.skipif(_ESMF_NETCDF==False, reason="NetCDF required in ESMF build")
     @pytest.mark.skipif(pet_count()!=1, reason="test must be run in serial")
     def test_slice_grid_created_from_file_scrip(self):
@@ -105,6 +105,28 @@ class TestLocStream(TestBase):
 
         assert(np.all(locstream["ESMF:X"] == np.array([0, 1, 2, 3, 4])))
 
+    def test_subset(self):
+        locstream = LocStream(4, coord_sys=CoordSys.SPH_DEG)
+        locstream["ESMF:Lon"] = [350., 5., 90., 180.]
+        locstream["ESMF:Lat"] = [0., 10., 20., -80.]
+        locstream["ESMF:Mask"] = np.array([1, 0, 1, 0], dtype=np.int32)
+
+        # the longitudes wrap around
+        sub = locstream.subset_bbox([(340, 20), (-30, 30)])
+        assert sub.size == 2
+        assert sub["ESMF:Lon"].tolist() == [350., 5.]
+        assert sub["ESMF:Mask"].tolist() == [1, 0]
+
+        field = Field(locstream, ndbounds=[2])
+        field.data[...] = np.arange(8).reshape(4, 2)
+        subfield = field.subset(sub)
+        assert subfield.data.tolist() == [[0, 1], [2, 3]]
+
+        # a PET may hold no point
+        empty = locstream.subset(np.zeros(4, dtype=bool))
+        assert empty.size == 0
+        assert empty["ESMF:Lat"].size == 0
+
     @pytest.mark.xfail
     def test_pickle(self):
         locstream = LocStream(10, name="Test LocStream")
@@ -139,6 +139,74 @@ class TestMesh(TestBase):
 
         self.assertNumpyAll(mesh.area, elemArea)
 
+    @pytest.mark.skipif(pet_count()!=1, reason="test must be run in serial")
+    def test_mesh_from_arrays(self):
+        _, nodeCoord, nodeOwner, elemType, elemConn = mesh_create_5_pentahexa()
+
+        # the connectivity of mesh_create_5_pentahexa as a padded 1-based
+        # UGRID face_node_connectivity, the last row padded by the mask
+        face_nodes = np.ma.masked_array([[1, 2, 5, 4, -1, -1],
+                                         [2, 3, 5, -1, -1, -1],
+                                         [3, 6, 5, -1, -1, -1],
+                                         [4, 5, 9, 8, 7, -1],
+                                         [5, 6, 12, 11, 10, 9]],
+                                        mask=[[0, 0, 0, 0, 1, 1]] + [[0] * 6] * 4)
+
+        mesh = Mesh.from_arrays(nodeCoord.reshape(-1, 2), face_nodes,
+                                fill_value=-1, start_index=1,
+                                element_area=np.arange(1., 6.))
+
+        self.assertNumpyAll(mesh.element_types, np.array(elemType, dtype=np.int32))
+        self.assertNumpyAll(mesh.element_conn, np.array(elemConn, dtype=np.int32))
+        assert mesh.size == [12, 5]
+        self.check_mesh(mesh, nodeCoord, nodeOwner)
+
+        with pytest.raises(ValueError):
+            Mesh.from_arrays(nodeCoord.reshape(-1, 2), face_nodes[:, :2])
+
+    @pytest.mark.skipif(pet_count()!=1, reason="test must be run in serial")
+    def test_mesh_coords_linked_as_views(self):
+        mesh, nodeCoord, nodeOwner, elemType, elemConn, elemCoord = \
+            mesh_create_5()
+
+        # the coordinate arrays for each dimension are strided views into a
+        # single buffer, not per-dimension copies
+        for meshloc in [node, element]:
+            xcoords = mesh.get_coords(0, meshloc)
+            ycoords = mesh.get_coords(1, meshloc)
+            assert xcoords.base is not None
+            assert xcoords.base is ycoords.base
+            assert np.shares_memory(xcoords, ycoords)
+
+        self.check_mesh(mesh, nodeCoord, nodeOwner, elemCoord=elemCoord)
+
+    @pytest.mark.skipif(pet_count()!=1, reason="test must be run in serial")
+    def test_mesh_coords_3d(self):
+        mesh = Mesh(parametric_dim=3, spatial_dim=3, coord_sys=CoordSys.CART)
+
+        num_node = 8
+        nodeId = np.arange(1, num_node + 1)
+        nodeCoord = np.array([0.0, 0.0, 0.0,
+                              1.0, 0.0, 0.0,
+                              0.0, 1.0, 0.0,
+                              1.0, 1.0, 0.0,
+                              0.0, 0.0, 1.0,
+                              1.0, 0.0, 1.0,
+                              0.0, 1.0, 1.0,
+                              1.0, 1.0, 1.0])
+        nodeOwner = np.zeros(num_node)
+
+        elemId = np.array([1])
+        elemType = np.array([MeshElemType.HEX])
+        elemConn = np.array([0, 1, 3, 2, 4, 5, 7, 6])
+
+        mesh.add_nodes(num_node, nodeId, nodeCoord, nodeOwner)
+        mesh.add_elements(1, elemId, elemType, elemConn)
+
+        nodeCoord = nodeCoord.reshape(num_node, 3)
+        for coord_dim in range(3):
+            self.assertNumpyAll(mesh.get_coords(coord_dim), nodeCoord[:, coord_dim])
+
     @pytest.mark.skipif(_ESMF_PIO==False, reason="PIO required in ESMF build")
     @pytest.mark.skipif(_ESMF_NETCDF==False, reason="NetCDF required in ESMF build")
     def test_mesh_create_from_file_scrip(self):
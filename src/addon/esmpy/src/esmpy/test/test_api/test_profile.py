@@ -0,0 +1,52 @@
+"""
+profile unit test file
+"""
+
+import pytest
+
+from esmpy import *
+from esmpy.test.base import TestBase
+from esmpy.util.grid_utilities import *
+import esmpy.util.profiling as profiling
+
+
+class TestProfile(TestBase):
+
+    def test_profile(self):
+        srcgrid = grid_create_from_bounds([0, 4], [0, 4], 24, 20)
+        dstgrid = grid_create_from_bounds([0, 4], [0, 4], 15, 18)
+        srcfield = initialize_field_grid(Field(srcgrid))
+        dstfield = Field(dstgrid)
+
+        with profile() as prof:
+            rh = Regrid(srcfield, dstfield, regrid_method=RegridMethod.BILINEAR,
+                        unmapped_action=UnmappedAction.IGNORE)
+            for _ in range(3):
+                dstfield = rh(srcfield, dstfield)
+        self.assertFalse(profiling.enabled())
+
+        local = prof.local()
+        self.assertEqual(local['ESMP_FieldRegridStore']['count'], 1)
+        self.assertEqual(local['ESMP_FieldRegrid']['count'], 3)
+        self.assertGreater(local['ESMP_FieldRegrid']['time'], 0)
+
+        # calls outside of the block are not recorded
+        dstfield = rh(srcfield, dstfield)
+        self.assertEqual(prof.local()['ESMP_FieldRegrid']['count'], 3)
+
+        summary = prof.summary()
+        self.assertEqual(summary['ESMP_FieldRegrid']['count'], 3 * pet_count())
+        self.assertGreaterEqual(summary['ESMP_FieldRegrid']['time'],
+                                summary['ESMP_FieldRegrid']['time_max'])
+        self.assertIn('ESMP_FieldRegrid', prof.report())
+
+        rh.destroy()
+
+    def test_profile_bytes(self):
+        send = np.ones(8, dtype=np.float64)
+        recv = np.zeros(8, dtype=np.float64)
+
+        with profile() as prof:
+            self.mg._reduce_(send, recv, 8)
+
+        self.assertEqual(prof.local()['ESMP_VMReduce']['bytes'], 2 * send.nbytes)
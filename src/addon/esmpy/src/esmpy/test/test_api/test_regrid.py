@@ -83,6 +83,129 @@ class TestRegrid(TestBase):
                     line_type=LineType.CART, factors=False)
         _ = rh(srcfield, dstfield)
 
+    def test_field_regrid_many(self):
+        srcgrid = grid_create_from_bounds([0, 4], [0, 4], 24, 20)
+        dstgrid = grid_create_from_bounds([0, 4], [0, 4], 15, 18)
+
+        srcfields = [Field(srcgrid) for _ in range(3)]
+        dstfields = [Field(dstgrid) for _ in range(3)]
+        for ii, srcfield in enumerate(srcfields):
+            initialize_field_grid(srcfield)
+            srcfield.data[...] *= ii + 1
+
+        # pairs with other ungridded dimensions or typekinds are regridded
+        # in their own groups
+        srcfields.append(Field(srcgrid, ndbounds=[2, 3]))
+        dstfields.append(Field(dstgrid, ndbounds=[2, 3]))
+        srcfields[-1].data[...] = np.arange(6).reshape(2, 3, order='F')
+        srcfields.append(Field(srcgrid, typekind=TypeKind.R4))
+        dstfields.append(Field(dstgrid, typekind=TypeKind.R4))
+        srcfields[-1].data[...] = 2
+
+        rh = Regrid(srcfields[0], dstfields[0],
+                    regrid_method=RegridMethod.BILINEAR,
+                    unmapped_action=UnmappedAction.IGNORE)
+
+        ret, timings = rh.regrid_many(list(zip(srcfields, dstfields)))
+        self.assertEqual(len(ret), 5)
+        self.assertIs(ret[0], dstfields[0])
+        self.assertEqual(len(timings), 5)
+        self.assertTrue(all(timing > 0 for timing in timings))
+
+        # each pair matches a separate call through the same routehandle
+        for srcfield, dstfield in zip(srcfields, dstfields):
+            expected = Field(dstgrid, typekind=dstfield.type,
+                             ndbounds=dstfield.ndbounds)
+            expected = rh(srcfield, expected)
+            self.assertNumpyAll(np.array(dstfield.data), np.array(expected.data))
+
+    def test_field_regrid_store_batch(self):
+        srcgrid = grid_create_from_bounds([0, 4], [0, 4], 24, 20)
+        srcfield = initialize_field_grid(Field(srcgrid))
+        dstfields = [Field(grid_create_from_bounds([0, 4], [0, 4], nx, ny))
+                     for nx, ny in [(15, 18), (9, 11), (30, 7)]]
+
+        batch = RegridStoreBatch(srcfield, dstfields,
+                                 regrid_method=RegridMethod.BILINEAR,
+                                 unmapped_action=UnmappedAction.IGNORE)
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(len(batch.timings), 3)
+        self.assertIs(batch.srcfield, srcfield)
+
+        # each operator matches a separate store
+        for regrid, dstfield in zip(batch, batch.dstfields):
+            self.assertIs(regrid.dstfield, dstfield)
+            expected = Field(dstfield.grid)
+            rh = Regrid(srcfield, expected, regrid_method=RegridMethod.BILINEAR,
+                        unmapped_action=UnmappedAction.IGNORE)
+            rh(srcfield, expected)
+            regrid(srcfield, dstfield)
+            self.assertNumpyAll(np.array(dstfield.data), np.array(expected.data))
+            rh.destroy()
+
+        with self.assertRaises(ValueError):
+            RegridStoreBatch(srcfield, dstfields, filename="weights.nc")
+
+        batch.destroy()
+
+    @pytest.mark.skipif(not constants._ESMF_USE_INMEM_FACTORS, reason="compiler does not support in-memory weights")
+    @pytest.mark.skipif(pet_count()!=1, reason="test must be run in serial")
+    def test_field_regrid_finalizer(self):
+        import gc
+        import esmpy.util.finalizers as finalizers
+
+        srcgrid = grid_create_from_bounds([0, 4], [0, 4], 24, 20)
+        dstgrid = grid_create_from_bounds([0, 4], [0, 4], 15, 18)
+        srcfield = initialize_field_grid(Field(srcgrid))
+        dstfield = Field(dstgrid)
+
+        live = finalizers.live()
+        rh = Regrid(srcfield, dstfield, regrid_method=RegridMethod.BILINEAR,
+                    unmapped_action=UnmappedAction.IGNORE, factors=True)
+        self.assertEqual(finalizers.live(), live + 1)
+
+        # the factor arrays alias the Fortran allocations and keep them alive
+        factors, _ = rh.get_factors()
+        expected = factors.copy()
+        del rh
+        gc.collect()
+        self.assertEqual(finalizers.live(), live + 1)
+        self.assertNumpyAll(factors, expected)
+
+        del factors
+        gc.collect()
+        self.assertEqual(finalizers.live(), live)
+
+    def test_field_regrid_chunked(self):
+        srcgrid = grid_create_from_bounds([0, 4], [0, 4], 24, 20)
+        dstgrid = grid_create_from_bounds([0, 4], [0, 4], 15, 18)
+        srcfield = initialize_field_grid(Field(srcgrid))
+        dstfield = Field(dstgrid)
+
+        rh = Regrid(srcfield, dstfield, regrid_method=RegridMethod.BILINEAR,
+                    unmapped_action=UnmappedAction.IGNORE)
+
+        # two ungridded dimensions, walked in blocks that do not divide them
+        scales = np.arange(1, 7, dtype=np.float64).reshape(2, 3)
+        src = np.array(srcfield.data)[..., None, None] * scales
+        dst = np.zeros(dstfield.data.shape + scales.shape)
+        ret = rh.regrid_chunked(srcfield, dstfield, src, dst, chunk=4)
+        self.assertIs(ret, dst)
+
+        expected = np.array(rh(srcfield, dstfield).data)
+        self.assertNumpyAllClose(dst, expected[..., None, None] * scales)
+
+        # without ungridded dimensions or a destination array
+        ret = rh.regrid_chunked(srcfield, dstfield, np.array(srcfield.data))
+        self.assertNumpyAllClose(ret, expected)
+
+        with self.assertRaises(ValueError):
+            rh.regrid_chunked(srcfield, dstfield, src, dst, chunk=0)
+        with self.assertRaises(ValueError):
+            rh.regrid_chunked(srcfield, dstfield, src, dst[..., :1])
+
+        rh.destroy()
+
     @pytest.mark.skipif(not constants._ESMF_USE_INMEM_FACTORS, reason="compiler does not support in-memory weights")
     @pytest.mark.skipif(pet_count()!=1, reason="test must be run in serial")
     def test_field_regrid_factor_retrieval(self):
@@ -181,6 +304,173 @@ class TestRegrid(TestBase):
 
                 rh.destroy()
 
+    @pytest.mark.skipif(not constants._ESMF_USE_INMEM_FACTORS, reason="compiler does not support in-memory weights")
+    @pytest.mark.skipif(pet_count()!=1, reason="test must be run in serial")
+    def test_field_regrid_apply(self):
+        srcgrid = grid_create_from_bounds([0, 4], [0, 4], 24, 20)
+        dstgrid = grid_create_from_bounds([0, 4], [0, 4], 15, 18)
+
+        srcfield = Field(srcgrid, ndbounds=[3])
+        dstfield = Field(dstgrid, ndbounds=[3])
+        for level in range(3):
+            srcfield.data[:, :, level] = \
+                initialize_field_grid(Field(srcgrid)).data * (level + 1)
+        dstfield.data[...] = 0
+
+        rh = Regrid(srcfield, dstfield, regrid_method=RegridMethod.BILINEAR,
+                    unmapped_action=UnmappedAction.IGNORE, factors=True)
+        dstfield = rh(srcfield, dstfield)
+
+        self.assertEqual(rh.src_shape, (24, 20))
+        self.assertEqual(rh.dst_shape, (15, 18))
+
+        # trailing batch dimension, matching the Field layout
+        result = rh.apply(srcfield.data)
+        self.assertEqual(result.shape, dstfield.data.shape)
+        self.assertNumpyAllClose(result, dstfield.data)
+
+        # leading batch dimension, every value of dst_values is overwritten
+        leading = np.moveaxis(srcfield.data, 2, 0)
+        out = np.full((3, 15, 18), 9.)
+        result = rh.apply(leading, dst_values=out, grid_axis=1)
+        self.assertIs(result, out)
+        self.assertNumpyAllClose(np.moveaxis(out, 0, 2), dstfield.data)
+
+        with self.assertRaises(ValueError):
+            rh.apply(np.zeros((20, 24)))
+
+        rh.destroy()
+
+    @pytest.mark.skipif(not constants._ESMF_USE_INMEM_FACTORS, reason="compiler does not support in-memory weights")
+    @pytest.mark.skipif(pet_count()!=1, reason="test must be run in serial")
+    def test_field_regrid_apply_transpose(self):
+        srcgrid = grid_create_from_bounds([0, 4], [0, 4], 24, 20)
+        dstgrid = grid_create_from_bounds([0, 4], [0, 4], 15, 18)
+
+        srcfield = Field(srcgrid, ndbounds=[2])
+        dstfield = Field(dstgrid, ndbounds=[2])
+        adjfield = Field(srcgrid, ndbounds=[2])
+        srcfield.data[...] = np.random.rand(*srcfield.data.shape)
+        dstvalues = np.random.rand(*dstfield.data.shape)
+
+        rh = Regrid(srcfield, dstfield, regrid_method=RegridMethod.BILINEAR,
+                    unmapped_action=UnmappedAction.IGNORE, factors=True)
+        rh(srcfield, dstfield)
+        forward = np.array(dstfield.data)
+
+        dstfield.data[...] = dstvalues
+        rh.apply_transpose(dstfield, adjfield)
+        # run it twice to reuse the transposed routehandle
+        self.assertIs(rh.apply_transpose(dstfield, adjfield), adjfield)
+
+        # <W x, y> == <x, W^T y> for each ungridded element
+        for level in range(2):
+            self.assertAlmostEqual(np.sum(forward[..., level] * dstvalues[..., level]),
+                                   np.sum(srcfield.data[..., level] * adjfield.data[..., level]))
+
+        rh.destroy()
+
+    @pytest.mark.skipif(not constants._ESMF_USE_INMEM_FACTORS, reason="compiler does not support in-memory weights")
+    @pytest.mark.skipif(pet_count()!=1, reason="test must be run in serial")
+    def test_field_regrid_compose(self):
+        agrid = grid_create_from_bounds([0, 4], [0, 4], 24, 20)
+        bgrid = grid_create_from_bounds([0, 4], [0, 4], 15, 18)
+        cgrid = grid_create_from_bounds([0, 4], [0, 4], 9, 11)
+
+        afield = initialize_field_grid(Field(agrid))
+        bfield = Field(bgrid)
+        cfield = Field(cgrid)
+        exactfield = Field(cgrid)
+
+        rh_ab = Regrid(afield, bfield, regrid_method=RegridMethod.BILINEAR,
+                       unmapped_action=UnmappedAction.IGNORE, factors=True)
+        rh_bc = Regrid(bfield, cfield, regrid_method=RegridMethod.BILINEAR,
+                       unmapped_action=UnmappedAction.IGNORE, factors=True)
+        rh_bc(rh_ab(afield, bfield), exactfield)
+
+        rh_ac = compose(rh_ab, rh_bc)
+        self.assertEqual(rh_ac.src_shape, (24, 20))
+        self.assertEqual(rh_ac.dst_shape, (9, 11))
+        self.assertEqual(rh_ac.regrid_method, RegridMethod.BILINEAR)
+        rh_ac(afield, cfield)
+        self.assertNumpyAllClose(cfield.data, exactfield.data)
+
+        with self.assertRaises(ValueError):
+            compose(rh_bc, rh_ab)
+
+        rh_ac.destroy()
+        rh_bc.destroy()
+        rh_ab.destroy()
+
+    @pytest.mark.skipif(not constants._ESMF_USE_INMEM_FACTORS, reason="compiler does not support in-memory weights")
+    @pytest.mark.skipif(pet_count()!=1, reason="test must be run in serial")
+    def test_field_regrid_to_sparse(self):
+        scipy = pytest.importorskip("scipy")
+
+        srcgrid = grid_create_from_bounds([0, 4], [0, 4], 24, 20)
+        dstgrid = grid_create_from_bounds([0, 4], [0, 4], 15, 18)
+        srcfield = initialize_field_grid(Field(srcgrid))
+        dstfield = Field(dstgrid)
+
+        rh = Regrid(srcfield, dstfield, regrid_method=RegridMethod.BILINEAR,
+                    unmapped_action=UnmappedAction.IGNORE, factors=True)
+        dstfield = rh(srcfield, dstfield)
+
+        mat = rh.to_sparse()
+        self.assertEqual(mat.shape, (15 * 18, 24 * 20))
+        self.assertEqual(mat.src_shape, (24, 20))
+        self.assertEqual(mat.dst_shape, (15, 18))
+        self.assertEqual(mat.nnz, rh.get_factors()[0].size)
+
+        result = mat.dot(srcfield.data.ravel(order='F'))
+        self.assertNumpyAllClose(result.reshape(mat.dst_shape, order='F'),
+                                 np.array(dstfield.data))
+
+        rh.destroy()
+
+    @pytest.mark.skipif(not constants._ESMF_USE_INMEM_FACTORS, reason="compiler does not support in-memory weights")
+    def test_field_regrid_save_weights(self):
+        mgr = Manager()
+        srcgrid = grid_create_from_bounds([0, 4], [0, 4], 24, 20)
+        dstgrid = grid_create_from_bounds([0, 4], [0, 4], 15, 18)
+        srcfield = initialize_field_grid(Field(srcgrid))
+        dstfield = Field(dstgrid)
+
+        rh = Regrid(srcfield, dstfield, regrid_method=RegridMethod.BILINEAR,
+                    unmapped_action=UnmappedAction.IGNORE, factors=True)
+        dstfield = rh(srcfield, dstfield)
+        expected = np.array(dstfield.data)
+
+        formats = ["raw"]
+        if pet_count() == 1:
+            formats.append("npz")
+        for format in formats:
+            path = os.path.join(os.getcwd(), 'esmpy_test_weights.' + format)
+            rh.save_weights(path, format=format)
+            mgr.barrier()
+
+            dstfield.data[...] = 0
+            rh2 = Regrid.from_weights(path, srcfield, dstfield)
+            self.assertEqual(rh2.regrid_method, RegridMethod.BILINEAR)
+            self.assertEqual(rh2.src_shape, (24, 20))
+            self.assertEqual(rh2.dst_shape, (15, 18))
+            dstfield = rh2(srcfield, dstfield)
+            self.assertNumpyAllClose(np.array(dstfield.data), expected)
+
+            # the weights do not match the Fields the other way around
+            with self.assertRaises(ValueError):
+                Regrid.from_weights(path, dstfield, srcfield)
+
+            rh2.destroy()
+            mgr.barrier()
+            if local_pet() == 0:
+                os.remove(path)
+
+        with self.assertRaises(ValueError):
+            rh.save_weights('esmpy_test_weights.nc', format="netcdf")
+
+        rh.destroy()
+
     @pytest.mark.skipif(_ESMF_PIO==False, reason="PIO required in ESMF build")
     @pytest.mark.skipif(_ESMF_NETCDF==False, reason="NetCDF required in ESMF build")
     def test_field_regrid_file1(self):
@@ -557,6 +847,55 @@ class TestRegrid(TestBase):
             if os.path.isfile(path):
                 os.remove(path)
 
+    @pytest.mark.skipif(_ESMF_PIO==False, reason="PIO required in ESMF build")
+    @pytest.mark.skipif(_ESMF_NETCDF==False, reason="NetCDF required in ESMF build")
+    def test_field_regrid_file_lazy(self):
+        mgr = Manager()
+        filename = 'esmpy_test_field_from_file_lazy.nc'
+        path = os.path.join(os.getcwd(), filename)
+        if local_pet() == 0:
+            if os.path.isfile(path):
+                os.remove(path)
+        mgr.barrier()
+
+        srcgrid = grid_create_from_bounds([0, 4], [0, 4], 24, 20)
+        dstgrid = grid_create_from_bounds([0, 4], [0, 4], 15, 18)
+        srcfield = initialize_field_grid(Field(srcgrid))
+        dstfield = Field(dstgrid)
+
+        _ = Regrid(srcfield, dstfield, filename=filename,
+                   regrid_method=RegridMethod.BILINEAR,
+                   unmapped_action=UnmappedAction.IGNORE)
+        mgr.barrier()
+
+        # the classic formats are memory mapped, the others need netCDF4
+        with open(path, 'rb') as f:
+            if f.read(4) in (b'CDF\x01', b'CDF\x02'):
+                pytest.importorskip("scipy")
+            else:
+                pytest.importorskip("netCDF4")
+
+        dstfield.data[...] = 0
+        rh = RegridFromFile(srcfield, dstfield, filename=filename)
+        dstfield = rh(srcfield, dstfield)
+        expected = np.array(dstfield.data)
+
+        dstfield.data[...] = 0
+        rh_lazy = RegridFromFile(srcfield, dstfield, filename=filename, lazy=True)
+        dstfield = rh_lazy(srcfield, dstfield)
+        self.assertNumpyAllClose(np.array(dstfield.data), expected)
+
+        with self.assertRaises(ValueError):
+            RegridFromFile(srcfield, dstfield, rh_filename=filename, lazy=True)
+
+        rh.destroy()
+        rh_lazy.destroy()
+        mgr.barrier()
+
+        if local_pet() == 0:
+            if os.path.isfile(path):
+                os.remove(path)
+
     @pytest.mark.skipif(pet_count() not in {1, 4}, reason="test requires 1 or 4 cores")
     def test_field_regrid_gridmesh(self):
         mesh = None
@@ -900,6 +1239,42 @@ class TestRegrid(TestBase):
         self.assertAlmostEqual(meanrel, 0.0024803189848013785)
         self.assertAlmostEqual(csrvrel, 0.0)
 
+    def test_grid_grid_regrid_csrv_dynamic_mask(self):
+        srcgrid = grid_create_from_bounds([0, 21], [0, 21], 21, 21, corners=True)
+        dstgrid = grid_create_from_bounds([0.5, 19.5], [0.5, 19.5], 19, 19, corners=True)
+
+        srcfield = initialize_field_grid(Field(srcgrid))
+        dstfield = Field(dstgrid)
+        exactfield = Field(dstgrid)
+
+        # an island in the middle of the source grid
+        x = srcgrid.get_coords(0)
+        y = srcgrid.get_coords(1)
+        island = (x > 5) & (x < 12) & (y > 8) & (y < 15)
+
+        # the weights are stored once, without the mask
+        rh = Regrid(srcfield, dstfield, regrid_method=RegridMethod.CONSERVE,
+                    unmapped_action=UnmappedAction.IGNORE)
+
+        mask = srcgrid.add_item(GridItem.MASK)
+        mask[...] = np.where(island, 0, 1)
+
+        for norm_type, renormalize in [(NormType.FRACAREA, True),
+                                       (NormType.DSTAREA, False)]:
+            fresh = Regrid(srcfield, exactfield, src_mask_values=[0],
+                           regrid_method=RegridMethod.CONSERVE,
+                           norm_type=norm_type,
+                           unmapped_action=UnmappedAction.IGNORE)
+            fresh(srcfield, exactfield)
+            rh(srcfield, dstfield, src_mask=island, renormalize=renormalize)
+            self.assertNumpyAllClose(dstfield.data, exactfield.data)
+            fresh.destroy()
+
+        with self.assertRaises(ValueError):
+            rh(srcfield, dstfield, src_mask=np.zeros((3, 3), dtype=bool))
+
+        rh.destroy()
+
     def test_grid_grid_regrid_csrv_2nd_mask(self):
         # RO: This test creates the same Grid on every processor, it could be improved
 
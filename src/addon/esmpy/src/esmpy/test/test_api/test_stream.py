@@ -0,0 +1,102 @@
+"""
+stream unit test file
+"""
+
+import pytest
+
+import os
+
+from esmpy import *
+from esmpy.test.base import TestBase
+from esmpy.util.grid_utilities import *
+from esmpy.util.mesh_utilities import *
+
+
+class TestStream(TestBase):
+
+    def test_stream_regrid(self):
+        netCDF4 = pytest.importorskip("netCDF4")
+
+        mgr = Manager()
+        filename = 'esmpy_test_stream_regrid.nc'
+        path = os.path.join(os.getcwd(), filename)
+
+        nx, ny, nlev, ntime = 24, 20, 2, 3
+        values = np.arange(ntime * nlev * ny * nx, dtype=np.float64)
+        values = np.sin(values).reshape(ntime, nlev, ny, nx)
+        if local_pet() == 0:
+            with netCDF4.Dataset(path, 'w') as ds:
+                ds.createDimension('time', ntime)
+                ds.createDimension('lev', nlev)
+                ds.createDimension('y', ny)
+                ds.createDimension('x', nx)
+                var = ds.createVariable('tas', 'f8', ('time', 'lev', 'y', 'x'))
+                var[:] = values
+        mgr.barrier()
+
+        srcgrid = grid_create_from_bounds([0, 4], [0, 4], nx, ny)
+        dstgrid = grid_create_from_bounds([0, 4], [0, 4], 15, 18)
+        srcfield = Field(srcgrid, ndbounds=[nlev])
+        dstfield = Field(dstgrid, ndbounds=[nlev])
+        rh = Regrid(srcfield, dstfield, regrid_method=RegridMethod.BILINEAR,
+                    unmapped_action=UnmappedAction.IGNORE)
+
+        # regrid each time slice by hand
+        lb, ub = srcfield.lower_bounds, srcfield.upper_bounds
+        expected = []
+        for t in range(ntime):
+            srcfield.data[...] = values[t, :, lb[1]:ub[1], lb[0]:ub[0]].T
+            dstfield = rh(srcfield, dstfield)
+            expected.append(np.array(dstfield.data))
+
+        written = []
+        def writer(timeslice, field):
+            written.append(timeslice)
+
+        for prefetch in (True, False):
+            del written[:]
+            srcfield.data[...] = 0
+            timeslices = []
+            for timeslice, field in stream_regrid(rh, srcfield, dstfield,
+                                                  filename, 'tas',
+                                                  dst_writer=writer,
+                                                  prefetch=prefetch):
+                self.assertNumpyAllClose(np.array(field.data),
+                                         expected[timeslice - 1])
+                timeslices.append(timeslice)
+            self.assertEqual(timeslices, [1, 2, 3])
+            self.assertEqual(written, [1, 2, 3])
+
+        # a subset of the time slices, in any order
+        timeslices = [t for t, _ in stream_regrid(rh, srcfield, dstfield,
+                                                  filename, 'tas',
+                                                  timeslices=[3, 1])]
+        self.assertEqual(timeslices, [3, 1])
+        self.assertNumpyAllClose(np.array(dstfield.data), expected[0])
+
+        # the tiles of a cubed sphere have no dimension in the variable, the
+        # error is raised before the generator is advanced
+        with self.assertRaises(ValueError):
+            stream_regrid(rh, Field(Grid(tilesize=12, name="cubed_sphere")),
+                          dstfield, filename, 'tas')
+
+        rh.destroy()
+        mgr.barrier()
+
+        if local_pet() == 0:
+            if os.path.isfile(path):
+                os.remove(path)
+
+    @pytest.mark.skipif(pet_count() not in {1, 4}, reason="test requires 1 or 4 cores")
+    def test_stream_regrid_mesh_ungridded(self):
+        if pet_count() == 4:
+            mesh, _, _, _, _ = mesh_create_5_parallel()
+        else:
+            mesh, _, _, _, _, _ = mesh_create_5()
+
+        # a Mesh is read with Field.read, which has no ungridded dimensions,
+        # the error is raised before the generator is advanced
+        srcfield = Field(mesh, meshloc=MeshLoc.ELEMENT, ndbounds=[2])
+        with self.assertRaises(ValueError):
+            stream_regrid(None, srcfield, None, 'esmpy_test_stream_regrid.nc',
+                          'tas', timeslices=[1])
@@ -0,0 +1,38 @@
+"""
+trace unit test file
+"""
+
+import pytest
+
+from esmpy import *
+from esmpy.test.base import TestBase
+from esmpy.util.grid_utilities import *
+
+
+class TestTrace(TestBase):
+
+    def test_trace_region(self):
+        # regions are recorded if the environment enabled the ESMF trace,
+        # and do nothing otherwise
+        with trace.region("outer") as outer:
+            self.assertEqual(outer.name, "outer")
+            with trace.region("inner"):
+                grid = grid_create_from_bounds([0, 4], [0, 4], 8, 8)
+
+        @trace.region("decorated")
+        def decorated(value):
+            return value + 1
+
+        self.assertEqual(decorated(1), 2)
+        self.assertEqual(decorated.__name__, "decorated")
+
+    def test_trace_region_exception(self):
+        region = trace.region("raises")
+        with self.assertRaises(ValueError):
+            with region:
+                raise ValueError
+
+        # the region was exited, so it can be entered again
+        with region:
+            pass
+        self.assertEqual(region._depth, 0)
@@ -42,3 +42,69 @@ class TestVM(TestBase):
             assert(np.all(recv == 0))
 
         self.mg.barrier()
+
+    def test_vm_collectives(self):
+        pet = self.mg.local_pet
+        count = self.mg.pet_count
+
+        for dtype in [np.int32, np.int64, np.float32, np.float64]:
+            send = np.array([[1, pet], [pet, -pet]], dtype=dtype)
+
+            recv = self.mg.allreduce(send, op=Reduce.MAX)
+            assert(recv.dtype == dtype)
+            assert(np.all(recv == [[1, count - 1], [count - 1, 0]]))
+            recv = self.mg.allreduce(send)
+            assert(recv[0, 0] == count)
+
+            recv = self.mg.allgather(send)
+            assert(recv.shape == (count, 2, 2))
+            assert(np.all(recv[:, 0, 1] == np.arange(count)))
+
+            recv = self.mg.gather(send, root=count - 1)
+            if pet == count - 1:
+                assert(np.all(recv[:, 1, 0] == np.arange(count)))
+            else:
+                assert(recv is None)
+
+            # on PET 0 only
+            send = np.arange(count * 3, dtype=dtype).reshape(count, 3)
+            recv = self.mg.scatter(send if pet == 0 else None)
+            assert(recv.dtype == dtype)
+            assert(np.all(recv == [3 * pet, 3 * pet + 1, 3 * pet + 2]))
+
+        # PET i contributes i values equal to i
+        send = np.full(pet, pet, dtype=np.int64)
+        recv, counts = self.mg.allgatherv(send)
+        assert(np.all(counts == np.arange(count)))
+        assert(np.all(recv == np.repeat(np.arange(count), np.arange(count))))
+
+        ret = self.mg.gatherv(send)
+        if pet == 0:
+            assert(np.all(ret[0] == recv))
+        else:
+            assert(ret is None)
+
+        recv = self.mg.scatterv(np.repeat(np.arange(count), np.arange(count)),
+                                counts=np.arange(count))
+        assert(np.all(recv == send))
+
+        # invalid data on the root PET raise on every PET
+        with self.assertRaises(ValueError):
+            self.mg.scatter(np.zeros((count + 1, 2)) if pet == 0 else None)
+        with self.assertRaises(TypeError):
+            self.mg.scatter(np.zeros(count, dtype=np.int16) if pet == 0 else None)
+        with self.assertRaises(ValueError):
+            self.mg.scatterv(np.zeros(3), counts=[4] + [0] * (count - 1))
+
+        # PET i sends j values to PET j, and receives i values from each PET
+        send = np.repeat(np.arange(count), np.arange(count)).astype(np.float32)
+        recv, counts = self.mg.alltoallv(send, np.arange(count))
+        assert(np.all(counts == pet))
+        assert(np.all(recv == pet))
+
+        with self.assertRaises(ValueError):
+            self.mg.alltoallv(send, [send.size + 1] + [0] * (count - 1))
+        with self.assertRaises(TypeError):
+            self.mg.allreduce(np.ones(2, dtype=np.int16))
+
+        assert(self.mg.barrier() >= 0)
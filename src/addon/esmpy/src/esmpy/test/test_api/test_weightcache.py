@@ -0,0 +1,177 @@
+"""
+weight cache unit test file
+"""
+
+import pytest
+
+import os
+import shutil
+import tempfile
+
+from esmpy import *
+from esmpy.test.base import TestBase
+from esmpy.util.grid_utilities import *
+from esmpy.interface.cbindings import ESMP_FieldRegridRelease
+
+
+class TestWeightCache(TestBase):
+
+    def setUp(self):
+        # all PETs must use the same cache directory
+        self.directory = os.path.join(tempfile.gettempdir(), '_esmpy_test_weightcache_')
+        if local_pet() == 0:
+            shutil.rmtree(self.directory, ignore_errors=True)
+        self.mg.barrier()
+
+    def tearDown(self):
+        self.mg.barrier()
+        if local_pet() == 0:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+    def create_fields(self, nx=24, ny=20):
+        srcgrid = grid_create_from_bounds([0, 4], [0, 4], nx, ny)
+        dstgrid = grid_create_from_bounds([0, 4], [0, 4], 15, 18)
+        srcfield = initialize_field_grid(Field(srcgrid))
+        dstfield = Field(dstgrid)
+
+        return srcfield, dstfield
+
+    def test_weightcache_key(self):
+        cache = WeightCache(self.directory)
+        srcfield, dstfield = self.create_fields()
+
+        key = cache.key(srcfield, dstfield, regrid_method=RegridMethod.BILINEAR)
+        self.assertEqual(key, cache.key(srcfield, dstfield,
+                                        regrid_method=RegridMethod.BILINEAR))
+        self.assertNotEqual(key, cache.key(srcfield, dstfield,
+                                           regrid_method=RegridMethod.PATCH))
+
+        # the fingerprints are reused by the calls sharing a memo
+        memo = {}
+        self.assertEqual(key, cache.key(srcfield, dstfield, memo=memo,
+                                        regrid_method=RegridMethod.BILINEAR))
+        self.assertEqual(len(memo), 2)
+
+        srcfield.grid.get_coords(0)[...] += 0.01
+        self.assertNotEqual(key, cache.key(srcfield, dstfield,
+                                           regrid_method=RegridMethod.BILINEAR))
+        self.assertEqual(key, cache.key(srcfield, dstfield, memo=memo,
+                                        regrid_method=RegridMethod.BILINEAR))
+
+    def test_weightcache_regrid(self):
+        cache = WeightCache(self.directory)
+        srcfield, dstfield = self.create_fields()
+
+        rh = Regrid(srcfield, dstfield, regrid_method=RegridMethod.BILINEAR,
+                    unmapped_action=UnmappedAction.IGNORE, cache=cache)
+        dstfield = rh(srcfield, dstfield)
+        expected = np.array(dstfield.data)
+
+        key = cache.key(srcfield, dstfield,
+                        src_mask_values=None, dst_mask_values=None,
+                        regrid_method=RegridMethod.BILINEAR, pole_method=None,
+                        regrid_pole_npoints=None, line_type=None,
+                        norm_type=None, extrap_method=None,
+                        extrap_num_src_pnts=None, extrap_dist_exponent=None,
+                        extrap_num_levels=None,
+                        unmapped_action=UnmappedAction.IGNORE,
+                        ignore_degenerate=None)
+        self.assertTrue(os.path.exists(cache.path(key)))
+
+        # the second construction reads the routehandle from the cache
+        dstfield.data[...] = 0
+        rh2 = Regrid(srcfield, dstfield, regrid_method=RegridMethod.BILINEAR,
+                     unmapped_action=UnmappedAction.IGNORE, cache=self.directory)
+        dstfield = rh2(srcfield, dstfield)
+        self.assertNumpyAll(np.array(dstfield.data), expected)
+
+        rh.destroy()
+        rh2.destroy()
+
+    def test_weightcache_batch(self):
+        srcfield, dstfield = self.create_fields()
+        dstfield2 = Field(grid_create_from_bounds([0, 4], [0, 4], 9, 11))
+
+        batch = RegridStoreBatch(srcfield, [dstfield, dstfield2],
+                                 regrid_method=RegridMethod.BILINEAR,
+                                 unmapped_action=UnmappedAction.IGNORE,
+                                 cache=self.directory)
+        expected = [np.array(regrid(srcfield, field).data)
+                    for regrid, field in zip(batch, batch.dstfields)]
+
+        # both operators are read from the cache by the second batch
+        cache = WeightCache(self.directory)
+        for field in batch.dstfields:
+            key = cache.key(srcfield, field,
+                            src_mask_values=None, dst_mask_values=None,
+                            regrid_method=RegridMethod.BILINEAR, pole_method=None,
+                            regrid_pole_npoints=None, line_type=None,
+                            norm_type=None, extrap_method=None,
+                            extrap_num_src_pnts=None, extrap_dist_exponent=None,
+                            extrap_num_levels=None,
+                            unmapped_action=UnmappedAction.IGNORE,
+                            ignore_degenerate=None)
+            self.assertTrue(os.path.exists(cache.path(key)))
+
+        # the batch goes through the methods of the cache it is given
+        class CountingCache(WeightCache):
+            loads = 0
+            def load(self, key):
+                CountingCache.loads += 1
+                return WeightCache.load(self, key)
+
+        batch2 = RegridStoreBatch(srcfield, [dstfield, dstfield2],
+                                  regrid_method=RegridMethod.BILINEAR,
+                                  unmapped_action=UnmappedAction.IGNORE,
+                                  cache=CountingCache(self.directory))
+        self.assertEqual(CountingCache.loads, 2)
+        for regrid, field, values in zip(batch2, batch2.dstfields, expected):
+            field.data[...] = 0
+            self.assertNumpyAll(np.array(regrid(srcfield, field).data), values)
+
+        batch.destroy()
+        batch2.destroy()
+
+    def test_weightcache_load_removed(self):
+        cache = WeightCache(self.directory)
+        srcfield, dstfield = self.create_fields()
+        rh = Regrid(srcfield, dstfield, regrid_method=RegridMethod.BILINEAR,
+                    unmapped_action=UnmappedAction.IGNORE)
+        cache.store("entry", rh.routehandle)
+        rh.destroy()
+
+        # another process evicts the entry right after it is found
+        class EvictedCache(WeightCache):
+            @staticmethod
+            def _link_(path, private):
+                WeightCache._link_(path, private)
+                os.remove(path)
+
+        evicted = EvictedCache(self.directory)
+        routehandle = evicted.load("entry")
+        self.assertIsNotNone(routehandle)
+        ESMP_FieldRegridRelease(routehandle)
+
+        # the private link is removed and the entry is now a miss
+        if local_pet() == 0:
+            self.assertEqual(os.listdir(self.directory), [])
+        self.assertIsNone(cache.load("entry"))
+
+    def test_weightcache_eviction(self):
+        cache = WeightCache(self.directory, max_size=1)
+
+        for nx in [24, 25]:
+            srcfield, dstfield = self.create_fields(nx=nx)
+            rh = Regrid(srcfield, dstfield, regrid_method=RegridMethod.BILINEAR,
+                        unmapped_action=UnmappedAction.IGNORE, cache=cache)
+            rh.destroy()
+
+        # only the most recent entry is kept
+        if local_pet() == 0:
+            entries = [name for name in os.listdir(self.directory)
+                       if name.endswith('.rh')]
+            self.assertEqual(len(entries), 1)
+
+        cache.clear()
+        if local_pet() == 0:
+            self.assertEqual(os.listdir(self.directory), [])
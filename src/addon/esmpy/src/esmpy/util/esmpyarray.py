@@ -11,7 +11,27 @@ import numpy.ma as ma
 import ctypes as ct
 import sys
 
-def ndarray_from_esmf(data, dtype, shape):
+class _ESMFMemory(object):
+    '''
+    Exposes a numpy array aliasing ESMF memory together with the owner of the
+    allocation, so that the array and all views of it keep the owner alive.
+    '''
+    def __init__(self, array, owner):
+        self.__array_interface__ = array.__array_interface__
+        self.array = array
+        self.owner = owner
+
+def ndarray_owned(array, owner):
+    '''
+    :param array: numpy array aliasing ESMF memory
+    :type array: numpy.ndarray
+    :param owner: object which must be kept alive as long as the memory is
+        in use, see :class:`esmpy.util.finalizers.Token`
+    :return: numpy array aliasing the same memory and holding ``owner``
+    '''
+    return np.asarray(_ESMFMemory(array, owner))
+
+def ndarray_from_esmf(data, dtype, shape, owner=None):
     '''
     :param data: buffer of fortran allocated ESMF array
     :type data: ctypes void_p
@@ -19,6 +39,8 @@ def ndarray_from_esmf(data, dtype, shape):
     :type dtype: esmpy.TypeKind
     :param shape: N-D Python shape corresponding to 1D ESMF allocation
     :type shape: list or tuple
+    :param owner: object which must be kept alive as long as the array is
+        in use, see :func:`ndarray_owned`
     :return: numpy array representing the data with dtype and shape
     '''
     # find the size of the local coordinates
@@ -37,6 +59,8 @@ def ndarray_from_esmf(data, dtype, shape):
 
     esmfarray = np.ndarray(tuple(shape[:]), constants._ESMF2PythonType[dtype],
                            buffer, order="F")
+    if owner is not None:
+        esmfarray = ndarray_owned(esmfarray, owner)
 
     return esmfarray
 
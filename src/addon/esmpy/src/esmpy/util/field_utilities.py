@@ -5,8 +5,7 @@ Utilities for Fields
 import numpy as np
 import esmpy
 
-import esmpy.util.helpers as helpers
-import esmpy.api.constants as constants
+import esmpy.api.diagnostics as diagnostics
 
 def compare_fields(field1, field2, itrp_mean_tol, itrp_max_tol, csrv_tol, 
                    dstfracfield=None, mass1=None, mass2=None,
@@ -29,99 +28,53 @@ def compare_fields(field1, field2, itrp_mean_tol, itrp_max_tol, csrv_tol,
     :param mask_values: Any masked values to skip when comparing the Fields.
     :return:
     """
-    import numpy.ma as ma
-
-    parallel = False
-    if esmpy.pet_count() > 1:
-        parallel = True
-
-    correct = False
     # verify that the fields are the same size
     assert field1.data.shape == field2.data.shape, 'compare_fields: Fields must be the same size!'
-    
-    # deal with default values for fracfield
-    if isinstance(dstfracfield, type(None)):
-        dstfracfield = ma.ones(field1.data.shape)
-
-    # compute pointwise error measures
-    totalErr = 0.0
-    max_error = 0.0
-    min_error = 1000000.0
-    num_nodes = 0
-
-    # allow fields of all dimensions
-    field1_flat = np.ravel(field1.data)
-    field2_flat = np.ravel(field2.data)
-    dstfracfield_flat = np.ravel(dstfracfield.data)
-    # setup mask, no Mask on a Mesh (yet) so need to look at the type first
-    if (isinstance(field2.grid, esmpy.Grid)) and \
-        (not isinstance(field2.grid.mask[field2.staggerloc], type(None))):
-        if not isinstance(field2.grid.mask[field2.staggerloc], type(None)):
-            field2mask_flat = [True if x in mask_values else False for x in field2.grid.mask[field2.staggerloc].flatten().tolist()]
-    else:
-        field2mask_flat = np.ravel(np.zeros_like(field2.data))
-
-    for i in range(field2_flat.size):     
-        if ((not field2mask_flat[i]) and 
-            (field1_flat[i] != uninitval) and 
-            (dstfracfield_flat[i] >= 0.999)):
-            if (field2_flat.data[i] != 0.0):
-                err = abs(field1_flat[i]/dstfracfield_flat[i] - \
-                            field2_flat[i])/abs(field2_flat[i])
-            else:
-                err = abs(field1_flat[i]/dstfracfield_flat[i] - \
-                            field2_flat[i])
-            num_nodes += 1
-            totalErr += err
-            if (err > max_error):
-                max_error = err
-            if (err < min_error):
-                min_error = err
 
+    correct = False
 
-    # gather error on processor 0 or set global variables in serial case
+    # compute pointwise error measures on whole arrays, the mask of the
+    # Grid of field2 is applied if there is one
+    totalErr, num_nodes, max_error, min_error = diagnostics._local_error_(
+        field1, field2, frac=dstfracfield, mask_values=mask_values,
+        uninitval=uninitval)
+    max_error = max(max_error, 0.0)
+    min_error = min(min_error, 1000000.0)
+
+    # reduce all of the statistics across PETs in a single collective
+    sums = [totalErr, num_nodes]
+    domass = not isinstance(mass1, type(None)) and not isinstance(mass2, type(None))
+    if domass:
+        sums += [mass1, mass2]
+    sums, maxima = diagnostics._reduce_stats_(sums, [max_error, -min_error])
+
+    total_error_global = sums[0]
+    num_nodes_global = sums[1]
+    max_error_global = maxima[0]
+    min_error_global = -maxima[1]
     mass1_global = 0.
     mass2_global = 0.
     csrv_error_global = 0
-    if parallel:
-        total_error_global = helpers.reduce_val(totalErr)
-        num_nodes_global = helpers.reduce_val(num_nodes)
-        max_error_global = helpers.reduce_val(max_error, op=constants.Reduce.MAX)
-        min_error_global = helpers.reduce_val(min_error, op=constants.Reduce.MIN)
-        if not isinstance(mass1, type(None)) and not isinstance(mass2, type(None)):
-            mass1_global = helpers.reduce_val(mass1)
-            mass2_global = helpers.reduce_val(mass2)
-
+    if domass:
+        mass1_global = sums[2]
+        mass2_global = sums[3]
+
+    # compute relative error measures and compare against tolerance values,
+    # the statistics are global on every PET
+    if mass1_global == 0.:
+        csrv_error_global = abs(mass2_global - mass1_global)
     else:
-        total_error_global = totalErr
-        num_nodes_global = num_nodes
-        max_error_global = max_error
-        min_error_global = min_error
-        if not isinstance(mass1, type(None)) and not isinstance(mass2, type(None)):
-            mass1_global = mass1
-            mass2_global = mass2
-
-    # compute relative error measures and compare against tolerance values
-    itrp_mean = False
-    itrp_max = False
-    csrv = False
-    if esmpy.local_pet() == 0:
-        if mass1_global == 0.:
-            csrv_error_global = abs(mass2_global - mass1_global)
-        else:
-            csrv_error_global = abs(mass2_global - mass1_global)/abs(mass1_global)
-        # compute mean relative error
-        if num_nodes_global != 0:
-            total_error_global = total_error_global/num_nodes_global
+        csrv_error_global = abs(mass2_global - mass1_global)/abs(mass1_global)
+    # compute mean relative error
+    if num_nodes_global != 0:
+        total_error_global = total_error_global/num_nodes_global
 
-        # determine if interpolation and conservation are up to spec
-        if (total_error_global < itrp_mean_tol):
-            itrp_mean = True
-        if (max_error_global < itrp_max_tol):
-            itrp_max = True
-        if (csrv_error_global < csrv_tol):
-            csrv = True
+    # determine if interpolation and conservation are up to spec
+    itrp_mean = total_error_global < itrp_mean_tol
+    itrp_max = max_error_global < itrp_max_tol
+    csrv = csrv_error_global < csrv_tol
 
+    if esmpy.local_pet() == 0:
         # print out diagnostic information
         print ("  Mean relative error = "+str(total_error_global))
         print ("  Max  relative error = "+str(max_error_global))
@@ -130,14 +83,6 @@ def compare_fields(field1, field2, itrp_mean_tol, itrp_max_tol, csrv_tol,
         #print ("  srcmass     = "+str(mass1_global))
         #print ("  dstmass     = "+str(mass2_global))
 
-    # broadcast in parallel case
-    if parallel:
-        itrp_mean = helpers.broadcast_val(itrp_mean)
-        itrp_max = helpers.broadcast_val(itrp_max)
-        csrv = helpers.broadcast_val(csrv)
-        total_error_global = helpers.broadcast_val(total_error_global)
-        csrv_error_global = helpers.broadcast_val(csrv_error_global)
-
     # print pass or fail
     if (itrp_mean and itrp_max  and csrv):
         print ("PET{0} - PASS".format(esmpy.local_pet()))
@@ -0,0 +1,86 @@
+# $Id$
+
+"""
+Registry of the finalizers which release the ESMF allocations of ESMPy objects
+"""
+
+import itertools
+import weakref
+
+# registration number -> live weakref.finalize, numbers increase with the
+# creation order so dependent objects (e.g. a Field on a Grid) are newer
+_registry = {}
+_counter = itertools.count()
+
+# set once ESMF is finalized, after which there is nothing left to release
+_closed = False
+
+# the active esmpy.arena scopes, innermost last, each a list of weak
+# references to the objects created in it
+_arenas = []
+
+class Token(object):
+    '''The lifetime of an ESMF allocation. An ESMPy object creates a token
+    and registers the release of its allocation on it. The token is shared
+    by the shallow copies of the object and the NumPy arrays aliasing the
+    allocation, so the allocation is released once none of them is left.'''
+
+    __slots__ = ('__weakref__',)
+
+class handle(object):
+    '''A stand-in holding only the ESMF ``struct`` of an ESMPy object, to pass
+    to the ``ESMP_*Destroy`` bindings from a finalizer without keeping the
+    object itself alive. It also holds the tokens of the allocations the
+    object depends on (e.g. the Grid of a Field), which are then released
+    after it.'''
+
+    __slots__ = ('struct', 'depends')
+
+    def __init__(self, struct, *depends):
+        self.struct = struct
+        self.depends = depends
+
+def _release_(key, func, args):
+    del _registry[key]
+    if not _closed:
+        func(*args)
+
+def register(token, func, *args, owner=None):
+    '''Call ``func(*args)`` when ``token`` is garbage collected, when the
+    returned finalizer is called, or when ESMF is finalized, whichever comes
+    first. The finalizer holds ``args`` but only a weak reference to
+    ``token``, so ``args`` must not refer to it or to the object owning it,
+    e.g. through a bound method. If an :class:`~esmpy.api.arena.arena` is
+    active, ``owner`` is destroyed when it exits.'''
+
+    if owner is not None and _arenas:
+        _arenas[-1].append(weakref.ref(owner))
+
+    key = next(_counter)
+    finalizer = weakref.finalize(token, _release_, key, func, args)
+    # release_all runs them before ESMF is finalized, not at interpreter exit
+    finalizer.atexit = False
+    _registry[key] = finalizer
+
+    return finalizer
+
+def release_all():
+    '''Call all live finalizers, newest first. This is called by the
+    :class:`~esmpy.api.esmpymanager.Manager` right before ESMF is finalized;
+    finalizers of objects collected later do nothing.'''
+
+    global _closed
+    for key in sorted(_registry, reverse=True):
+        finalizer = _registry.get(key)
+        if finalizer is not None:
+            try:
+                finalizer()
+            except ValueError:
+                # one failed release must not keep ESMF from being finalized
+                pass
+    _closed = True
+
+def live():
+    '''Return the number of ESMPy objects whose ESMF allocations are held.'''
+
+    return len(_registry)
@@ -14,6 +14,8 @@ try:
 except:
     raise ImportError('The ESMF library cannot be found!')
 
+import esmpy.api.diagnostics as diagnostics
+
 def grid_create_from_bounds(xdom, ydom, nx, ny, corners=False, domask=False, doarea=False, ctk=esmpy.TypeKind.R8):
     """
     Create a 2 dimensional Grid using the bounds of the domain defined in the `xdom` and `ydom` lists. The parameters
@@ -499,15 +501,8 @@ def compute_mass_grid(valuefield, dofrac=False, fracfield=None,
     POSTCONDITIONS: The mass of the data field is computed.\n
     RETURN VALUES: float :: mass \n
     """
-    mass = 0.0
-    areafield = esmpy.Field(valuefield.grid, name='areafield')
-    areafield.get_area()
-
-    ind = np.where(valuefield.data != uninitval)
-
-    if dofrac:
-        mass = np.sum(areafield.data[ind] * valuefield.data[ind] * fracfield.data[ind])
-    else:
-        mass = np.sum(areafield.data[ind] * valuefield.data[ind])
-
-    return mass
+    # the cell areas are computed once for each discretization
+    if not dofrac:
+        fracfield = None
+    return diagnostics._local_mass_(valuefield, frac=fracfield,
+                                    uninitval=uninitval)
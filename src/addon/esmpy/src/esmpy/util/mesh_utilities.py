@@ -14,6 +14,8 @@ try:
 except:
     raise ImportError('The ESMF library cannot be found!')
 
+import esmpy.api.diagnostics as diagnostics
+
 
 
 
@@ -1412,16 +1414,8 @@ def compute_mass_mesh(valuefield, dofrac=False, fracfield=None,
     POSTCONDITIONS: The mass of the data field is computed.\n
     RETURN VALUES: float :: mass \n
     """
-    mass = 0.0
-    # mesh area field must be built on elements
-    areafield = esmpy.Field(valuefield.grid, name='areafield',
-                           meshloc=esmpy.MeshLoc.ELEMENT)
-    areafield.get_area()
-
-    ind = np.where(valuefield.data != uninitval)
-    if dofrac:
-        mass = np.sum(areafield.data[ind[0]] * valuefield.data[ind[0]] * fracfield.data[ind[0]])
-    else:
-        mass = np.sum(areafield.data[ind[0]] * valuefield.data[ind[0]])
-
-    return mass
+    # the cell areas are computed once for each discretization
+    if not dofrac:
+        fracfield = None
+    return diagnostics._local_mass_(valuefield, frac=fracfield,
+                                    uninitval=uninitval)
@@ -0,0 +1,83 @@
+# $Id$
+
+"""
+Timing instrumentation of the ESMF C API bindings
+"""
+
+import functools
+import time
+
+import numpy as np
+
+# names of all instrumented wrappers, in definition order, which is the same
+# on every PET
+_names = []
+
+# wrapper name -> [call count, wall time in seconds, bytes of array arguments]
+_records = {}
+
+# number of active profiling requests, recording is off when zero
+_active = 0
+
+def _nbytes_(args, kwargs):
+    nbytes = 0
+    for arg in args:
+        if isinstance(arg, np.ndarray):
+            nbytes += arg.nbytes
+    for arg in kwargs.values():
+        if isinstance(arg, np.ndarray):
+            nbytes += arg.nbytes
+    return nbytes
+
+def profiled(func):
+    '''This is a decorator that records the call count, wall time and bytes
+    of NumPy array arguments of a binding while profiling is enabled. It costs
+    a single check when profiling is disabled.'''
+
+    name = func.__name__
+    _names.append(name)
+
+    @functools.wraps(func)
+    def new_func(*args, **kwargs):
+        if not _active:
+            return func(*args, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            record = _records.get(name)
+            if record is None:
+                record = _records[name] = [0, 0., 0]
+            record[0] += 1
+            record[1] += elapsed
+            record[2] += _nbytes_(args, kwargs)
+    return new_func
+
+def enable():
+    global _active
+    _active += 1
+
+def disable():
+    global _active
+    _active = max(_active - 1, 0)
+
+def enabled():
+    return _active > 0
+
+def snapshot():
+    """Return a copy of the records of the current PET."""
+    return {name: list(record) for name, record in _records.items()}
+
+def difference(after, before):
+    """Return the records accumulated between two snapshots."""
+    ret = {}
+    for name, record in after.items():
+        previous = before.get(name, [0, 0., 0])
+        if record[0] != previous[0]:
+            ret[name] = [r - p for r, p in zip(record, previous)]
+    return ret
+
+def reset():
+    _records.clear()
@@ -49,6 +49,81 @@ def get_none_or_slice(target, slc):
         ret = target[slc]
     return ret
 
+def get_none_or_list(target):
+    """
+    :param the array of a single DE:
+    :return: the per-DE list holding it
+    """
+    if isinstance(target, type(None)):
+        ret = None
+    else:
+        ret = [target]
+    return ret
+
+def get_ssslice(slc, stagger, rank):
+    """
+    Get stagger specific slice
+    :param slc: the slice to modify
+    :param stagger: slice that needs to be modifies according to the stagger location
+    :param rank: rank of the grid
+    :return: the slice of the coordinates at the stagger location
+    """
+
+    slc2 = None
+    if rank == 2:
+        assert(len(slc) == 2)
+        if stagger == esmpy.StaggerLoc.CENTER:
+            slc2 = slc
+        elif stagger == esmpy.StaggerLoc.EDGE1:
+            #slc[0] + 1
+            slc2 = (slice(slc[0].start, slc[0].stop + 1, slc[0].step), slc[1])
+        elif stagger == esmpy.StaggerLoc.EDGE2:
+            #slc[1] + 1
+            slc2 = (slc[0], slice(slc[1].start, slc[1].stop + 1, slc[1].step))
+        elif stagger == esmpy.StaggerLoc.CORNER:
+            #slc[0] + 1
+            #slc[1] + 1
+            slc2 = ([slice(slc[i].start, slc[i].stop + 1, slc[i].step) for i in range(len(slc))])
+        else:
+            raise ValueError("Stagger location is invalid")
+
+    elif rank == 3:
+        assert (len(slc) == 3)
+        if stagger == esmpy.StaggerLoc.CENTER_VCENTER:
+            slc2 = slc
+        elif stagger == esmpy.StaggerLoc.EDGE1_VCENTER:
+            #slc[0] + 1
+            slc2 = (slice(slc[0].start, slc[0].stop + 1, slc[0].step), slc[1], slc[2])
+        elif stagger == esmpy.StaggerLoc.EDGE2_VCENTER:
+            #slc[1] + 1
+            slc2 = (slc[0], slice(slc[1].start, slc[1].stop + 1, slc[1].step), slc[2])
+        elif stagger == esmpy.StaggerLoc.CORNER_VCENTER:
+            #slc[0] + 1
+            #slc[1] + 1
+            slc2 = (slice(slc[0].start, slc[0].stop + 1, slc[0].step), slice(slc[1].start, slc[1].stop + 1, slc[1].step), slc[2])
+        elif stagger == esmpy.StaggerLoc.CENTER_VFACE:
+            #slc[2] + 1
+            slc2 = (slc[0], slc[1], slice(slc[2].start, slc[2].stop + 1, slc[2].step))
+        elif stagger == esmpy.StaggerLoc.EDGE1_VFACE:
+            #slc[0] + 1
+            #slc[2] + 1
+            slc2 = (slice(slc[0].start, slc[0].stop + 1, slc[0].step), slc[1], slice(slc[2].start, slc[2].stop + 1, slc[2].step))
+        elif stagger == esmpy.StaggerLoc.EDGE2_VFACE:
+            #slc[1] + 1
+            #slc[2] + 1
+            slc2 = (slc[0], slice(slc[1].start, slc[1].stop + 1, slc[1].step), slice(slc[2].start, slc[2].stop + 1, slc[2].step))
+        elif stagger == esmpy.StaggerLoc.CORNER_VFACE:
+            #slc[0] + 1
+            #slc[1] + 1
+            #slc[2] + 1
+            slc2 = ([slice(slc[i].start, slc[i].stop + 1, slc[i].step) for i in range(len(slc))])
+        else:
+            raise ValueError("Stagger location is invalid")
+    else:
+        raise ValueError("Grid cannot have less than 2 or more than 3 dimensions")
+
+    return slc2
+
 def get_none_or_ssslice(target, slc, stagger, rank):
     """
     Get none or stagger specific slice
@@ -62,60 +137,7 @@ def get_none_or_ssslice(target, slc, stagger, rank):
     if isinstance(target, type(None)):
         ret = None
     else:
-        slc2 = None
-        if rank == 2:
-            assert(len(slc) == 2)
-            if stagger == esmpy.StaggerLoc.CENTER:
-                slc2 = slc
-            elif stagger == esmpy.StaggerLoc.EDGE1:
-                #slc[0] + 1
-                slc2 = (slice(slc[0].start, slc[0].stop + 1, slc[0].step), slc[1])
-            elif stagger == esmpy.StaggerLoc.EDGE2:
-                #slc[1] + 1
-                slc2 = (slc[0], slice(slc[1].start, slc[1].stop + 1, slc[1].step))
-            elif stagger == esmpy.StaggerLoc.CORNER:
-                #slc[0] + 1
-                #slc[1] + 1
-                slc2 = ([slice(slc[i].start, slc[i].stop + 1, slc[i].step) for i in range(len(slc))])
-            else:
-                raise ValueError("Stagger location is invalid")
-
-        elif rank == 3:
-            assert (len(slc) == 3)
-            if stagger == esmpy.StaggerLoc.CENTER_VCENTER:
-                slc2 = slc
-            elif stagger == esmpy.StaggerLoc.EDGE1_VCENTER:
-                #slc[0] + 1
-                slc2 = (slice(slc[0].start, slc[0].stop + 1, slc[0].step), slc[1], slc[2])
-            elif stagger == esmpy.StaggerLoc.EDGE2_VCENTER:
-                #slc[1] + 1
-                slc2 = (slc[0], slice(slc[1].start, slc[1].stop + 1, slc[1].step), slc[2])
-            elif stagger == esmpy.StaggerLoc.CORNER_VCENTER:
-                #slc[0] + 1
-                #slc[1] + 1
-                slc2 = (slice(slc[0].start, slc[0].stop + 1, slc[0].step), slice(slc[1].start, slc[1].stop + 1, slc[1].step), slc[2])
-            elif stagger == esmpy.StaggerLoc.CENTER_VFACE:
-                #slc[2] + 1
-                slc2 = (slc[0], slc[1], slice(slc[2].start, slc[2].stop + 1, slc[2].step))
-            elif stagger == esmpy.StaggerLoc.EDGE1_VFACE:
-                #slc[0] + 1
-                #slc[2] + 1
-                slc2 = (slice(slc[0].start, slc[0].stop + 1, slc[0].step), slc[1], slice(slc[2].start, slc[2].stop + 1, slc[2].step))
-            elif stagger == esmpy.StaggerLoc.EDGE2_VFACE:
-                #slc[1] + 1
-                #slc[2] + 1
-                slc2 = (slc[0], slice(slc[1].start, slc[1].stop + 1, slc[1].step), slice(slc[2].start, slc[2].stop + 1, slc[2].step))
-            elif stagger == esmpy.StaggerLoc.CORNER_VFACE:
-                #slc[0] + 1
-                #slc[1] + 1
-                #slc[2] + 1
-                slc2 = ([slice(slc[i].start, slc[i].stop + 1, slc[i].step) for i in range(len(slc))])
-            else:
-                raise ValueError("Stagger location is invalid")
-        else:
-            raise ValueError("Grid cannot have less than 2 or more than 3 dimensions")
-
-        ret = target[tuple(slc2)]
+        ret = target[tuple(get_ssslice(slc, stagger, rank))]
 
     return ret
 
@@ -144,3 +166,15 @@ def get_none_or_bound_list(target, ind):
         assert (len(temp) == 1)
         ret = int(temp[0])
     return ret
+
+def get_none_or_axes_bound(target, ind):
+    """
+    :param grid 1D coord variables:
+    :param stagger:
+    :return: the upper bounds given by the sizes of the 1D coordinates
+    """
+    if isinstance(target[ind][0], type(None)):
+        ret = None
+    else:
+        ret = np.array([coord.shape[0] for coord in target[ind]], dtype=np.int32)
+    return ret